@@ -0,0 +1,57 @@
+"""Benchmark: task archive appends and cross-meeting reports over millions of tasks.
+
+Run from the project folder:
+    python benchmarks/bench_analytics.py --tasks 1000000 --meetings 2000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from analytics import TaskArchive
+from generators import make_roster, make_tasks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Task archive benchmark")
+    parser.add_argument('--tasks', type=int, default=1_000_000)
+    parser.add_argument('--meetings', type=int, default=2000)
+    parser.add_argument('--members', type=int, default=200)
+    args = parser.parse_args()
+
+    roster = make_roster(args.members)
+    per_meeting = args.tasks // args.meetings
+    first_day = date(2025, 1, 6)
+
+    with tempfile.TemporaryDirectory() as folder:
+        archive = TaskArchive(folder)
+        start = time.perf_counter()
+        for batch in range(0, args.meetings, 100):
+            archive.add_meetings((f"meeting{index}.txt", first_day + timedelta(days=index // 4),
+                                  make_tasks(per_meeting, roster, seed=index, assigned_ratio=0.9))
+                                 for index in range(batch, min(batch + 100, args.meetings)))
+        print(f"Archived {archive.rows:,} tasks from {args.meetings:,} meetings in {time.perf_counter() - start:.1f}s")
+
+        start = time.perf_counter()
+        archive = TaskArchive(folder)
+        report = archive.report(as_of=first_day + timedelta(days=args.meetings // 4))
+        print(f"Cold open + full report: {(time.perf_counter() - start) * 1000:.0f} ms "
+              f"({len(report['workload'])} people, {len(report['priority_mix'])} weeks)")
+
+        start = time.perf_counter()
+        archive.report(start=first_day + timedelta(days=90), end=first_day + timedelta(days=180), period='month')
+        print(f"Warm quarter report: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        tasks = make_tasks(per_meeting, roster, seed=-1)
+        start = time.perf_counter()
+        archive.add_meeting("new_meeting.txt", first_day + timedelta(days=args.meetings // 4), tasks)
+        archive.report()
+        print(f"Append one meeting + report: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
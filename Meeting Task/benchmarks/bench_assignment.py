@@ -0,0 +1,76 @@
+"""Benchmark: indexed/vectorized TaskAssigner scoring vs. the per-member loop.
+
+Run from the project folder:
+    python benchmarks/bench_assignment.py --tasks 2000 --members 10,100,1000,5000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from task_assigner import TaskAssigner
+from utils import Task, TeamMember
+
+ROLES = ['Frontend Developer', 'Backend Engineer', 'UI/UX Designer', 'QA Engineer', 'DevOps Engineer', 'Data Analyst']
+SKILLS = ['React', 'JavaScript', 'UI bugs', 'frontend', 'Database', 'APIs', 'Performance optimization', 'backend',
+          'Figma', 'User flows', 'Mobile design', 'design', 'Testing', 'Automation', 'Quality assurance', 'QA',
+          'Kubernetes', 'CI pipelines', 'SQL', 'dashboards', 'payments', 'search', 'caching', 'security']
+TASKS = ["fix the {s} issue in the {t} page", "optimize {s} for the {t} service", "design {t} screens with {s}",
+         "write tests for the {t} {s}", "update {s} documentation before release", "review the {t} server logs"]
+TOPICS = ['login', 'payment', 'search', 'onboarding', 'profile', 'billing', 'api', 'mobile']
+
+
+def make_team(size, rng):
+    return [TeamMember(f"Member{i}", rng.choice(ROLES), rng.sample(SKILLS, rng.randint(2, 6))) for i in range(size)]
+
+
+def make_tasks(count, rng):
+    return [Task(i + 1, rng.choice(TASKS).format(s=rng.choice(SKILLS).lower(), t=rng.choice(TOPICS)))
+            for i in range(count)]
+
+
+def legacy_best(assigner, description):
+    """The original O(members x skills) loop"""
+    best_member, best_score = None, 0
+    for member in assigner.team_members:
+        score = assigner._calculate_match_score(description.lower(), member)
+        if score > best_score:
+            best_score, best_member = score, member.name
+    return best_member or "Unassigned"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TaskAssigner scoring benchmark")
+    parser.add_argument('--tasks', type=int, default=2000)
+    parser.add_argument('--members', default='10,100,1000,5000')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    for size in (int(s) for s in args.members.split(',')):
+        rng = random.Random(args.seed)
+        team = make_team(size, rng)
+        descriptions = [task.description for task in make_tasks(args.tasks, rng)]
+
+        start = time.perf_counter()
+        assigner = TaskAssigner(team)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        legacy = [legacy_best(assigner, d) for d in descriptions]
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        indexed = assigner._best_matches(descriptions)
+        indexed_time = time.perf_counter() - start
+
+        assert legacy == indexed, "indexed scoring disagrees with the legacy loop"
+        print(f"{args.tasks:,} tasks x {size:,} members: legacy {legacy_time:7.3f}s | "
+              f"indexed {indexed_time:7.3f}s (+{build:.3f}s index build) | "
+              f"{legacy_time / indexed_time:5.1f}x | identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Micro-benchmark: temp-WAV round-trip vs. in-memory PCM handoff to the recognizer.
+
+Measures only the handoff (decoded AudioSegment -> sr.AudioData); the network
+call itself is left out. Each method runs in a fresh forked process so its
+peak RSS is not hidden by the other one's high-water mark.
+
+Run from the project folder:
+    python benchmarks/bench_audio_handoff.py --minutes 30 --channels 2
+"""
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import speech_recognition as sr
+from pydub import AudioSegment
+
+from audio_processor import to_audio_data
+
+
+def write_pcm(path, minutes, channels, rate=16000):
+    """Noisy tone as raw 16-bit PCM, written a second at a time with NumPy"""
+    rng = np.random.default_rng(7)
+    frames = int(minutes * 60 * rate)
+    with open(path, 'wb') as f:
+        for start in range(0, frames, rate):
+            t = np.arange(start, min(start + rate, frames))
+            tone = np.repeat(np.sin(t * (2 * np.pi * 220 / rate)) * 8000, channels)
+            f.write((tone + rng.normal(0, 500, len(tone))).astype('<i2').tobytes())
+
+
+def load_audio(path, channels, rate=16000):
+    """One read = one PCM-sized buffer, so the RSS baseline is just the decoded audio"""
+    with open(path, 'rb') as f:
+        return AudioSegment(data=f.read(), sample_width=2, frame_rate=rate, channels=channels)
+
+
+def wav_round_trip(audio):
+    """The old path: export a temp WAV, read it back through sr.AudioFile"""
+    with tempfile.TemporaryDirectory() as folder:
+        wav_path = os.path.join(folder, "temp_audio.wav")
+        audio.export(wav_path, format="wav")
+        with sr.AudioFile(wav_path) as source:
+            return sr.Recognizer().record(source)
+
+
+METHODS = {'wav_round_trip': wav_round_trip, 'in_memory': to_audio_data}
+
+
+def measure(method, pcm_path, channels, results):
+    audio = load_audio(pcm_path, channels)
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    audio_data = METHODS[method](audio)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results.put((method, elapsed, (peak - baseline) / 1024, len(audio_data.frame_data)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--minutes', type=float, default=30)
+    parser.add_argument('--channels', type=int, choices=[1, 2], default=2)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context('fork')
+    results = context.Queue()
+    with tempfile.TemporaryDirectory() as folder:
+        pcm_path = os.path.join(folder, "meeting.pcm")
+        write_pcm(pcm_path, args.minutes, args.channels)
+        print(f"{args.minutes:g} min of {args.channels}-channel 16 kHz audio "
+              f"({os.path.getsize(pcm_path) / 2**20:.1f} MB decoded)")
+
+        for method in METHODS:
+            worker = context.Process(target=measure, args=(method, pcm_path, args.channels, results))
+            worker.start()
+            name, elapsed, extra_mb, size = results.get()
+            worker.join()
+            print(f"  {name:<15} {elapsed:7.3f}s  +{extra_mb:7.1f} MB peak RSS  ({size / 2**20:.1f} MB PCM out)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Micro-benchmark: compiled keyword matcher vs. per-keyword substring scans.
+
+Run from the project folder:
+    python benchmarks/bench_keyword_matcher.py --sentences 20000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deadlines import RELATIVE_DATES
+from task_extractor import TaskExtractor
+from utils import TeamMember
+
+TEMPLATES = [
+    "{name}, can you fix the {thing} bug before friday?",
+    "We need to optimize the {thing} queries, it's blocking the release.",
+    "Someone should design the new {thing} screens for the next sprint.",
+    "Let's write tests for the {thing} module by end of this week.",
+    "The {thing} dashboard looked fine in the demo yesterday.",
+    "{name} mentioned the {thing} numbers are trending up.",
+    "This is urgent, please deploy the {thing} hotfix tomorrow.",
+    "Maybe later we can review the {thing} backlog with {name}.",
+]
+THINGS = ['login', 'payment', 'search', 'onboarding', 'database', 'API', 'profile', 'billing']
+
+
+def make_sentences(count, team, seed=7):
+    rng = random.Random(seed)
+    return [rng.choice(TEMPLATES).format(name=rng.choice(team).name, thing=rng.choice(THINGS))
+            for _ in range(count)]
+
+
+def make_team(size):
+    return [TeamMember(f"Member{i:05d}", "Engineer", ["backend"]) for i in range(size - 4)] + [
+        TeamMember("Sakshi", "Frontend Developer", ["React"]),
+        TeamMember("Mohit", "Backend Engineer", ["Database"]),
+        TeamMember("Arjun", "UI/UX Designer", ["Figma"]),
+        TeamMember("Lata", "QA Engineer", ["Testing"]),
+    ]
+
+
+def legacy_classify(extractor, sentence, team):
+    """The original per-keyword `in sentence.lower()` scans, for comparison"""
+    if not any(keyword in sentence.lower() for keyword in extractor.action_keywords):
+        return None
+    priority = 'Medium'
+    for level, keywords in extractor.priority_keywords.items():
+        if any(keyword in sentence.lower() for keyword in keywords):
+            priority = level
+            break
+    phrases = [phrase for phrase in RELATIVE_DATES if phrase in sentence.lower()]
+    deadline = extractor.deadlines.dates[max(phrases, key=lambda phrase: (len(phrase), phrase))] if phrases else None
+    person = next((member.name for member in team if member.name.lower() in sentence.lower()), None)
+    return priority, deadline, person
+
+
+def compiled_classify(extractor, sentence, team):
+    found = extractor._scan(sentence, team)
+    if 'action' not in found:
+        return None
+    priority = next((level for level in extractor.priority_keywords if level in found.get('priority', ())), 'Medium')
+    deadline = extractor._extract_deadline(sentence, found)
+    person = extractor._extract_person(sentence, team, found)
+    return priority, deadline, person
+
+
+def bench(label, classify, extractor, sentences, team):
+    start = time.perf_counter()
+    results = [classify(extractor, sentence, team) for sentence in sentences]
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<10} {elapsed:8.3f}s  {len(sentences) / elapsed:>12,.0f} sentences/s")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keyword matcher micro-benchmark")
+    parser.add_argument('--sentences', type=int, default=20000)
+    parser.add_argument('--team-sizes', default='4,100,1000')
+    args = parser.parse_args()
+
+    extractor = TaskExtractor()
+    for size in (int(s) for s in args.team_sizes.split(',')):
+        team = make_team(max(size, 4))
+        sentences = make_sentences(args.sentences, team)
+        extractor._matcher(team)  # Compile outside the timed loop
+
+        print(f"\n{args.sentences:,} sentences, team of {len(team):,}")
+        legacy = bench('legacy', legacy_classify, extractor, sentences, team)
+        compiled = bench('compiled', compiled_classify, extractor, sentences, team)
+        assert legacy == compiled, "compiled matcher disagrees with legacy scans"
+        print("  results identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark: JSON roster parse-and-index vs. loading a roster store with saved indexes.
+
+Each run is a fresh process, as a CLI start would be. Run from the project folder:
+    python benchmarks/bench_roster.py --members 1000,50000
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from generators import make_roster
+from roster import RosterStore
+
+SRC = os.path.join(os.path.dirname(__file__), '..', 'src')
+
+# Load the team and everything extraction/assignment need for it, then report the seconds taken
+STARTUP = """
+import sys, time
+sys.path.insert(0, {src!r})
+start = time.perf_counter()
+from roster import open_team
+from task_assigner import TaskAssigner
+from task_extractor import TaskExtractor
+team, store = open_team({team!r})
+extractor = TaskExtractor()
+if store is None:
+    extractor._matcher(team)
+    TaskAssigner(team)
+else:
+    store.prime(extractor, team)
+    store.assigner(team)
+print(time.perf_counter() - start)
+"""
+
+
+def startup_seconds(team_file: str, repeat: int) -> float:
+    runs = [float(subprocess.run([sys.executable, '-c', STARTUP.format(src=SRC, team=team_file)],
+                                 capture_output=True, text=True, check=True).stdout)
+            for _ in range(repeat)]
+    return min(runs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Roster store benchmark")
+    parser.add_argument('--members', default='1000,50000')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        for size in (int(s) for s in args.members.split(',')):
+            team = make_roster(size)
+            json_file = os.path.join(folder, f"team{size}.json")
+            with open(json_file, 'w') as f:
+                json.dump({'team_members': [{'name': m.name, 'role': m.role, 'skills': m.skills,
+                                             'capacity': m.capacity} for m in team]}, f)
+            store_file = os.path.join(folder, f"team{size}.db")
+            store = RosterStore(store_file)
+            store.import_json(json_file)
+            store.build_indexes()
+            store.close()
+
+            parsed = startup_seconds(json_file, args.repeat)
+            loaded = startup_seconds(store_file, args.repeat)
+            print(f"{size:>7,} members  json {parsed:6.2f}s  store {loaded:6.2f}s  ({parsed / loaded:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
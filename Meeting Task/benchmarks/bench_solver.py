@@ -0,0 +1,77 @@
+"""Benchmark: greedy per-task assignment vs. the global min-cost-flow solver.
+
+Compares wall time and load balance. Run from the project folder:
+    python benchmarks/bench_solver.py --tasks 1000,5000 --members 50,500
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bench_assignment import make_team, make_tasks
+from task_assigner import TaskAssigner
+from utils import Task
+
+PRIORITIES = ['Critical', 'High', 'Medium', 'Medium', 'Low']
+
+
+def run(team, tasks, strategy):
+    tasks = [Task(task.id, task.description, priority=task.priority) for task in tasks]
+    assigner = TaskAssigner(team)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        assigner.assign_tasks(tasks, strategy=strategy)
+    elapsed = time.perf_counter() - start
+
+    loads = {member.name: 0 for member in team}
+    for task in tasks:
+        if task.assigned_to in loads:
+            loads[task.assigned_to] += 1
+    over = sum(1 for member in team if loads[member.name] > member.capacity)
+    names = [member.name for member in team]
+    scores = assigner.score_matrix([task.description for task in tasks])
+    matched = [scores[i, names.index(task.assigned_to)] for i, task in enumerate(tasks)
+               if task.assigned_to in loads]
+    return {
+        'seconds': elapsed,
+        'max_load': max(loads.values()),
+        'load_stdev': statistics.pstdev(loads.values()),
+        'over_capacity': over,
+        'unassigned': sum(1 for task in tasks if task.assigned_to == "Unassigned"),
+        'mean_score': statistics.mean(matched) if matched else 0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Greedy vs. balanced assignment benchmark")
+    parser.add_argument('--tasks', default='1000,5000')
+    parser.add_argument('--members', default='50,500')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    for member_count in (int(m) for m in args.members.split(',')):
+        for task_count in (int(t) for t in args.tasks.split(',')):
+            rng = random.Random(args.seed)
+            team = make_team(member_count, rng)
+            for member in team:
+                member.capacity = rng.randint(2, 2 * task_count // member_count + 2)
+            tasks = make_tasks(task_count, rng)
+            for task in tasks:
+                task.priority = rng.choice(PRIORITIES)
+
+            print(f"\n{task_count:,} tasks x {member_count:,} members")
+            for strategy in ['greedy', 'balanced']:
+                r = run(team, tasks, strategy)
+                print(f"  {strategy:<9} {r['seconds']:7.3f}s  max load {r['max_load']:4d}  "
+                      f"load stdev {r['load_stdev']:6.2f}  mean score {r['mean_score']:5.1f}  "
+                      f"over capacity {r['over_capacity']:3d}  unassigned {r['unassigned']}")
+
+
+if __name__ == "__main__":
+    main()
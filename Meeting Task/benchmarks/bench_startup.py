@@ -0,0 +1,100 @@
+"""Startup budget: import time of main.py (`python -X importtime`) for --help and a text run.
+
+Each case runs main.py in a fresh interpreter, parses the -X importtime log
+and sums the cumulative time of the imports made after interpreter startup
+(`site` and what it loads depend on the environment, not on this code).
+A case fails when it loads a module it must not (audio libraries on the text
+path, anything heavy for --help) or goes over its import-time budget; any
+failure gives exit status 1, so this can gate CI.
+
+Run from the project folder:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --budget-factor 2   # slow machines
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+MAIN = os.path.join(ROOT, 'src', 'main.py')
+TEAM = os.path.join(ROOT, 'data', 'team_members.json')
+TRANSCRIPT = os.path.join(ROOT, 'data', 'sample_transcript.txt')
+
+AUDIO_MODULES = ['speech_recognition', 'pydub', 'torch', 'whisper']
+# (arguments, modules that must not be imported, import-time budget in ms)
+CASES = {
+    'help': (['--help'], AUDIO_MODULES + ['nltk', 'numpy', 'pandas', 'multiprocessing'], 150),
+    'text': (['--audio', TRANSCRIPT, '--team', TEAM, '--format', 'json', '--no-cache'],
+             AUDIO_MODULES + ['pandas'], 750),
+}
+
+
+def parse_importtime(log: str):
+    """(every module imported, {top-level import after site: cumulative µs})"""
+    modules = set()
+    top_level_imports = {}
+    after_site = False
+    for line in log.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        top_level = not name[1:].startswith(' ')
+        name = name.strip()
+        modules.add(name)
+        if top_level:
+            if after_site:
+                top_level_imports[name] = int(cumulative)
+            after_site = after_site or name == 'site'
+    return modules, top_level_imports
+
+
+def run_case(arguments, folder):
+    start = time.perf_counter()
+    completed = subprocess.run([sys.executable, '-X', 'importtime', MAIN, *arguments,
+                                '--output', os.path.join(folder, 'out.json')],
+                               capture_output=True, text=True, cwd=folder)
+    wall = time.perf_counter() - start
+    if completed.returncode != 0:
+        raise RuntimeError(f"main.py {' '.join(arguments)} failed:\n{completed.stdout}{completed.stderr}")
+    modules, top_level_imports = parse_importtime(completed.stderr)
+    return modules, top_level_imports, wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per case (fastest is kept)')
+    parser.add_argument('--budget-factor', type=float, default=1.0, help='Scale every import-time budget')
+    parser.add_argument('--top', type=int, default=5, help='Slowest top-level imports to list per case')
+    args = parser.parse_args()
+
+    failures = []
+    with tempfile.TemporaryDirectory() as folder:
+        for case, (arguments, forbidden, budget) in CASES.items():
+            runs = [run_case(arguments, folder) for _ in range(args.repeat)]
+            modules, top_level_imports, wall = min(runs, key=lambda run: sum(run[1].values()))
+            import_ms = sum(top_level_imports.values()) / 1000
+            budget *= args.budget_factor
+            loaded = [module for module in forbidden if module in modules]
+            status = "ok" if import_ms <= budget and not loaded else "FAIL"
+            print(f"  {case:<6} imports {import_ms:7.1f} ms (budget {budget:.0f} ms)  "
+                  f"process {wall * 1000:7.1f} ms  {status}")
+
+            slowest = sorted(((us, name) for name, us in top_level_imports.items()), reverse=True)
+            for us, name in slowest[:args.top]:
+                print(f"      {name:<24} {us / 1000:7.1f} ms")
+            if loaded:
+                print(f"      must not import: {', '.join(loaded)}")
+                failures.append(f"{case}: imports {', '.join(loaded)}")
+            if import_ms > budget:
+                failures.append(f"{case}: {import_ms:.1f} ms > {budget:.0f} ms")
+
+    if failures:
+        print(f"{len(failures)} startup budget violation(s): {'; '.join(failures)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
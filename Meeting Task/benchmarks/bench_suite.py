@@ -0,0 +1,222 @@
+"""Benchmark suite: extraction, assignment and every output writer on synthetic meetings.
+
+Each case runs in a fresh forked process: the data is generated first, then
+the timed call runs alone, so its peak-RSS growth is its own. Results are
+written as JSON, and --compare flags throughput/memory regressions against a
+saved baseline (exit status 1), so two commits can be compared directly.
+
+Run from the project folder:
+    python benchmarks/bench_suite.py --scale default --output benchmarks/baselines/default.json
+    python benchmarks/bench_suite.py --scale default --compare benchmarks/baselines/default.json
+"""
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from generators import make_roster, make_tasks, make_transcript
+from output_generator import OutputGenerator, JsonLinesWriter, CsvStreamWriter
+from scheduler import Scheduler
+from task_assigner import TaskAssigner
+from task_extractor import TaskExtractor, sent_tokenize
+from utils import Task, TaskBatch
+
+# sentences: transcript sizes for extraction; members: roster sizes; tasks: list size for assign/output
+SCALES = {
+    'smoke': {'sentences': [1000], 'members': [10], 'tasks': [1000]},
+    'default': {'sentences': [1000, 100_000], 'members': [10, 1000], 'tasks': [20_000]},
+    'full': {'sentences': [1000, 100_000, 1_000_000], 'members': [10, 1000, 10_000], 'tasks': [20_000, 200_000]},
+}
+
+
+def _write_stream(writer_class, tasks, output_file):
+    with writer_class(output_file) as writer:
+        for task in tasks:
+            writer.write(task)
+
+
+def case_extract(sentences, members, **_):
+    roster = make_roster(members)
+    transcript = make_transcript(sentences, roster)
+    extractor = TaskExtractor()
+    sent_tokenize("Load NLTK now.")  # Imported on first use; keep that out of the timing
+    return sentences, 'sentences', lambda folder: extractor.extract_tasks(transcript, roster)
+
+
+def case_assign(tasks, members, **_):
+    roster = make_roster(members)
+    task_list = make_tasks(tasks, roster)
+    return tasks, 'tasks', lambda folder: TaskAssigner(roster).assign_tasks(task_list)
+
+
+def case_output(tasks, writer, **_):
+    task_list = make_tasks(tasks, make_roster(50))
+    writers = {
+        'json': lambda folder: OutputGenerator.generate_json(task_list, os.path.join(folder, 'out.json')),
+        'csv': lambda folder: OutputGenerator.generate_csv(task_list, os.path.join(folder, 'out.csv')),
+        'table': lambda folder: OutputGenerator.print_table(task_list),
+        'jsonl_stream': lambda folder: _write_stream(JsonLinesWriter, task_list, os.path.join(folder, 'out.jsonl')),
+        'csv_stream': lambda folder: _write_stream(CsvStreamWriter, task_list, os.path.join(folder, 'out.csv')),
+    }
+    return tasks, 'tasks', writers[writer]
+
+
+def case_model(tasks, layout, **_):
+    """Holding a task list: the old dicts vs. slotted Task objects vs. a columnar TaskBatch"""
+    task_list = make_tasks(tasks, make_roster(50))
+    # Strings are shared with task_list, so the growth is the per-task container overhead
+    layouts = {
+        'dicts': lambda folder: [task.to_dict() for task in task_list],
+        'tasks': lambda folder: [Task(task.id, task.description, task.assigned_to, task.priority, task.deadline,
+                                      task.dependencies, task.reason) for task in task_list],
+        'batch': lambda folder: TaskBatch(task_list),
+    }
+    return tasks, 'tasks', layouts[layout]
+
+
+def case_schedule(tasks, **_):
+    """Dependency order + critical-path dates (make_tasks links ~20% of tasks to an earlier one)"""
+    task_list = make_tasks(tasks, make_roster(50))
+    scheduler = Scheduler()
+    return tasks, 'tasks', lambda folder: scheduler.critical_path(task_list, scheduler.schedule(task_list))
+
+
+CASES = {'extract': case_extract, 'assign': case_assign, 'output': case_output, 'model': case_model,
+         'schedule': case_schedule}
+WRITERS = ['json', 'csv', 'table', 'jsonl_stream', 'csv_stream']
+LAYOUTS = ['dicts', 'tasks', 'batch']
+
+
+def plan(scale):
+    """(case id, case name, parameters) for every benchmark at this scale"""
+    sizes = SCALES[scale]
+    cases = []
+    # Extraction scales with transcript length (small roster) and with roster size (short transcript)
+    extract_sizes = [(sentences, sizes['members'][0]) for sentences in sizes['sentences']]
+    extract_sizes += [(sizes['sentences'][0], members) for members in sizes['members'][1:]]
+    for sentences, members in extract_sizes:
+        cases.append((f"extract/{sentences}s/{members}m", 'extract', {'sentences': sentences, 'members': members}))
+    for tasks in sizes['tasks']:
+        for members in sizes['members']:
+            cases.append((f"assign/{tasks}t/{members}m", 'assign', {'tasks': tasks, 'members': members}))
+        for writer in WRITERS:
+            cases.append((f"output_{writer}/{tasks}t", 'output', {'tasks': tasks, 'writer': writer}))
+        for layout in LAYOUTS:
+            cases.append((f"model_{layout}/{tasks}t", 'model', {'tasks': tasks, 'layout': layout}))
+        cases.append((f"schedule/{tasks}t", 'schedule', {'tasks': tasks}))
+    return cases
+
+
+def measure(name, params, repeat, results):
+    """Child process: build fresh data (untimed), then time the call; `repeat` times"""
+    walls, cpus = [], []
+    with tempfile.TemporaryDirectory() as folder, open(os.devnull, 'w') as devnull:
+        for attempt in range(repeat):
+            # Fresh inputs every run: assignment mutates its tasks, extractors cache matchers
+            items, unit, run = CASES[name](**params)
+            baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            with contextlib.redirect_stdout(devnull):  # Measure the library, not the terminal
+                wall, cpu = time.perf_counter(), time.process_time()
+                run(folder)
+                walls.append(time.perf_counter() - wall)
+                cpus.append(time.process_time() - cpu)
+            if attempt == 0:  # Later runs reuse freed pages, hiding growth
+                peak_growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline_rss
+    best = min(range(repeat), key=walls.__getitem__)
+    results.put({'items': items, 'unit': unit, 'wall_s': round(walls[best], 4), 'cpu_s': round(cpus[best], 4),
+                 'throughput': round(items / walls[best], 1),
+                 'peak_rss_growth_mb': round(peak_growth / 1024, 1)})
+
+
+def run_suite(scale, repeat, only=None):
+    context = multiprocessing.get_context('fork')
+    results = {}
+    for case_id, name, params in plan(scale):
+        if only and not case_id.startswith(only):
+            continue
+        queue = context.Queue()
+        worker = context.Process(target=measure, args=(name, params, repeat, queue))
+        worker.start()
+        result = queue.get()
+        worker.join()
+        results[case_id] = result
+        print(f"  {case_id:<28} {result['wall_s']:9.3f}s  {result['throughput']:>14,.0f} {result['unit']}/s  "
+              f"+{result['peak_rss_growth_mb']:7.1f} MB")
+    return results
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(results, baseline, tolerance):
+    """Print per-case changes; returns the ids that regressed beyond tolerance"""
+    regressions = []
+    print(f"\nvs. baseline {baseline['meta'].get('commit')} ({baseline['meta'].get('generated_at')}):")
+    for case_id, result in results.items():
+        old = baseline['results'].get(case_id)
+        if old is None:
+            print(f"  {case_id:<28} (new case)")
+            continue
+        speed = result['throughput'] / old['throughput'] - 1
+        memory = result['peak_rss_growth_mb'] - old['peak_rss_growth_mb']
+        # Small absolute memory changes are noise (allocator/page granularity)
+        slower = speed < -tolerance
+        bigger = memory > max(5.0, tolerance * old['peak_rss_growth_mb'])
+        flag = " REGRESSION" if slower or bigger else ""
+        print(f"  {case_id:<28} throughput {speed:+7.1%}  memory {memory:+7.1f} MB{flag}")
+        if flag:
+            regressions.append(case_id)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Meeting pipeline benchmark suite")
+    parser.add_argument('--scale', choices=sorted(SCALES), default='default')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per case (best is kept)')
+    parser.add_argument('--only', help='Run only cases whose id starts with this (e.g. "assign")')
+    parser.add_argument('--output', help='Save results as a JSON baseline')
+    parser.add_argument('--compare', help='Baseline JSON to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed throughput drop / memory growth')
+    args = parser.parse_args()
+
+    print(f"Benchmark suite ({args.scale} scale, best of {args.repeat})")
+    results = run_suite(args.scale, args.repeat, args.only)
+    report = {
+        'meta': {'generated_at': datetime.now().isoformat(timespec='seconds'), 'commit': _git_commit(),
+                 'scale': args.scale, 'repeat': args.repeat, 'python': platform.python_version(),
+                 'machine': platform.machine(), 'cpus': os.cpu_count()},
+        'results': results,
+    }
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Results saved: {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
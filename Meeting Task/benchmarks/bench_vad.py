@@ -0,0 +1,71 @@
+"""Benchmark: vectorized VAD vs. pydub's detect_nonsilent on a recording with dead air.
+
+The synthetic recording alternates tone "utterances" with stretches of quiet
+noise, about --silence of it non-speech. Both detectors must agree; the
+report shows their times and how much audio the recognizer no longer gets.
+
+Run from the project folder:
+    python benchmarks/bench_vad.py --minutes 5 --silence 0.4
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pydub import AudioSegment
+from pydub.silence import detect_nonsilent
+
+from vad import default_threshold, detect_speech, drop_silence
+
+
+def make_recording(minutes: float, silence: float, rate: int = 16000, seed: int = 7) -> AudioSegment:
+    """16-bit mono: tone bursts of 1-8 s, pauses sized so `silence` of the total is noise"""
+    rng = np.random.default_rng(seed)
+    parts = []
+    total = 0
+    while total < minutes * 60 * rate:
+        speech = int(rng.uniform(1, 8) * rate)
+        pause = int(speech * silence / (1 - silence) * rng.uniform(0.5, 1.5))
+        t = np.arange(speech) / rate
+        parts.append(0.3 * np.sin(2 * np.pi * rng.choice([180, 240, 320]) * t) * (1 + 0.3 * np.sin(7 * t)))
+        parts.append(rng.normal(0, 0.002, pause))
+        total += speech + pause
+    samples = (np.concatenate(parts) * 32767).astype('<i2')
+    return AudioSegment(data=samples.tobytes(), sample_width=2, frame_rate=rate, channels=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="VAD benchmark")
+    parser.add_argument('--minutes', type=float, default=5)
+    parser.add_argument('--silence', type=float, default=0.4, help='Share of the recording that is not speech')
+    parser.add_argument('--skip-pydub', action='store_true', help='Only time the vectorized detector')
+    args = parser.parse_args()
+
+    audio = make_recording(args.minutes, args.silence)
+    threshold = default_threshold(audio)
+
+    start = time.perf_counter()
+    speech = detect_speech(audio, 500, threshold)
+    vectorized = time.perf_counter() - start
+    print(f"Vectorized VAD: {vectorized * 1000:.0f} ms for {len(audio) / 60000:.1f} min ({len(speech)} speech runs)")
+
+    if not args.skip_pydub:
+        start = time.perf_counter()
+        reference = detect_nonsilent(audio, min_silence_len=500, silence_thresh=threshold)
+        loop = time.perf_counter() - start
+        print(f"pydub detect_nonsilent: {loop:.1f}s ({loop / vectorized:.0f}x slower, "
+              f"{'same' if reference == speech else 'DIFFERENT'} runs)")
+
+    start = time.perf_counter()
+    kept, timeline = drop_silence(audio)
+    print(f"Speech-only audio: {len(kept) / 1000:.0f}s of {len(audio) / 1000:.0f}s "
+          f"({timeline.skipped_ms / len(audio):.0%} never sent to the recognizer), "
+          f"built in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Synthetic, seeded meeting data for benchmarks: rosters, transcripts and task lists.
+
+Same seed -> same data, so numbers from different commits are comparable.
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils import Task, TeamMember
+
+FIRST_NAMES = ['Sakshi', 'Mohit', 'Arjun', 'Lata', 'Priya', 'Rahul', 'Anita', 'Vikram', 'Neha', 'Karan',
+               'Meera', 'Rohan', 'Divya', 'Sameer', 'Pooja', 'Aditya', 'Kavya', 'Nikhil', 'Isha', 'Tarun']
+ROLES = {
+    'Frontend Developer': ['React', 'JavaScript', 'UI bugs', 'frontend', 'CSS', 'accessibility'],
+    'Backend Engineer': ['Database', 'APIs', 'Performance optimization', 'backend', 'caching', 'SQL'],
+    'UI/UX Designer': ['Figma', 'User flows', 'Mobile design', 'design', 'onboarding', 'prototyping'],
+    'QA Engineer': ['Testing', 'Automation', 'Quality assurance', 'QA', 'regression', 'load testing'],
+    'DevOps Engineer': ['Kubernetes', 'CI pipelines', 'deployment', 'monitoring', 'security', 'infrastructure'],
+    'Data Analyst': ['dashboards', 'SQL', 'reporting', 'metrics', 'analytics', 'payments'],
+}
+TOPICS = ['login', 'payment', 'search', 'onboarding', 'profile', 'billing', 'API', 'mobile', 'database', 'checkout']
+TASK_TEMPLATES = [
+    "{name}, can you fix the {topic} bug before {day}?",
+    "We need to optimize the {topic} queries, it's blocking the release.",
+    "Someone should design the new {topic} screens for the next sprint.",
+    "Let's write tests for the {topic} module by end of this week.",
+    "This is urgent, please deploy the {topic} hotfix tomorrow.",
+    "{name} should update the {topic} documentation by {day} because the release depends on it.",
+    "Can someone review the {topic} server logs, it is a high priority issue?",
+    "We must implement {topic} caching next monday.",
+]
+CHATTER_TEMPLATES = [
+    "The {topic} dashboard looked fine in the demo yesterday.",
+    "{name} mentioned the {topic} numbers are trending up.",
+    "Thanks everyone for joining today.",
+    "I think the {topic} feedback from customers was mostly positive.",
+    "Let me share my screen for a second.",
+    "We discussed the {topic} roadmap last week with {name}.",
+]
+DAYS = ['Friday', 'Wednesday', 'Monday', 'tomorrow']
+PRIORITIES = ['Critical', 'High', 'Medium', 'Medium', 'Low']
+
+
+def make_roster(size: int, seed: int = 7):
+    """Team of `size` members with unique names (Sakshi, ..., Sakshi2, ...)"""
+    rng = random.Random(seed)
+    roles = list(ROLES)
+    team = []
+    for i in range(size):
+        base = FIRST_NAMES[i % len(FIRST_NAMES)]
+        name = base if i < len(FIRST_NAMES) else f"{base}{i // len(FIRST_NAMES) + 1}"
+        role = rng.choice(roles)
+        team.append(TeamMember(name, role, rng.sample(ROLES[role], rng.randint(2, 4))))
+    return team
+
+
+def iter_sentences(count: int, roster, seed: int = 7, task_ratio: float = 0.4):
+    """Yield `count` meeting sentences, about task_ratio of them actionable"""
+    rng = random.Random(seed)
+    names = [member.name for member in roster] or ['everyone']
+    for _ in range(count):
+        templates = TASK_TEMPLATES if rng.random() < task_ratio else CHATTER_TEMPLATES
+        yield rng.choice(templates).format(name=rng.choice(names), topic=rng.choice(TOPICS), day=rng.choice(DAYS))
+
+
+def make_transcript(sentences: int, roster, seed: int = 7, task_ratio: float = 0.4,
+                    sentences_per_paragraph: int = 6) -> str:
+    """One transcript string, sentences grouped into blank-line separated paragraphs"""
+    lines = []
+    paragraph = []
+    for sentence in iter_sentences(sentences, roster, seed, task_ratio):
+        paragraph.append(sentence)
+        if len(paragraph) == sentences_per_paragraph:
+            lines.append(" ".join(paragraph))
+            paragraph = []
+    if paragraph:
+        lines.append(" ".join(paragraph))
+    return "\n\n".join(lines) + "\n"
+
+
+def make_tasks(count: int, roster, seed: int = 7, assigned_ratio: float = 0.3):
+    """Fully populated tasks (as the extractor produces them), some pre-assigned"""
+    rng = random.Random(seed)
+    names = [member.name for member in roster]
+    tasks = []
+    for i in range(count):
+        template = rng.choice(TASK_TEMPLATES)
+        tasks.append(Task(
+            id=i + 1,
+            description=template.format(name=rng.choice(names or ['Someone']), topic=rng.choice(TOPICS),
+                                        day=rng.choice(DAYS)),
+            assigned_to=rng.choice(names) if names and rng.random() < assigned_ratio else None,
+            deadline=rng.choice([None, 'Friday', 'Tomorrow', 'Next Monday', 'Wednesday']),
+            priority=rng.choice(PRIORITIES),
+            dependencies=[rng.randint(1, i)] if i and rng.random() < 0.2 else [],
+            reason=rng.choice([None, 'blocking the release', 'affecting the user experience']),
+        ))
+    return tasks
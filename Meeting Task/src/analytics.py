@@ -0,0 +1,287 @@
+"""Task outputs from many meetings, archived column by column for workload analytics.
+
+generate_summary counts one meeting's tasks in memory. A task archive keeps
+every processed meeting's tasks as append-only NumPy columns on disk, so
+months of meetings can be grouped and counted with vectorized operations:
+tasks per person per week, overdue counts and the priority mix over time.
+
+    python src/main.py --batch meetings/ --team data/team_members.json --archive archive/
+    python src/analytics.py archive/ add batch_output/standup.json --meeting-date 2026-10-12
+    python src/analytics.py archive/ report --from 2026-09-01 --period month
+
+Layout: one raw column file per field (assignee, priority, deadline) plus
+meta.json with the meetings, their row counts and the value tables the
+integer codes point into. An append writes the new rows past the committed
+end of each column and then replaces meta.json, so an interrupted append
+leaves the archive as it was. One writer at a time.
+"""
+import json
+import os
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from deadlines import deadline_offset
+from transcript_cache import content_key
+from utils import Task
+
+ARCHIVE_FORMAT = 1
+
+# Field -> dtype of its column file. Assignees and priorities are codes into
+# the value tables in meta.json (0 = None); deadlines are days since 1970-01-01
+COLUMNS = {'assignee': np.int32, 'priority': np.int8, 'deadline': np.int32}
+
+# Deadline of a task that has none: later than any as-of day, so never overdue
+NO_DEADLINE = np.iinfo(np.int32).max
+
+_EPOCH = date(1970, 1, 1)
+
+
+def _day(value: date) -> int:
+    return (value - _EPOCH).days
+
+
+def _iso(day: int) -> str:
+    return (_EPOCH + timedelta(days=int(day))).isoformat()
+
+
+def _fields(task) -> Tuple:
+    """(assigned_to, priority, deadline) of a Task or an output task dict"""
+    if isinstance(task, Task):
+        return task.assigned_to, task.priority, task.deadline
+    return task.get('assigned_to'), task.get('priority', 'Medium'), task.get('deadline')
+
+
+class TaskArchive:
+    """Append-only columnar store of task outputs, queried with NumPy group-bys.
+
+    A meeting is identified by its name and date. Adding it again replaces
+    the earlier version in every query (the old rows stay on disk, masked
+    out); adding it again unchanged is a no-op, so re-running a batch does
+    not double count. Meeting-level values (date, period, whether it is the
+    live version) are computed once per meeting and spread over its rows
+    with np.repeat, so no per-row meeting column is stored.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.meta = self._read_meta()
+        self._cache = None
+
+    def _read_meta(self) -> Dict:
+        try:
+            with open(self.path / 'meta.json', 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            return {'format': ARCHIVE_FORMAT, 'rows': 0, 'meetings': [],
+                    'assignees': [None], 'priorities': [None]}
+        if meta.get('format') != ARCHIVE_FORMAT:
+            raise ValueError(f"{self.path}: unsupported task archive format {meta.get('format')!r}")
+        return meta
+
+    def _column_file(self, name: str) -> Path:
+        return self.path / f"{name}.{np.dtype(COLUMNS[name]).str.lstrip('<>|=')}"
+
+    @property
+    def rows(self) -> int:
+        return self.meta['rows']
+
+    # Appending
+
+    def add_meeting(self, name: str, meeting_date: date, tasks: Iterable) -> int:
+        """Archive one meeting's tasks; returns the rows written (0 when already archived)"""
+        return self.add_meetings([(name, meeting_date, tasks)])
+
+    def add_meetings(self, meetings: Iterable[Tuple[str, date, Iterable]]) -> int:
+        """Archive (name, meeting date, tasks) entries with one commit; returns the rows written"""
+        meta = self.meta
+        codes = {field: {value: code for code, value in enumerate(meta[field])}
+                 for field in ('assignees', 'priorities')}
+        latest = {(name, day): fingerprint for name, day, fingerprint, _ in meta['meetings']}
+
+        def code(field: str, value) -> int:
+            table = codes[field]
+            if value not in table:
+                table[value] = len(meta[field])
+                meta[field].append(value)
+            return table[value]
+
+        columns = {name: [] for name in COLUMNS}
+        added = []
+        for name, meeting_date, tasks in meetings:
+            fields = [_fields(task) for task in tasks]
+            fingerprint = content_key(*fields)
+            key = (name, meeting_date.isoformat())
+            if latest.get(key) == fingerprint:
+                continue
+            latest[key] = fingerprint
+            anchor = _day(meeting_date)
+            for assigned_to, priority, deadline in fields:
+                offset = deadline_offset(deadline, meeting_date)
+                columns['assignee'].append(code('assignees', assigned_to))
+                columns['priority'].append(code('priorities', priority))
+                columns['deadline'].append(NO_DEADLINE if offset is None else anchor + offset)
+            added.append([name, meeting_date.isoformat(), fingerprint, len(fields)])
+        if not added:
+            return 0
+
+        rows = len(columns['assignee'])
+        for name, dtype in COLUMNS.items():
+            with open(self._column_file(name), 'ab') as f:
+                f.truncate(meta['rows'] * np.dtype(dtype).itemsize)  # Drop rows of an interrupted append
+                f.write(np.asarray(columns[name], dtype=dtype).tobytes())
+        meta['meetings'].extend(added)
+        meta['rows'] += rows
+        temp_file = self.path / 'meta.json.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(temp_file, self.path / 'meta.json')
+        return rows
+
+    # Querying
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        """Committed columns plus the per-meeting arrays, read once per archive size"""
+        version = (self.rows, len(self.meta['meetings']))
+        if self._cache is None or self._cache['version'] != version:
+            arrays = {name: np.fromfile(self._column_file(name), dtype=dtype, count=self.rows)
+                      if self.rows else np.empty(0, dtype=dtype)
+                      for name, dtype in COLUMNS.items()}
+            meetings = self.meta['meetings']
+            arrays['sizes'] = np.array([count for *_, count in meetings], dtype=np.int64)
+            arrays['day'] = np.array([_day(date.fromisoformat(day)) for _, day, _, _ in meetings], dtype=np.int32)
+            live = {(name, day): index for index, (name, day, _, _) in enumerate(meetings)}  # Last version wins
+            arrays['live'] = np.zeros(len(meetings), dtype=bool)
+            arrays['live'][list(live.values())] = True
+            self._cache = {'version': version, **arrays}
+        return self._cache
+
+    def _select(self, start: date = None, end: date = None) -> Tuple[np.ndarray, np.ndarray]:
+        """(meeting mask, row mask) for live meetings held between start and end, inclusive"""
+        arrays = self._arrays()
+        meetings = arrays['live'].copy()
+        if start is not None:
+            meetings &= arrays['day'] >= _day(start)
+        if end is not None:
+            meetings &= arrays['day'] <= _day(end)
+        return meetings, np.repeat(meetings, arrays['sizes'])
+
+    def _periods(self, period: str) -> Tuple[List[str], np.ndarray]:
+        """(labels, per-row label index) bucketing each task by its meeting's week or month"""
+        arrays = self._arrays()
+        if period == 'week':
+            starts = arrays['day'] - (arrays['day'] + 3) % 7  # 1970-01-01 was a Thursday: back to Monday
+            values, inverse = np.unique(starts, return_inverse=True)
+            labels = [_iso(day) for day in values]
+        elif period == 'month':
+            months = arrays['day'].astype('datetime64[D]').astype('datetime64[M]')
+            values, inverse = np.unique(months, return_inverse=True)
+            labels = [str(month) for month in values]
+        else:
+            raise ValueError(f"period must be 'week' or 'month', not {period!r}")
+        return labels, np.repeat(inverse.astype(np.int64), arrays['sizes'])
+
+    @staticmethod
+    def _counts(codes: np.ndarray, values: List) -> Dict:
+        counts = np.bincount(codes, minlength=len(values))
+        return {values[code]: int(counts[code]) for code in np.flatnonzero(counts)}
+
+    @staticmethod
+    def _table(rows: np.ndarray, row_values: List, columns: np.ndarray, column_values: List) -> Dict:
+        """Nested {row value: {column value: count}} for two code arrays, zero cells left out"""
+        width = len(column_values)
+        counts = np.bincount(rows.astype(np.int64) * width + columns,
+                             minlength=len(row_values) * width).reshape(len(row_values), width)
+        table = {}
+        for row, column in zip(*np.nonzero(counts)):
+            table.setdefault(row_values[row], {})[column_values[column]] = int(counts[row, column])
+        return table
+
+    def summary(self, start: date = None, end: date = None) -> Dict:
+        """generate_summary's totals over every archived meeting in the date range"""
+        _, rows = self._select(start, end)
+        arrays = self._arrays()
+        return {
+            'total_tasks': int(rows.sum()),
+            'priorities': self._counts(arrays['priority'][rows], self.meta['priorities']),
+            'assignees': self._counts(arrays['assignee'][rows], self.meta['assignees'])
+        }
+
+    def workload(self, start: date = None, end: date = None, period: str = 'week') -> Dict:
+        """{assignee: {period start: tasks}} by the week (or month) of the meeting"""
+        _, rows = self._select(start, end)
+        labels, buckets = self._periods(period)
+        return self._table(self._arrays()['assignee'][rows], self.meta['assignees'], buckets[rows], labels)
+
+    def priority_mix(self, start: date = None, end: date = None, period: str = 'week') -> Dict:
+        """{period start: {priority: tasks}} by the week (or month) of the meeting"""
+        _, rows = self._select(start, end)
+        labels, buckets = self._periods(period)
+        return self._table(buckets[rows], labels, self._arrays()['priority'][rows], self.meta['priorities'])
+
+    def overdue(self, as_of: date = None, start: date = None, end: date = None) -> Dict:
+        """{assignee: tasks} whose deadline was before as_of (default today).
+
+        Outputs do not record completion, so this counts every task past
+        its deadline: the backlog of work that was due.
+        """
+        _, rows = self._select(start, end)
+        arrays = self._arrays()
+        rows &= arrays['deadline'] < _day(as_of or date.today())
+        return self._counts(arrays['assignee'][rows], self.meta['assignees'])
+
+    def report(self, start: date = None, end: date = None, as_of: date = None, period: str = 'week') -> Dict:
+        """Everything above in one document"""
+        meetings, _ = self._select(start, end)
+        return {
+            'meeting_count': int(meetings.sum()),
+            'from': start.isoformat() if start else None,
+            'to': end.isoformat() if end else None,
+            'as_of': (as_of or date.today()).isoformat(),
+            'summary': self.summary(start, end),
+            'workload': self.workload(start, end, period),
+            'overdue': self.overdue(as_of, start, end),
+            'priority_mix': self.priority_mix(start, end, period)
+        }
+
+
+if __name__ == "__main__":
+    import argparse
+    from datetime import datetime
+
+    parser = argparse.ArgumentParser(description="Archive meeting outputs and report workload across meetings")
+    parser.add_argument('archive', help='Archive folder')
+    commands = parser.add_subparsers(dest='command', required=True)
+    add = commands.add_parser('add', help='Archive output JSON files (one meeting each)')
+    add.add_argument('outputs', nargs='+')
+    add.add_argument('--meeting-date', type=date.fromisoformat, metavar='YYYY-MM-DD',
+                     help='Date of the meetings (default: when each output was generated)')
+    report = commands.add_parser('report', help='Workload, overdue and priority mix as JSON')
+    report.add_argument('--from', dest='start', type=date.fromisoformat, metavar='YYYY-MM-DD')
+    report.add_argument('--to', dest='end', type=date.fromisoformat, metavar='YYYY-MM-DD')
+    report.add_argument('--as-of', type=date.fromisoformat, metavar='YYYY-MM-DD', help='Day overdue counts from (default: today)')
+    report.add_argument('--period', choices=['week', 'month'], default='week')
+    report.add_argument('--output', help='Write the report here instead of printing it')
+    args = parser.parse_args()
+
+    archive = TaskArchive(args.archive)
+    if args.command == 'add':
+        entries = []
+        for output in args.outputs:
+            with open(output, 'r', encoding='utf-8') as f:
+                document = json.load(f)
+            meeting_date = args.meeting_date or datetime.fromisoformat(document['generated_at']).date()
+            entries.append((Path(output).name, meeting_date, document['tasks']))
+        print(f"[INFO] Archived {archive.add_meetings(entries)} tasks ({archive.rows} in {args.archive})")
+    else:
+        document = archive.report(args.start, args.end, args.as_of, args.period)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(document, f, indent=2, ensure_ascii=False)
+            print(f"[INFO] Report saved: {args.output} ({document['summary']['total_tasks']} tasks, "
+                  f"{document['meeting_count']} meetings)")
+        else:
+            print(json.dumps(document, indent=2, ensure_ascii=False))
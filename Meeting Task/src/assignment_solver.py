@@ -0,0 +1,242 @@
+import heapq
+from datetime import date
+from typing import List, Dict
+
+import numpy as np
+
+from deadlines import deadline_offset
+from task_assigner import MAX_SCORE
+from utils import Task
+
+# How much each priority level is worth when trading tasks off against each other
+PRIORITY_WEIGHTS = {'Critical': 4, 'High': 3, 'Medium': 2, 'Low': 1}
+
+# Cost of leaving a task unassigned (per unit of task weight); dwarfs any assignment cost
+UNASSIGNED_PENALTY = 10 ** 6
+
+
+def task_weight(task: Task, dependents: int = 0, today: date = None) -> int:
+    """Priority + deadline urgency + how many other tasks wait on this one"""
+    weight = PRIORITY_WEIGHTS.get(task.priority, 2)
+
+    days_left = deadline_offset(task.deadline, today or date.today())
+    if days_left is not None:
+        weight += 2 if days_left <= 1 else 1 if days_left <= 7 else 0
+    elif task.deadline:
+        weight += 1  # Deadline we cannot date: assume it is close
+
+    return weight + min(dependents, 3)
+
+
+class AssignmentSolver:
+    """Global min-cost-flow assignment of all unassigned tasks at once.
+
+    Network: task -> member (cost = weight x (100 - match score)), member -> sink
+    with convex load costs (the n-th task on a member costs load_penalty x n, up to
+    its capacity), and task -> sink (left unassigned, very expensive). Tasks are
+    added one at a time and routed along the shortest augmenting path, which may
+    move earlier tasks to other members. Every step keeps the flow min-cost.
+
+    Task potentials cancel out along "member -> held task -> other member" hops, so
+    Dijkstra runs over members only: each (from, to) member pair keeps a heap of
+    the tasks that could move between them, keyed by the cost change. A step costs
+    O(pairs + members log members) no matter how many tasks are already placed.
+    Only each task's top `candidates` members get edges.
+    """
+
+    def __init__(self, assigner, load_penalty: int = 10, candidates: int = 50, today: date = None):
+        self.assigner = assigner
+        self.load_penalty = load_penalty
+        self.candidates = candidates
+        self.today = today  # Deadline urgency counts from here (the meeting day)
+
+    def solve(self, tasks: List[Task]) -> Dict[int, str]:
+        """Map index in `tasks` -> assignee for every task without one"""
+        members = self.assigner.team_members
+        open_tasks = [i for i, task in enumerate(tasks) if not task.assigned_to]
+        if not open_tasks:
+            return {}
+
+        # Capacity and the load already taken by explicitly named tasks
+        member_index = {member.name: m for m, member in enumerate(members)}
+        capacity = [member.capacity if getattr(member, 'capacity', None) is not None else float('inf')
+                    for member in members]
+        load = [0] * len(members)
+        dependents = {}
+        for task in tasks:
+            if task.assigned_to in member_index:
+                load[member_index[task.assigned_to]] += 1
+            for dependency in task.dependencies:
+                dependents[dependency] = dependents.get(dependency, 0) + 1
+
+        open_rows = [tasks[i] for i in open_tasks]
+        weights = [task_weight(task, dependents.get(task.id, 0), self.today) for task in open_rows]
+        costs = self._candidate_costs([task.description for task in open_rows], weights)
+
+        # Heaviest tasks first: same optimum, but fewer tasks get shuffled later
+        order = sorted(range(len(open_tasks)), key=lambda t: -weights[t])
+        assigned = self._route(order, costs, weights, capacity, load)
+
+        return {open_tasks[t]: (members[m].name if m is not None else "Unassigned")
+                for t, m in enumerate(assigned)}
+
+    def _candidate_costs(self, descriptions: List[str], weights: List[int]) -> List[Dict[int, int]]:
+        """Per task: {member index: cost} for its best-scoring members (score > 0)"""
+        member_count = len(self.assigner.team_members)
+        k = min(self.candidates, member_count)
+        if k == 0:
+            return [{} for _ in descriptions]
+
+        costs = []
+        batch_size = max(1, 2_000_000 // member_count)
+        for start in range(0, len(descriptions), batch_size):
+            scores = self.assigner.score_matrix(descriptions[start:start + batch_size])
+            if k < member_count:
+                top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            else:
+                top = np.tile(np.arange(member_count), (len(scores), 1))
+            for row, members in enumerate(top):
+                weight = weights[start + row]
+                costs.append({int(m): weight * (MAX_SCORE - int(scores[row, m]))
+                              for m in members if scores[row, m] > 0})
+        return costs
+
+    def _route(self, order, costs, weights, capacity, load) -> List:
+        """Successive shortest augmenting paths; returns member index (or None) per task"""
+        member_count = len(capacity)
+        sink = member_count
+        unassigned = [weight * UNASSIGNED_PENALTY for weight in weights]
+        load = list(load)
+
+        assignment = [None] * len(costs)  # member index, or None when unassigned
+        moves = {}                        # (from, to) -> heap of (cost change, task) held by `from`
+        drops = [[] for _ in range(member_count)]  # heap of (cost of dropping, task)
+        # Cached cheapest edges (heap tops) so the search never touches the heaps
+        best_move = [{} for _ in range(member_count)]  # from -> {to: (cost change, task)}
+        exit_edge = [None] * member_count              # cheapest member -> sink: (cost, dropped task or None)
+        potential = [0] * (member_count + 1)
+
+        def cheapest(heap, m):
+            # Lazy deletion: skip tasks that have since moved off member m
+            while heap and assignment[heap[0][1]] != m:
+                heapq.heappop(heap)
+            return heap[0] if heap else None
+
+        def refresh_exit(m):
+            """Take one more task, or drop one it holds, whichever is cheaper"""
+            options = []
+            if load[m] < capacity[m]:
+                options.append((self.load_penalty * load[m], None))
+            top = cheapest(drops[m], m)
+            if top is not None:
+                options.append(top)
+            exit_edge[m] = min(options, key=lambda option: option[0]) if options else None
+
+        def unplace(task):
+            m = assignment[task]
+            assignment[task] = None
+            if m is None:
+                return
+            for other in costs[task]:
+                if best_move[m].get(other, (None, None))[1] == task:
+                    top = cheapest(moves[(m, other)], m)
+                    if top is None:
+                        del best_move[m][other]
+                    else:
+                        best_move[m][other] = top
+            refresh_exit(m)
+
+        def place(task, m):
+            unplace(task)
+            assignment[task] = m
+            for other, cost in costs[task].items():
+                if other != m:
+                    entry = (cost - costs[task][m], task)
+                    heapq.heappush(moves.setdefault((m, other), []), entry)
+                    if other not in best_move[m] or entry < best_move[m][other]:
+                        best_move[m][other] = entry
+            heapq.heappush(drops[m], (unassigned[task] - costs[task][m], task))
+            refresh_exit(m)
+
+        def sink_reduced_cost(m):
+            edge = exit_edge[m]
+            return edge[0] + potential[m] - potential[sink] if edge else float('inf')
+
+        for m in range(member_count):
+            refresh_exit(m)
+        # Lower bound on the last hop of any path (reduced costs only grow between full searches)
+        min_sink_cost = 0
+
+        for new_task in order:
+            # Multi-source start: the new task can go to any candidate or straight to the sink
+            dist = {m: cost - potential[m] for m, cost in costs[new_task].items()}
+            dist[sink] = unassigned[new_task] - potential[sink]
+
+            # Fast path: the new task's cheapest member also has the cheapest way out, so no
+            # longer path can beat "place it there" and existing reduced costs stay valid
+            nearest = min((d for node, d in dist.items() if node != sink), default=float('inf'))
+            if dist[sink] <= nearest + min_sink_cost:
+                continue  # Straight to the sink: stays unassigned
+            direct = next((m for m, d in dist.items() if m != sink and d == nearest
+                           and sink_reduced_cost(m) <= min_sink_cost
+                           and nearest + sink_reduced_cost(m) <= dist[sink]), None)
+            if direct is not None:
+                previous = {sink: (direct, exit_edge[direct][1]), direct: (None, new_task)}
+            else:
+                previous = self._search(new_task, dist, sink, potential, best_move, exit_edge)
+                min_sink_cost = None  # Potentials moved; recompute below
+
+            # Walk the path back from the sink, moving each task one hop forward
+            source, task = previous[sink]
+            if source is not None and task is not None:
+                unplace(task)             # Dropped to make room
+            elif source is not None:
+                load[source] += 1         # Member takes one more task
+                refresh_exit(source)
+            while source is not None:
+                node = source
+                source, task = previous[node]
+                place(task, node)
+
+            if min_sink_cost is None:
+                min_sink_cost = min((sink_reduced_cost(m) for m in range(member_count)), default=0)
+
+        return assignment
+
+    @staticmethod
+    def _search(new_task, dist, sink, potential, best_move, exit_edge) -> Dict:
+        """Dijkstra over members on reduced costs; updates potentials, returns the path links"""
+        previous = {node: (None, new_task) for node in dist}
+        # (distance, is_member, node): on ties the sink pops first, ending the search early
+        heap = [(d, node != sink, node) for node, d in dist.items()]
+        heapq.heapify(heap)
+        finished = {}
+
+        while heap:
+            d, _, node = heapq.heappop(heap)
+            if node in finished:
+                continue
+            finished[node] = d
+            if node == sink:
+                break
+
+            base = d + potential[node]
+            for target, (cost, task) in best_move[node].items():
+                candidate = base + cost - potential[target]
+                if candidate < dist.get(target, float('inf')) and target not in finished:
+                    dist[target] = candidate
+                    previous[target] = (node, task)
+                    heapq.heappush(heap, (candidate, True, target))
+            if exit_edge[node] is not None:
+                cost, task = exit_edge[node]
+                candidate = base + cost - potential[sink]
+                if candidate < dist[sink]:
+                    dist[sink] = candidate
+                    previous[sink] = (node, task)
+                    heapq.heappush(heap, (candidate, False, sink))
+
+        # Keep reduced costs non-negative: pi += min(dist, dist to sink)
+        reach = finished[sink]
+        for node in range(len(potential)):
+            potential[node] += min(finished.get(node, reach), reach)
+        return previous
@@ -1,36 +1,592 @@
-import speech_recognition as sr
+from __future__ import annotations
+
 import os
-from pydub import AudioSegment
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, List, Dict, Tuple
 
-class AudioProcessor:
-    def __init__(self):
+from profiling import count, stage
+from transcript_cache import content_key, file_digest
+
+# speech_recognition, pydub, NumPy and the worker pools are imported where audio
+# is actually handled, so text transcripts and --help never pay for loading them
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    import numpy as np
+    import speech_recognition as sr
+    from pydub import AudioSegment
+
+
+def to_audio_data(audio: AudioSegment) -> sr.AudioData:
+    """Hand decoded PCM to SpeechRecognition in memory, without a WAV round-trip.
+
+    pydub already holds signed little-endian samples, the layout sr.AudioData
+    expects, so mono audio is passed by reference (no copy). Stereo is downmixed
+    in a single audioop pass; the recognizer converts rate/width itself.
+    """
+    import speech_recognition as sr
+
+    audio = audio.set_channels(1)  # Returns `audio` itself when already mono
+    return sr.AudioData(audio.raw_data, audio.frame_rate, audio.sample_width)
+
+
+class GoogleBackend:
+    """Google Speech Recognition (FREE, needs network)"""
+    name = 'google'
+
+    def __init__(self, language='en-US'):
+        import speech_recognition as sr
+
+        self.language = language
         self.recognizer = sr.Recognizer()
-    
-    def get_transcript_text(self, audio_file_path):
-        """Convert MP3/WAV/M4A to text using Google Speech Recognition"""
+
+    @property
+    def cache_key(self) -> str:
+        return f"{self.name}:{self.language}"
+
+    def transcribe(self, audio: AudioSegment) -> str:
+        """Transcribe one chunk straight from its PCM bytes"""
+        import speech_recognition as sr
+
+        try:
+            return self.recognizer.recognize_google(to_audio_data(audio), language=self.language)
+        except sr.UnknownValueError:
+            return ""  # Chunk had no recognizable speech
+
+
+class StubBackend:
+    """Offline stand-in recognizer (deterministic, for tests and dry runs)"""
+    name = 'stub'
+
+    def __init__(self, text=None):
+        self.text = text
+
+    @property
+    def cache_key(self) -> str:
+        return f"{self.name}:{self.text!r}"
+
+    def transcribe(self, audio: AudioSegment) -> str:
+        if self.text is not None:
+            return self.text
+        return f"[speech {len(audio) / 1000:.1f}s]"
+
+
+# Local (offline) speech models work on 16 kHz mono float samples
+MODEL_SAMPLE_RATE = 16000
+
+
+def to_float_samples(audio: AudioSegment) -> np.ndarray:
+    """Resample/downmix to 16 kHz mono and scale to float32 in [-1, 1)"""
+    import numpy as np
+
+    audio = audio.set_frame_rate(MODEL_SAMPLE_RATE).set_channels(1).set_sample_width(2)
+    return np.frombuffer(audio.raw_data, dtype='<i2').astype(np.float32) / 32768
+
+
+class StubSpeechModel:
+    """Tiny deterministic stand-in for a local model (tests and dry runs, no weights)"""
+
+    def __init__(self, threads=None, language='en'):
+        self.batches = []  # Batch sizes seen, so tests can check batching
+
+    def transcribe_batch(self, samples: List[np.ndarray]) -> List[str]:
+        self.batches.append(len(samples))
+        return [f"[speech {len(s) / MODEL_SAMPLE_RATE:.1f}s]" for s in samples]
+
+
+class WhisperModel:
+    """openai-whisper on CPU, decoding a batch of <=30 s chunks in one forward pass"""
+
+    def __init__(self, name='base', threads=None, language='en'):
+        import torch
+        import whisper  # Heavy import: only when a local model is actually used
+
+        if threads:
+            torch.set_num_threads(threads)
+        self._torch = torch
+        self._whisper = whisper
+        self.model = whisper.load_model(name, device='cpu')
+        self.options = whisper.DecodingOptions(language=language, fp16=False, without_timestamps=True)
+
+    def transcribe_batch(self, samples: List[np.ndarray]) -> List[str]:
+        whisper = self._whisper
+        mels = self._torch.stack([
+            whisper.log_mel_spectrogram(whisper.pad_or_trim(self._torch.from_numpy(s)),
+                                        n_mels=self.model.dims.n_mels)
+            for s in samples])
+        with self._torch.no_grad():
+            results = whisper.decode(self.model, mels.to(self.model.device), self.options)
+        return [result.text for result in results]
+
+
+LOCAL_MODELS = {
+    'stub': StubSpeechModel,
+}
+
+
+class LocalBackend:
+    """Offline recognizer: a local model (Whisper by default) loaded once, run in batches"""
+    name = 'local'
+
+    def __init__(self, model='base', threads=None, language='en', batch_size=8):
+        self.model_name = model
+        self.language = language
+        self.batch_size = batch_size
+        model_class = LOCAL_MODELS.get(model)
+        if model_class is not None:
+            self.model = model_class(threads=threads, language=language)
+        else:
+            self.model = WhisperModel(model, threads=threads, language=language)
+
+    @property
+    def cache_key(self) -> str:
+        return f"{self.name}:{self.model_name}:{self.language}"
+
+    def transcribe(self, audio: AudioSegment) -> str:
+        return self.transcribe_batch([audio])[0]
+
+    def transcribe_batch(self, chunks: List[AudioSegment]) -> List[str]:
+        """Transcribe several chunks per model call"""
+        texts = []
+        for start in range(0, len(chunks), self.batch_size):
+            texts.extend(self.model.transcribe_batch(
+                [to_float_samples(chunk) for chunk in chunks[start:start + self.batch_size]]))
+        return texts
+
+
+def _serve_backend(connection, backend_name: str, options: Dict):
+    """ModelWorker process: build the backend once, then answer batches until told to stop"""
+    from pydub import AudioSegment
+
+    try:
+        backend = get_backend(backend_name, **options)
+    except Exception as e:
+        connection.send(('error', f"{type(e).__name__}: {e}"))
+        return
+    connection.send(('ready', (backend.name, getattr(backend, 'cache_key', backend.name))))
+
+    while True:
+        request = connection.recv()
+        if request is None:
+            break
+        try:
+            chunks = [AudioSegment(data=data, sample_width=width, frame_rate=rate, channels=channels)
+                      for data, width, rate, channels in request]
+            connection.send(('ok', _transcribe_batch(backend, chunks)))
+        except Exception as e:
+            connection.send(('error', f"{type(e).__name__}: {e}"))
+
+
+class ModelWorker:
+    """Long-lived process holding a loaded backend, serving many files.
+
+    The model loads in the background as soon as the worker is created, so it
+    overlaps with decoding the first file. Requests from several threads are
+    serialized over one pipe; each request is a whole batch of chunks.
+    """
+
+    def __init__(self, backend='local', **options):
+        import multiprocessing
+
+        self.batch_size = options.get('batch_size', 8)
+        # spawn, not fork: torch thread pools do not survive a fork
+        context = multiprocessing.get_context('spawn')
+        self._connection, child = context.Pipe()
+        self._process = context.Process(target=_serve_backend, args=(child, backend, options), daemon=True)
+        self._process.start()
+        self._lock = threading.Lock()
+        self._info = None
+
+    def _ready(self):
+        """Wait for the model to finish loading (once)"""
+        with self._lock:
+            if self._info is None:
+                status, info = self._connection.recv()
+                if status != 'ready':
+                    raise RuntimeError(f"Model worker failed to start: {info}")
+                self._info = info
+        return self._info
+
+    @property
+    def name(self) -> str:
+        return self._ready()[0]
+
+    @property
+    def cache_key(self) -> str:
+        return self._ready()[1]
+
+    def transcribe(self, audio: AudioSegment) -> str:
+        return self.transcribe_batch([audio])[0]
+
+    def transcribe_batch(self, chunks: List[AudioSegment]) -> List[str]:
+        self._ready()
+        request = [(chunk.raw_data, chunk.sample_width, chunk.frame_rate, chunk.channels) for chunk in chunks]
+        with self._lock:
+            self._connection.send(request)
+            status, result = self._connection.recv()
+        if status != 'ok':
+            raise RuntimeError(result)
+        return result
+
+    def close(self):
+        if self._process.is_alive():
+            self._connection.send(None)
+            self._process.join(timeout=5)
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+AUDIO_EXTENSIONS = {'.wav', '.mp3', '.m4a', '.flac', '.ogg', '.aac', '.wma', '.mp4', '.webm'}
+
+BACKENDS = {
+    'google': GoogleBackend,
+    'stub': StubBackend,
+    'local': LocalBackend,
+}
+
+
+def get_backend(name: str, **options):
+    """Create a recognizer backend by name"""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown recognizer backend: {name} (choose from {', '.join(BACKENDS)})")
+    return BACKENDS[name](**options)
+
+
+def split_on_silence_bounded(audio: AudioSegment, max_chunk_ms: int = 30000,
+                             min_silence_len: int = 500, silence_thresh: float = None,
+                             keep_silence: int = 200, merge: bool = True) -> List[Tuple[int, int]]:
+    """Split audio at silence into (start_ms, end_ms) chunks no longer than max_chunk_ms.
+
+    Short speech runs are merged up to the bound unless merge=False (one chunk per run).
+    """
+    from vad import default_threshold, detect_speech
+
+    if len(audio) == 0:
+        return []
+    if silence_thresh is None:
+        silence_thresh = default_threshold(audio)  # 16 dB below average loudness works well for speech
+
+    with stage('vad'):
+        speech = detect_speech(audio, min_silence_len=min_silence_len, silence_thresh=silence_thresh)
+
+    chunks = []
+    for start, end in speech:
+        start = max(0, start - keep_silence)
+        end = min(len(audio), end + keep_silence)
+
+        # Merge into the previous chunk while it stays under the bound
+        if merge and chunks and end - chunks[-1][0] <= max_chunk_ms:
+            chunks[-1] = (chunks[-1][0], end)
+            continue
+        if chunks:
+            start = max(start, chunks[-1][1])  # Padding must not overlap the previous chunk
+
+        # Hard-split speech runs longer than the bound
+        while end - start > max_chunk_ms:
+            chunks.append((start, start + max_chunk_ms))
+            start += max_chunk_ms
+        chunks.append((start, end))
+
+    return chunks
+
+
+def pack_speech_runs(runs: List[Tuple[int, int]], max_chunk_ms: int = 30000) -> List[List[Tuple[int, int]]]:
+    """Consecutive speech runs grouped into chunks of at most max_chunk_ms of speech.
+
+    The silence between a chunk's runs is not part of the chunk (see vad.join_ranges).
+    """
+    chunks, speech_ms = [], 0
+    for start, end in runs:
+        if chunks and speech_ms + end - start <= max_chunk_ms:
+            chunks[-1].append((start, end))
+            speech_ms += end - start
+        else:
+            chunks.append([(start, end)])
+            speech_ms = end - start
+    return chunks
+
+
+def split_speaker_turns(audio: AudioSegment, max_chunk_ms: int = 30000, min_silence_len: int = 500,
+                        speakers: int = None) -> List[Tuple[List[Tuple[int, int]], str]]:
+    """(speech runs, speaker) turns: runs labelled by voice, same-speaker runs merged up to the bound.
+
+    Chunks never span a speaker change, so each transcribed segment has one speaker.
+    """
+    from diarization import label_turns
+
+    runs = split_on_silence_bounded(audio, max_chunk_ms=max_chunk_ms, min_silence_len=min_silence_len, merge=False)
+    with stage('diarize'):
+        labels = label_turns([to_float_samples(audio[start:end]) for start, end in runs], speakers=speakers)
+    count('speakers', len(set(labels)))
+
+    turns = []
+    for (start, end), speaker in zip(runs, labels):
+        if turns and turns[-1][1] == speaker and end - turns[-1][0][0][0] <= max_chunk_ms:
+            turns[-1][0].append((start, end))
+        else:
+            turns.append(([(start, end)], speaker))
+    return turns
+
+
+def report_skipped_silence(original_ms: int, kept_ms: int, recognition_seconds: float):
+    """Print and count how much audio VAD kept from the recognizer and the recognition time that saved.
+
+    Recognition time grows with the audio it is given, so the saving is
+    estimated from the time the kept speech took.
+    """
+    skipped_ms = original_ms - kept_ms
+    saved = recognition_seconds * skipped_ms / kept_ms if kept_ms else 0.0
+    count('speech_seconds', round(kept_ms / 1000, 1))
+    count('silence_skipped_seconds', round(skipped_ms / 1000, 1))
+    count('recognition_seconds_saved', round(saved, 2))
+    share = skipped_ms / original_ms if original_ms else 0.0
+    print(f"[INFO]  VAD: recognized {kept_ms / 1000:.1f}s of {original_ms / 1000:.1f}s "
+          f"({share:.0%} silence skipped, ~{saved:.1f}s of recognition saved)")
+
+
+def _transcribe_chunk(backend, chunk: AudioSegment) -> str:
+    """Pool entry point (module level so process pools can pickle it)"""
+    return backend.transcribe(chunk)
+
+
+def _transcribe_batch(backend, chunks: List[AudioSegment]) -> List[str]:
+    """Batched pool entry point; backends without transcribe_batch go chunk by chunk"""
+    if hasattr(backend, 'transcribe_batch'):
+        return backend.transcribe_batch(chunks)
+    return [backend.transcribe(chunk) for chunk in chunks]
+
+
+class AudioProcessor:
+    def __init__(self, backend=None, max_chunk_ms=30000, min_silence_len=500,
+                 workers=4, executor='thread', cache=None, diarize=False, speakers=None, vad=True):
+        self.backend = backend or GoogleBackend()
+        self.max_chunk_ms = max_chunk_ms
+        self.min_silence_len = min_silence_len
+        self.workers = workers
+        self.executor = executor
+        self.cache = cache  # Optional TranscriptCache
+        self.diarize = diarize  # Label chunked segments with "Speaker N" (speakers=None: estimate the count)
+        self.speakers = speakers
+        self.vad = vad  # Drop non-speech before recognition (chunks hold only their speech runs)
+
+    def _backend_key(self) -> str:
+        return getattr(self.backend, 'cache_key', self.backend.name)
+
+    def _file_key(self, audio_file_path, mode: str) -> str:
+        """Whole-recording key: audio bytes + everything that changes the transcript"""
+        vad = ('vad', self.min_silence_len) if self.vad else ()
+        if mode == 'text':
+            return content_key(file_digest(audio_file_path), mode, self._backend_key(), *vad)
+        diarize = ('diarize', self.speakers) if self.diarize else ()
+        return content_key(file_digest(audio_file_path), mode, self._backend_key(),
+                           self.max_chunk_ms, self.min_silence_len, *diarize, *vad)
+
+    def _chunk_key(self, chunk: AudioSegment) -> str:
+        """Per-chunk key, so a re-cut recording only re-transcribes chunks that changed"""
+        return content_key(chunk.raw_data, chunk.frame_rate, chunk.sample_width,
+                           chunk.channels, self._backend_key())
+
+    def get_transcript_text(self, audio_file_path, chunked=False):
+        """Convert MP3/WAV/M4A to text with the processor's backend (whole recording, or chunked)"""
+        if chunked:
+            segments = self.get_transcript_segments(audio_file_path)
+            if self.diarize:
+                # One "Speaker N: ..." line per turn, the layout TaskExtractor reads speakers from
+                return "\n".join(f"{seg['speaker']}: {seg['text']}" for seg in segments if seg['text'])
+            return " ".join(seg['text'] for seg in segments if seg['text'])
+
         if not os.path.exists(audio_file_path):
             raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
-        
+
         print(f"[INFO] Processing audio: {os.path.basename(audio_file_path)}")
-        
-        # Convert to WAV (SpeechRecognition only supports WAV)
-        audio = AudioSegment.from_file(audio_file_path)
-        wav_path = "temp_audio.wav"
-        audio.export(wav_path, format="wav")
-        
-        # Transcribe using Google STT (FREE)
-        print("[INFO] Transcribing with Google Speech Recognition...")
-        with sr.AudioFile(wav_path) as source:
-            # Adjust for ambient noise
-            self.recognizer.adjust_for_ambient_noise(source)
-            audio_data = self.recognizer.record(source)
-            text = self.recognizer.recognize_google(audio_data)
-        
-        # Cleanup
-        os.remove(wav_path)
+
+        key = self._file_key(audio_file_path, 'text') if self.cache else None
+        if key:
+            text = self.cache.get(key)
+            if text is not None:
+                print(f"[INFO]  Transcript cache hit ({len(text)} characters)")
+                return text
+
+        # Decoded PCM goes straight to the recognizer: no temp WAV to write and read back
+        from pydub import AudioSegment
+
+        with stage('decode'):
+            audio = AudioSegment.from_file(audio_file_path)
+        count('audio_seconds', round(len(audio) / 1000, 1))
+
+        timeline = None
+        if self.vad:
+            with stage('vad'):
+                audio, timeline = self.drop_silence(audio)
+
+        print(f"[INFO] Transcribing with {self.backend.name}...")
+        start = time.perf_counter()
+        text = self.backend.transcribe(audio)
         print(f"[INFO]  Transcription complete! ({len(text)} characters)")
+        if timeline is not None:
+            report_skipped_silence(timeline.original_ms, timeline.kept_ms, time.perf_counter() - start)
+        if key:
+            self.cache.put(key, text)
         return text
 
+    def drop_silence(self, audio: AudioSegment):
+        """(speech-only audio, TimestampMap back to the recording) for the single-shot path"""
+        from vad import drop_silence
+
+        return drop_silence(audio, min_silence_len=self.min_silence_len)
+
+    def get_transcript_segments(self, audio_file_path) -> List[Dict]:
+        """Transcribe audio in silence-bounded chunks, returning timestamped segments"""
+        if not os.path.exists(audio_file_path):
+            raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
+
+        segments = list(self.iter_transcript_segments(audio_file_path))
+
+        characters = sum(len(seg['text']) for seg in segments)
+        print(f"[INFO]  Transcription complete! ({characters} characters)")
+        return segments
+
+    def iter_transcript_segments(self, audio_file_path):
+        """Yield timestamped segments in order while later chunks are still transcribing"""
+        if not os.path.exists(audio_file_path):
+            raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
+
+        print(f"[INFO] Processing audio: {os.path.basename(audio_file_path)}")
+
+        key = self._file_key(audio_file_path, 'segments') if self.cache else None
+        if key:
+            segments = self.cache.get(key)
+            if segments is not None:
+                print(f"[INFO]  Transcript cache hit ({len(segments)} segments)")
+                yield from segments
+                return
+
+        from pydub import AudioSegment
+
+        with stage('decode'):
+            audio = AudioSegment.from_file(audio_file_path)
+        count('audio_seconds', round(len(audio) / 1000, 1))
+        segments = []
+        for segment in self.iter_segments(audio):
+            segments.append(segment)
+            yield segment
+
+        # Never pin a failed chunk in the cache; its per-chunk entries still help the retry
+        if key and not any('error' in segment for segment in segments):
+            self.cache.put(key, segments)
+
+    def transcribe_segments(self, audio: AudioSegment) -> List[Dict]:
+        """Split decoded audio at silence and transcribe chunks in parallel"""
+        segments = list(self.iter_segments(audio))
+
+        characters = sum(len(seg['text']) for seg in segments)
+        print(f"[INFO]  Transcription complete! ({characters} characters)")
+        return segments
+
+    def iter_segments(self, audio: AudioSegment):
+        """Transcribe chunks on the pool, yielding each segment as soon as it is next in order"""
+        from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
+        from vad import join_ranges
+
+        # Each chunk is a list of speech runs; with VAD only the runs are sent, else their whole span
+        if self.diarize:
+            turns = split_speaker_turns(audio, max_chunk_ms=self.max_chunk_ms,
+                                        min_silence_len=self.min_silence_len, speakers=self.speakers)
+            chunk_runs = [runs for runs, _ in turns]
+            labels = [speaker for _, speaker in turns]
+        else:
+            runs = split_on_silence_bounded(audio, max_chunk_ms=self.max_chunk_ms,
+                                            min_silence_len=self.min_silence_len, merge=not self.vad)
+            chunk_runs = pack_speech_runs(runs, self.max_chunk_ms) if self.vad else [[run] for run in runs]
+            labels = [None] * len(chunk_runs)
+        count('chunks', len(chunk_runs))
+        print(f"[INFO] Transcribing {len(chunk_runs)} chunks with {self.backend.name} "
+              f"({self.workers} {self.executor} workers)...")
+
+        # Backends with batched inference get several chunks per call
+        batch_size = getattr(self.backend, 'batch_size', 1) if hasattr(self.backend, 'transcribe_batch') else 1
+
+        start_time = time.perf_counter()
+        pool_class = ProcessPoolExecutor if self.executor == 'process' else ThreadPoolExecutor
+        with pool_class(max_workers=self.workers) as pool:
+            # Keep a bounded window in flight so only a few chunks are sliced at once
+            in_flight = deque()
+            batch = []  # (chunk, future) waiting for a full batch
+            sent_ms = 0
+            for index, runs in enumerate(chunk_runs):
+                start, end = runs[0][0], runs[-1][1]  # Timestamps stay those of the original recording
+                chunk = join_ranges(audio, runs) if self.vad else audio[start:end]
+                sent_ms += len(chunk)
+                key = self._chunk_key(chunk) if self.cache else None
+                text = self.cache.get(key) if key else None
+                if text is not None:
+                    future, key = Future(), None  # Cached: nothing to store afterwards
+                    future.set_result(text)
+                elif batch_size > 1:
+                    future = Future()
+                    batch.append((chunk, future))
+                    if len(batch) >= batch_size:
+                        self._submit_batch(pool, batch)
+                        batch = []
+                else:
+                    future = pool.submit(_transcribe_chunk, self.backend, chunk)
+                in_flight.append((index, start, end, future, key, labels[index]))
+
+                if len(in_flight) >= max(self.workers * 2, batch_size * 2):
+                    if batch and batch[0][1] is in_flight[0][3]:
+                        self._submit_batch(pool, batch)  # Oldest chunk is still waiting for a batch
+                        batch = []
+                    yield self._collect_segment(*in_flight.popleft())
+
+            if batch:
+                self._submit_batch(pool, batch)
+
+            while in_flight:
+                yield self._collect_segment(*in_flight.popleft())
+
+        # Silence outside the chunks (and, with VAD, between a chunk's runs) never reached the recognizer
+        report_skipped_silence(len(audio), sent_ms, time.perf_counter() - start_time)
+
+    def _submit_batch(self, pool, batch: List[Tuple[AudioSegment, Future]]):
+        """Run one batched call and fan its texts (or error) out to the per-chunk futures"""
+        chunks = [chunk for chunk, _ in batch]
+        futures = [future for _, future in batch]
+
+        def fan_out(done):
+            try:
+                texts = done.result()
+            except Exception as e:
+                for future in futures:
+                    future.set_exception(e)
+                return
+            for future, text in zip(futures, texts):
+                future.set_result(text)
+
+        pool.submit(_transcribe_batch, self.backend, chunks).add_done_callback(fan_out)
+
+    def _collect_segment(self, index, start, end, future, key=None, speaker=None) -> Dict:
+        """Wait for one chunk and wrap its text as a timestamped (speaker-labelled) segment"""
+        segment = {'index': index, 'start': start / 1000, 'end': end / 1000, 'text': ''}
+        if speaker is not None:
+            segment['speaker'] = speaker
+        try:
+            text = future.result()
+            if key:
+                self.cache.put(key, text)
+            segment['text'] = text.strip()
+        except Exception as e:
+            # One bad chunk should not sink the whole recording
+            print(f"[WARN] Chunk {index} ({segment['start']:.1f}s) failed: {e}")
+            segment['error'] = str(e)
+        return segment
+
 # Test
 if __name__ == "__main__":
     processor = AudioProcessor()
@@ -0,0 +1,194 @@
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime
+from pathlib import Path
+from typing import List, Dict
+
+from audio_processor import AudioProcessor, get_backend
+from output_generator import OutputGenerator
+from pipeline import is_audio_file, iter_text_blocks, load_transcript, recording_date
+from roster import open_team
+from scheduler import CycleError, Scheduler
+from task_assigner import TaskAssigner
+from task_extractor import TaskExtractor, sent_tokenize
+from transcript_cache import TranscriptCache, DEFAULT_MAX_BYTES
+from utils import save_json
+
+# Warm per-process state, filled once by init_worker
+_worker = {}
+
+
+def find_meetings(pattern: str) -> List[Path]:
+    """Expand a directory or glob into meeting files (audio or .txt transcripts)"""
+    path = Path(pattern)
+    if path.is_dir():
+        candidates = path.iterdir()
+    else:
+        candidates = (Path(p) for p in glob.glob(pattern, recursive=True))
+
+    return sorted(p for p in candidates
+                  if p.is_file() and (is_audio_file(p) or p.suffix.lower() == '.txt'))
+
+
+def init_worker(team_file: str, processor_options: Dict = None):
+    """Load the team, extractor/assigner and NLTK tokenizer once per worker process"""
+    options = dict(processor_options or {})
+    # Each worker process is long-lived, so a local model loads once per worker
+    backend = get_backend(options.pop('backend', 'google'), **options.pop('backend_options', {}))
+    cache_dir = options.pop('cache_dir', None)
+    cache_bytes = options.pop('cache_bytes', DEFAULT_MAX_BYTES)
+    # Workers share one cache directory; entries are written atomically
+    cache = TranscriptCache(cache_dir, max_bytes=cache_bytes) if cache_dir else None
+
+    team, roster = open_team(team_file)
+    _worker['team'] = team
+    if roster is not None:  # Saved indexes: no parse-and-index pass per worker
+        _worker['extractor'] = roster.prime(TaskExtractor(), team)
+        _worker['assigner'] = roster.assigner(team)
+        roster.close()
+    else:
+        _worker['extractor'] = TaskExtractor()
+        _worker['assigner'] = TaskAssigner(team)
+    # Chunk pools inside a worker process must be threads
+    _worker['processor'] = AudioProcessor(backend=backend, executor='thread', cache=cache, **options)
+
+    sent_tokenize("Warm up the punkt model.")  # Loads the tokenizer pickle now, not per file
+
+
+def analyze_transcript(transcript, strategy: str = 'greedy', solver_options: Dict = None,
+                       meeting_date: date = None):
+    """Extract, assign and schedule with the warm worker state: (tasks, schedule, critical path).
+
+    The transcript is a string or an iterable of text blocks (see iter_text_blocks).
+    Deadlines count from meeting_date (default: today, checked per meeting).
+    """
+    extractor = _worker['extractor'].for_meeting(meeting_date or date.today())
+    today = extractor.deadlines.anchor
+    if isinstance(transcript, str):
+        tasks = extractor.extract_tasks(transcript, _worker['team'])
+    else:
+        tasks = extractor.extract_tasks_from_blocks(transcript, _worker['team'])
+    if strategy == 'balanced':
+        solver_options = {**(solver_options or {}), 'today': today}
+    tasks = _worker['assigner'].assign_tasks(tasks, strategy=strategy, **(solver_options or {}))
+
+    scheduler = Scheduler(today=today)
+    try:
+        schedule = scheduler.schedule(tasks)
+        critical_path = scheduler.critical_path(tasks, schedule)
+    except CycleError:
+        schedule = critical_path = None
+    return tasks, schedule, critical_path
+
+
+def process_meeting(input_path, output_json: str, formats: str = 'all', chunked: bool = False,
+                    strategy: str = 'greedy', solver_options: Dict = None, meeting_date: date = None) -> Dict:
+    """Run one meeting through the warm worker; failures are returned, never raised.
+
+    Deadlines count from meeting_date, or else from when the audio was recorded.
+    """
+    result = {'file': str(input_path), 'status': 'ok'}
+    cache = _worker['processor'].cache
+    before = cache.stats if cache is not None else None
+    try:
+        if is_audio_file(input_path):
+            transcript = load_transcript(_worker['processor'], input_path, chunked=chunked,
+                                         fallback_to_text=False)
+        else:
+            transcript = iter_text_blocks(input_path)
+        meeting_date = recording_date(input_path, meeting_date)
+        tasks, schedule, critical_path = analyze_transcript(transcript, strategy, solver_options, meeting_date)
+
+        generator = OutputGenerator()
+        if formats in ['json', 'all']:
+            generator.generate_json(tasks, output_json, schedule=schedule, critical_path=critical_path)
+        if formats in ['csv', 'all']:
+            generator.generate_csv(tasks, output_json.replace('.json', '.csv'), schedule=schedule)
+
+        result.update(output=output_json, task_count=len(tasks), meeting_date=meeting_date.isoformat(), tasks=tasks)
+    except Exception as e:
+        result.update(status='failed', error=f"{type(e).__name__}: {e}")
+    if cache is not None:
+        result['cache'] = {name: count - before[name] for name, count in cache.stats.items()}
+    return result
+
+
+def _output_paths(meetings: List[Path], output_dir: str) -> List[str]:
+    """One output per meeting, disambiguating files that share a name"""
+    seen = {}
+    paths = []
+    for meeting in meetings:
+        count = seen.get(meeting.stem, 0)
+        seen[meeting.stem] = count + 1
+        name = meeting.stem if count == 0 else f"{meeting.stem}_{count}"
+        paths.append(os.path.join(output_dir, f"{name}.json"))
+    return paths
+
+
+def archive_results(archive_dir: str, results: List[Dict]):
+    """Add the meetings that went through to a task archive, keyed by file name and meeting date"""
+    from analytics import TaskArchive  # NumPy columns; only loaded when archiving
+
+    archive = TaskArchive(archive_dir)
+    rows = archive.add_meetings((Path(result['file']).name, date.fromisoformat(result['meeting_date']),
+                                 result['tasks']) for result in results if result['status'] == 'ok')
+    print(f" Task archive: {rows} tasks added ({archive.rows} in {archive_dir})")
+
+
+def run_batch(pattern: str, team_file: str, output_dir: str = 'batch_output', formats: str = 'all',
+              jobs: int = None, chunked: bool = False, processor_options: Dict = None,
+              strategy: str = 'greedy', solver_options: Dict = None, meeting_date: date = None,
+              archive: str = None) -> List[Dict]:
+    """Fan meetings out across a process pool and write a merged summary.
+
+    With an archive folder, the tasks of every meeting are also added to that
+    TaskArchive (see analytics.py) for reports across meetings.
+    """
+    meetings = find_meetings(pattern)
+    print(f"[INFO] Batch: {len(meetings)} meetings from {pattern}")
+    os.makedirs(output_dir, exist_ok=True)
+
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker,
+                             initargs=(team_file, processor_options)) as pool:
+        futures = {pool.submit(process_meeting, meeting, output, formats, chunked, strategy, solver_options,
+                               meeting_date): meeting
+                   for meeting, output in zip(meetings, _output_paths(meetings, output_dir))}
+
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                # Worker crashed outright (e.g. killed); keep going with the rest
+                result = {'file': str(futures[future]), 'status': 'failed', 'error': f"{type(e).__name__}: {e}"}
+
+            if result['status'] == 'ok':
+                print(f" {result['file']}: {result['task_count']} tasks")
+            else:
+                print(f" {result['file']}: FAILED ({result['error']})")
+            results.append(result)
+
+    results.sort(key=lambda result: result['file'])
+    if archive:
+        archive_results(archive, results)
+    all_tasks = [task for result in results for task in result.pop('tasks', [])]
+    failed = [result for result in results if result['status'] != 'ok']
+    cache_stats = {'hits': 0, 'misses': 0}
+    for result in results:
+        for name, count in result.get('cache', {}).items():
+            cache_stats[name] += count
+
+    summary_file = os.path.join(output_dir, 'batch_summary.json')
+    save_json({
+        'generated_at': datetime.now().isoformat(),
+        'meeting_count': len(results),
+        'failed_count': len(failed),
+        'summary': OutputGenerator.generate_summary(all_tasks),
+        'transcript_cache': cache_stats,
+        'meetings': results
+    }, summary_file)
+
+    print(f" Batch summary saved: {summary_file} ({len(results) - len(failed)} ok, {len(failed)} failed)")
+    print(f" Transcript cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
+    return results
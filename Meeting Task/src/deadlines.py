@@ -0,0 +1,103 @@
+"""Deadline phrases ("tomorrow", "next Monday", "end of the month") resolved to ISO dates.
+
+Everything counts from one anchor date per meeting (the recording date or
+--meeting-date, else today), so the same transcript always gets the same
+deadlines and its extraction results can be cached.
+"""
+import calendar
+from datetime import date, timedelta
+from typing import Dict, Iterable
+
+WEEKDAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+
+
+def _end_of_month(day: date) -> date:
+    return day.replace(day=calendar.monthrange(day.year, day.month)[1])
+
+
+def _this_weekday(index: int):
+    return lambda day: day + timedelta(days=(index - day.weekday()) % 7)  # Today counts
+
+
+def _next_weekday(index: int):
+    return lambda day: day + timedelta(days=7 - day.weekday() + index)  # That day in the coming week
+
+
+# Phrase -> anchor date -> due date. Phrases are matched as substrings of the
+# lowercased sentence; when several match, the longest one wins
+RELATIVE_DATES = {
+    'today': lambda day: day,
+    'tonight': lambda day: day,
+    'end of day': lambda day: day,
+    'end of the day': lambda day: day,
+    'tomorrow': lambda day: day + timedelta(days=1),
+    'day after tomorrow': lambda day: day + timedelta(days=2),
+    'this week': _this_weekday(4),
+    'end of week': _this_weekday(4),
+    'end of the week': _this_weekday(4),
+    'end of this week': _this_weekday(4),
+    'next week': _next_weekday(4),
+    'end of next week': _next_weekday(4),
+    'this month': _end_of_month,
+    'end of month': _end_of_month,
+    'end of the month': _end_of_month,
+    'end of this month': _end_of_month,
+    'next month': lambda day: _end_of_month(_end_of_month(day) + timedelta(days=1)),
+    'end of next month': lambda day: _end_of_month(_end_of_month(day) + timedelta(days=1)),
+}
+for _index, _name in enumerate(WEEKDAYS):
+    RELATIVE_DATES[_name] = RELATIVE_DATES[f'this {_name}'] = _this_weekday(_index)
+    RELATIVE_DATES[f'next {_name}'] = _next_weekday(_index)
+
+# Longer phrases are more specific: "next monday" beats the "monday" inside it
+_RANK = {phrase: (len(phrase), phrase) for phrase in RELATIVE_DATES}
+
+
+class DeadlineResolver:
+    """Relative deadline phrases -> ISO dates for one anchor date.
+
+    The whole phrase table is resolved when the resolver is built, so a
+    sentence costs a dictionary lookup, and each distinct combination of
+    matched phrases is only ranked once.
+    """
+
+    def __init__(self, anchor: date = None):
+        self.anchor = anchor or date.today()
+        self.dates = {phrase: rule(self.anchor).isoformat() for phrase, rule in RELATIVE_DATES.items()}
+        self._resolved = {}
+
+    def resolve(self, phrases: Iterable[str]) -> str:
+        """ISO date for the deadline phrases found in one sentence (None when there are none)"""
+        if not phrases:
+            return None
+        key = frozenset(phrases)
+        if key not in self._resolved:
+            known = [phrase for phrase in key if phrase in self.dates]
+            self._resolved[key] = self.dates[max(known, key=_RANK.__getitem__)] if known else None
+        return self._resolved[key]
+
+    def offset(self, deadline: str) -> int:
+        """Days from the anchor until a deadline (ISO date or phrase such as "Friday"), None if unknown"""
+        if not deadline:
+            return None
+        text = deadline.strip().lower()
+        text = self.dates.get(text, text)
+        try:
+            return (date.fromisoformat(text) - self.anchor).days
+        except ValueError:
+            return None
+
+
+_resolvers: Dict[date, DeadlineResolver] = {}
+
+
+def resolver_for(anchor: date) -> DeadlineResolver:
+    """Shared resolver per anchor date"""
+    if anchor not in _resolvers:
+        _resolvers[anchor] = DeadlineResolver(anchor)
+    return _resolvers[anchor]
+
+
+def deadline_offset(deadline: str, today: date) -> int:
+    """Days from today until a task deadline ("2025-01-31", "Friday", "Next Monday"), None if unknown"""
+    return resolver_for(today).offset(deadline)
@@ -0,0 +1,139 @@
+"""Lightweight speaker diarization on CPU: per-turn spectral features + k-means.
+
+No model weights: each speech turn is summarised by the mean and spread of
+its log mel band energies (a cheap voice "fingerprint"), and turns are
+clustered with k-means. The number of speakers is given or picked by
+silhouette score. Good enough to tell a handful of meeting voices apart,
+not a replacement for neural diarization.
+"""
+from typing import List, Sequence
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+FRAME = 400   # 25 ms
+HOP = 160     # 10 ms
+FFT_SIZE = 512
+MEL_BANDS = 24
+
+# Below this silhouette score the turns are treated as one voice
+MIN_SILHOUETTE = 0.2
+# Turns sampled for the silhouette score (it needs all pairwise distances)
+SILHOUETTE_SAMPLE = 2000
+
+_filterbank = None
+
+
+def mel_filterbank(bands: int = MEL_BANDS, fft_size: int = FFT_SIZE, rate: int = SAMPLE_RATE) -> np.ndarray:
+    """(fft_size // 2 + 1, bands) triangular mel filters"""
+    def to_mel(hz):
+        return 2595 * np.log10(1 + hz / 700)
+
+    edges_mel = np.linspace(to_mel(60), to_mel(rate / 2 - 200), bands + 2)
+    edges = np.floor((fft_size + 1) * 700 * (10 ** (edges_mel / 2595) - 1) / rate).astype(int)
+    filters = np.zeros((fft_size // 2 + 1, bands), dtype=np.float32)
+    for band in range(bands):
+        left, center, right = edges[band], edges[band + 1], max(edges[band + 2], edges[band + 1] + 1)
+        center = max(center, left + 1)
+        filters[left:center, band] = np.linspace(0, 1, center - left, endpoint=False)
+        filters[center:right, band] = np.linspace(1, 0, right - center, endpoint=False)
+    return filters
+
+
+def turn_features(samples: np.ndarray) -> np.ndarray:
+    """Mean and standard deviation of log mel energies over the voiced frames of one turn"""
+    global _filterbank
+    if _filterbank is None:
+        _filterbank = mel_filterbank()
+    if len(samples) < FRAME:
+        samples = np.pad(samples, (0, FRAME - len(samples)))
+
+    frames = np.lib.stride_tricks.sliding_window_view(samples, FRAME)[::HOP] * np.hamming(FRAME).astype(np.float32)
+    power = np.abs(np.fft.rfft(frames, FFT_SIZE)) ** 2
+    bands = np.log(power @ _filterbank + 1e-8)
+
+    # Quiet frames (pauses inside the turn) say little about the voice
+    energy = bands.sum(axis=1)
+    voiced = bands[energy >= np.percentile(energy, 30)]
+    shape = voiced.mean(axis=0)
+    shape -= shape.mean()  # Spectral shape, not loudness: distance from the mic should not matter
+    return np.concatenate([shape, voiced.std(axis=0)])
+
+
+def kmeans(points: np.ndarray, k: int, iterations: int = 50, restarts: int = 4, seed: int = 0):
+    """(labels, inertia) of the best of a few k-means++ runs; deterministic for a seed"""
+    rng = np.random.default_rng(seed)
+    best = None
+    for _ in range(restarts):
+        centers = [points[rng.integers(len(points))]]
+        for _ in range(1, k):
+            distances = ((points[:, None, :] - np.array(centers)[None]) ** 2).sum(axis=2).min(axis=1)
+            total = distances.sum()
+            index = rng.choice(len(points), p=distances / total) if total > 0 else rng.integers(len(points))
+            centers.append(points[index])
+        centers = np.array(centers)
+
+        for _ in range(iterations):
+            distances = ((points[:, None, :] - centers[None]) ** 2).sum(axis=2)
+            labels = distances.argmin(axis=1)
+            moved = np.array([points[labels == c].mean(axis=0) if np.any(labels == c) else centers[c]
+                              for c in range(k)])
+            if np.allclose(moved, centers):
+                break
+            centers = moved
+        inertia = distances[np.arange(len(points)), labels].sum()
+        if best is None or inertia < best[1]:
+            best = (labels, inertia)
+    return best
+
+
+def silhouette(points: np.ndarray, labels: np.ndarray) -> float:
+    """Mean silhouette score (how much closer each point is to its own cluster than the next)"""
+    squared = (points ** 2).sum(axis=1)
+    distances = np.sqrt(np.maximum(squared[:, None] + squared[None] - 2 * points @ points.T, 0))
+    clusters = np.unique(labels)
+    if len(clusters) < 2:
+        return 0.0
+    # Mean distance from every point to every cluster (own cluster excludes the point itself)
+    mean_to = np.stack([distances[:, labels == c].sum(axis=1) for c in clusters], axis=1)
+    sizes = np.array([np.sum(labels == c) for c in clusters])
+    own = np.searchsorted(clusters, labels)
+    rows = np.arange(len(points))
+    own_sizes = sizes[own] - 1
+    a = np.where(own_sizes > 0, mean_to[rows, own] / np.maximum(own_sizes, 1), 0.0)
+    mean_to = mean_to / sizes
+    mean_to[rows, own] = np.inf
+    b = mean_to.min(axis=1)
+    scores = np.where(own_sizes > 0, (b - a) / np.maximum(np.maximum(a, b), 1e-12), 0.0)
+    return float(scores.mean())
+
+
+def cluster_speakers(features: np.ndarray, speakers: int = None, max_speakers: int = 6) -> np.ndarray:
+    """Speaker index per turn, numbered in order of first appearance"""
+    if len(features) == 0:
+        return np.zeros(0, dtype=int)
+    # Log energies share one scale, so plain centering keeps quiet, noisy bands from counting extra
+    points = features - features.mean(axis=0)
+
+    if speakers is not None:
+        labels = kmeans(points, min(speakers, len(points)))[0]
+    else:
+        sample = np.random.default_rng(0).permutation(len(points))[:SILHOUETTE_SAMPLE]
+        labels, best_score = np.zeros(len(points), dtype=int), MIN_SILHOUETTE
+        for k in range(2, min(max_speakers, len(points) - 1) + 1):
+            candidate = kmeans(points, k)[0]
+            score = silhouette(points[sample], candidate[sample])
+            if score > best_score:
+                labels, best_score = candidate, score
+
+    _, first = np.unique(labels, return_index=True)
+    order = np.argsort(np.argsort(first))  # Cluster -> rank of its first turn
+    return order[np.searchsorted(np.unique(labels), labels)]
+
+
+def label_turns(samples: Sequence[np.ndarray], speakers: int = None, max_speakers: int = 6) -> List[str]:
+    """"Speaker 1", "Speaker 2", ... for each turn's 16 kHz mono samples"""
+    if not samples:
+        return []
+    features = np.stack([turn_features(turn) for turn in samples])
+    return [f"Speaker {index + 1}" for index in cluster_speakers(features, speakers, max_speakers)]
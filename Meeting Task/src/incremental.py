@@ -0,0 +1,322 @@
+import hashlib
+import json
+import os
+import re
+from bisect import bisect_left
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Dict, List, Tuple
+
+from profiling import count, stage
+from task_extractor import DEPENDENCY_CUE, DependencyIndex, TaskExtractor, sent_tokenize
+from utils import Task
+
+STATE_VERSION = 2
+
+PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+
+# Largest leftover gap (old x new sentences) handed to difflib, which is quadratic on repeats
+DIFFLIB_CELLS = 250_000
+
+
+def sentence_key(sentence: str) -> str:
+    """Short content hash identifying a sentence across runs"""
+    return hashlib.blake2b(sentence.encode('utf-8'), digest_size=12).hexdigest()
+
+
+def align(old: List[str], new: List[str]) -> List[Tuple[int, int]]:
+    """Matched (old index, new index) pairs, in order (patience diff).
+
+    Common prefixes/suffixes match directly. Inside, sentences that occur exactly
+    once on both sides anchor the alignment (longest increasing run of them),
+    and the gaps between anchors are aligned the same way. Small gaps without
+    such anchors go to difflib; large ones anchor on repeated sentences by
+    occurrence instead, since "Thanks everyone."-style repeats make difflib's
+    matching quadratic on long meetings.
+    """
+    pairs = []
+    ranges = [(0, len(old), 0, len(new))]
+    while ranges:
+        i1, i2, j1, j2 = ranges.pop()
+        while i1 < i2 and j1 < j2 and old[i1] == new[j1]:
+            pairs.append((i1, j1))
+            i1, j1 = i1 + 1, j1 + 1
+        while i1 < i2 and j1 < j2 and old[i2 - 1] == new[j2 - 1]:
+            i2, j2 = i2 - 1, j2 - 1
+            pairs.append((i2, j2))
+        if i1 == i2 or j1 == j2:
+            continue
+
+        anchors = _anchors(old, new, i1, i2, j1, j2)
+        if not anchors and (i2 - i1) * (j2 - j1) <= DIFFLIB_CELLS:
+            matcher = SequenceMatcher(None, old[i1:i2], new[j1:j2], autojunk=False)
+            for a, b, size in matcher.get_matching_blocks():
+                pairs.extend((i1 + a + k, j1 + b + k) for k in range(size))
+            continue
+        if not anchors:
+            anchors = _anchors(old, new, i1, i2, j1, j2, unique=False)
+            if not anchors:
+                continue  # Nothing in common: the whole gap was rewritten
+        for i, j in anchors:
+            pairs.append((i, j))
+            ranges.append((i1, i, j1, j))
+            i1, j1 = i + 1, j + 1
+        ranges.append((i1, i2, j1, j2))
+    pairs.sort()
+    return pairs
+
+
+def _anchors(old, new, i1, i2, j1, j2, unique: bool = True) -> List[Tuple[int, int]]:
+    """Longest increasing run of sentences that appear once in both ranges.
+
+    With unique=False every repeat is a candidate too: the k-th occurrence
+    on one side pairs with the k-th on the other.
+    """
+    if unique:
+        old_counts = Counter(old[i1:i2])
+        new_counts = Counter(new[j1:j2])
+        old_position = {old[i]: i for i in range(i1, i2) if old_counts[old[i]] == 1}
+        candidates = [(old_position[new[j]], j) for j in range(j1, j2)
+                      if new_counts[new[j]] == 1 and new[j] in old_position]
+    else:
+        occurrences = {}
+        for i in range(i1, i2):
+            occurrences.setdefault(old[i], []).append(i)
+        seen = Counter()
+        candidates = []
+        for j in range(j1, j2):
+            positions = occurrences.get(new[j])
+            if positions and seen[new[j]] < len(positions):
+                candidates.append((positions[seen[new[j]]], j))
+            seen[new[j]] += 1
+
+    # Patience sorting: tails[k] = smallest old index ending an increasing run of length k+1
+    tails, tail_index, previous = [], [], [None] * len(candidates)
+    for n, (i, _) in enumerate(candidates):
+        k = bisect_left(tails, i)
+        previous[n] = tail_index[k - 1] if k else None
+        if k == len(tails):
+            tails.append(i)
+            tail_index.append(n)
+        else:
+            tails[k] = i
+            tail_index[k] = n
+    run = []
+    n = tail_index[-1] if tail_index else None
+    while n is not None:
+        run.append(candidates[n])
+        n = previous[n]
+    return run[::-1]
+
+
+class TaskDiff:
+    """What changed since the previous run: new tasks, dropped tasks, and edited ones"""
+
+    def __init__(self):
+        self.added = []    # Task
+        self.removed = []  # Task (as it was last time)
+        self.changed = []  # (before, after, names of the fields that differ), same id
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+    def to_dict(self) -> Dict:
+        """Plain JSON shape; `after` reflects the task as it is now (assignee included)"""
+        return {
+            'added': [task.to_dict() for task in self.added],
+            'removed': [task.to_dict() for task in self.removed],
+            'changed': [{'id': after.id, 'fields': fields, 'before': before.to_dict(), 'after': after.to_dict()}
+                        for before, after, fields in self.changed],
+        }
+
+
+class IncrementalExtractor:
+    """Re-extract an edited transcript, re-tokenizing and re-parsing only what changed.
+
+    The state file keeps the previous run's sentence hashes (per paragraph,
+    so unchanged paragraphs skip the tokenizer), the parse result for each
+    distinct sentence and the tasks found. A new run aligns the old and new
+    sentence sequences (see align): unchanged sentences keep their task id,
+    edited sentences between two matches inherit the ids of the tasks they
+    replace (in order), and anything left over is added or removed.
+    Dependencies are then linked again over the whole sequence, with those
+    stable ids, since an edit anywhere can change what a reference names.
+
+    Sentences are split per blank-line paragraph, so a sentence never spans
+    two paragraphs. Cached results are reused only while the roster and the
+    meeting date are unchanged, because assignee and relative deadlines
+    depend on them; the ids stay stable regardless.
+    """
+
+    def __init__(self, extractor: TaskExtractor = None, state_file: str = None):
+        self.extractor = extractor or TaskExtractor()
+        self.state_file = state_file
+        self.state = self._load()
+        self.stats = {'sentences': 0, 'retokenized': 0, 'reparsed': 0}
+
+    def _load(self) -> Dict:
+        empty = {'version': STATE_VERSION, 'context': None, 'keys': [], 'paragraphs': {}, 'parsed': {},
+                 'clauses': {}, 'tasks': {}, 'next_id': 1}
+        if not self.state_file or not os.path.exists(self.state_file):
+            return empty
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return empty
+        return state if state.get('version') == STATE_VERSION else empty
+
+    def save(self):
+        if self.state_file:
+            temp_file = f"{self.state_file}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.state, f, ensure_ascii=False)
+            os.replace(temp_file, self.state_file)
+
+    def _context(self, team_members) -> str:
+        """Everything besides the sentence that a parse result depends on"""
+        anchor = self.extractor.deadlines.anchor.isoformat()
+        return f"{anchor}|" + "|".join(member.name for member in team_members or ())
+
+    def extract_tasks(self, transcript: str, team_members) -> Tuple[List[Task], TaskDiff]:
+        """All tasks with stable ids, plus the diff against the previous run"""
+        context = self._context(team_members)
+        reuse = self.state['context'] == context
+        with stage('sentence_split'):
+            keys, texts, paragraphs = self._split(transcript, self.state['paragraphs'] if reuse else {})
+        count('sentences', len(keys))
+
+        with stage('classify'):
+            parsed, clauses = self._parse(keys, texts, team_members, self.state['parsed'] if reuse else {},
+                                          self.state['clauses'])
+        with stage('align'):
+            tasks, diff, task_fields = self._align(keys, parsed, clauses, reuse)
+
+        next_id = max([self.state['next_id']] + [task.id + 1 for task in tasks])
+        self.state = {'version': STATE_VERSION, 'context': context, 'keys': keys, 'paragraphs': paragraphs,
+                      'parsed': parsed, 'clauses': clauses, 'tasks': task_fields, 'next_id': next_id}
+        self.stats['sentences'] = len(keys)
+        count('sentences_reparsed', self.stats['reparsed'])
+        count('tasks', len(tasks))
+        print(f"[INFO] Re-parsed {self.stats['reparsed']} of {len(keys)} sentences; "
+              f"{len(diff.added)} added, {len(diff.removed)} removed, {len(diff.changed)} changed tasks")
+        return tasks, diff
+
+    def _split(self, transcript: str, known: Dict):
+        """Sentence hashes in order, text of the newly split ones, paragraph hash -> sentence hashes"""
+        keys, texts, paragraphs = [], {}, {}
+        retokenized = 0
+        for paragraph in PARAGRAPH_BREAK.split(transcript):
+            if not paragraph.strip():
+                continue
+            paragraph_key = sentence_key(paragraph)
+            sentence_keys = paragraphs.get(paragraph_key) or known.get(paragraph_key)
+            if sentence_keys is None:
+                sentence_keys = []
+                for sentence in sent_tokenize(paragraph):
+                    sentence = sentence.strip()
+                    key = sentence_key(sentence)
+                    texts[key] = sentence
+                    sentence_keys.append(key)
+                retokenized += 1
+            paragraphs[paragraph_key] = sentence_keys
+            keys.extend(sentence_keys)
+        self.stats['retokenized'] = retokenized
+        return keys, texts, paragraphs
+
+    def _parse(self, keys: List[str], texts: Dict, team_members, cache: Dict, known_clauses: Dict):
+        """sentence hash -> task fields (None when the sentence is not a task), and
+        sentence hash -> lowercased text for the other sentences with a dependency cue
+        """
+        parsed = {}  # Only current sentences are kept, so the state never outgrows the transcript
+        clauses = {}  # "This depends on ..." follow-ups; the text of task sentences is their description
+        reparsed = 0
+        for key in keys:
+            if key in parsed:
+                continue
+            if key in cache:
+                parsed[key] = cache[key]
+                if key in known_clauses:
+                    clauses[key] = known_clauses[key]
+                continue
+            sentence = texts[key]  # Not cached, so its paragraph was just split
+            found = self.extractor._scan(sentence, team_members)
+            fields = None
+            if 'action' in found:
+                fields = self.extractor._parse_task(sentence, team_members, None, found).to_dict()
+                del fields['id']
+            elif DEPENDENCY_CUE.search(sentence.lower()):
+                clauses[key] = sentence.lower()
+            parsed[key] = fields
+            reparsed += 1
+        self.stats['reparsed'] = reparsed
+        return parsed, clauses
+
+    def _align(self, keys: List[str], parsed: Dict, clauses: Dict, reuse: bool):
+        """Match new task sentences to the previous run's, reusing ids"""
+        old_keys = self.state['keys']
+        old_tasks = {int(position): fields for position, fields in self.state['tasks'].items()}
+        next_id = self.state['next_id']
+
+        tasks, diff, emitted = [], TaskDiff(), []
+
+        def emit(position, old_position, same_sentence=False):
+            nonlocal next_id
+            fields = parsed[keys[position]]
+            old = old_tasks.get(old_position) if old_position is not None else None
+            if old is None:
+                task = Task(next_id, **fields)
+                next_id += 1
+                diff.added.append(task)
+            else:
+                task = Task(old['id'], **fields)
+            tasks.append(task)
+            emitted.append((position, task, old, same_sentence))
+
+        previous_i = previous_j = 0
+        for i, j in align(old_keys, keys) + [(len(old_keys), len(keys))]:
+            # Edited block between two matches: its task sentences take over the old task ids in order
+            old_positions = [position for position in range(previous_i, i) if position in old_tasks]
+            new_positions = [position for position in range(previous_j, j) if parsed[keys[position]] is not None]
+            for k, position in enumerate(new_positions):
+                emit(position, old_positions[k] if k < len(old_positions) else None)
+            diff.removed.extend(Task.from_dict(old_tasks[position]) for position in old_positions[len(new_positions):])
+
+            # Same sentence, so it is still a task if it was one; only its fields may differ
+            if j < len(keys) and parsed[keys[j]] is not None:
+                emit(j, i, same_sentence=True)
+            previous_i, previous_j = i + 1, j + 1
+
+        self._link_dependencies(keys, clauses, {position: task for position, task, _, _ in emitted})
+
+        task_fields = {}
+        for position, task, old, same_sentence in emitted:
+            if old is not None and not (same_sentence and reuse and tuple(old['dependencies']) == task.dependencies):
+                before = Task.from_dict(old)  # Same sentence and context otherwise means the same fields
+                changed = [name for name in Task.__slots__ if getattr(before, name) != getattr(task, name)]
+                if changed:
+                    diff.changed.append((before, task, changed))
+            # Snapshot now: assignment later fills in assigned_to on the Task itself
+            task_fields[str(position)] = task.to_dict()
+
+        return tasks, diff, task_fields
+
+    def _link_dependencies(self, keys: List[str], clauses: Dict, tasks: Dict):
+        """Link "depends on / after ..." clauses over the whole sequence, as TaskExtractor.iter_tasks does.
+
+        tasks maps sentence position -> Task. A follow-up clause reaches the
+        latest task for context_window sentences, like the extractor's held task.
+        """
+        index = DependencyIndex()
+        held = None  # (position, task)
+        for position, key in enumerate(keys):
+            task = tasks.get(position)
+            if task is None and key not in clauses:
+                continue
+            if held and position - held[0] > self.extractor.context_window:
+                held = None
+            sentence_lower = task.description.lower() if task else clauses[key]
+            TaskExtractor._link_dependencies(sentence_lower, task, held[1] if held else None, index)
+            if task:
+                index.add(task.id, sentence_lower)
+                held = (position, task)
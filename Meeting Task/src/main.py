@@ -1,25 +1,161 @@
 import argparse
 import sys
+from datetime import date
 from pathlib import Path
-from audio_processor import AudioProcessor
+from audio_processor import AudioProcessor, BACKENDS, ModelWorker, get_backend
 from task_extractor import TaskExtractor
-from task_assigner import TaskAssigner
-from output_generator import OutputGenerator
-from utils import load_team_members
+from incremental import IncrementalExtractor
+from output_generator import OutputGenerator, JsonLinesWriter, CsvStreamWriter, TableStreamWriter
+from pipeline import is_audio_file, iter_text_blocks, load_transcript, recording_date, stream_tasks, write_stream
+from scheduler import CycleError, Scheduler
+from transcript_cache import TranscriptCache
+from profiling import Profiler, count, stage
+from roster import open_team
+
+def solver_options(args, today: date = None):
+    """Extra options for the balanced assignment solver"""
+    return {'load_penalty': args.load_penalty, 'today': today} if args.assign == 'balanced' else {}
+
+def backend_options(args):
+    """Model settings for the local backend"""
+    return {'model': args.model, 'threads': args.threads} if args.backend == 'local' else {}
+
+def make_backend(args):
+    """The local model lives in a warm worker process that starts loading right away"""
+    if args.backend == 'local':
+        return ModelWorker('local', **backend_options(args))
+    return get_backend(args.backend)
+
+def cache_options(args):
+    """Transcript cache settings (empty when caching is off)"""
+    if args.no_cache:
+        return {}
+    return {'cache_dir': args.cache_dir, 'cache_bytes': int(args.cache_size * 1024 * 1024)}
+
+def processor_options(args):
+    """AudioProcessor settings for worker processes (--batch, --serve, --watch)"""
+    return {'backend': args.backend, 'backend_options': backend_options(args),
+            'max_chunk_ms': int(args.max_chunk * 1000),
+            'workers': args.workers, 'diarize': args.diarize, 'speakers': args.speakers, 'vad': not args.no_vad,
+            **cache_options(args)}
+
+def parse_address(address: str):
+    """"8765" or "0.0.0.0:8765" -> (host, port); the host defaults to localhost only"""
+    host, _, port = address.rpartition(':')
+    return host or '127.0.0.1', int(port)
+
+def print_cache_stats(processor):
+    if processor is not None and processor.cache is not None:
+        stats = processor.cache.stats
+        count('cache_hits', stats['hits'])
+        count('cache_misses', stats['misses'])
+        print(f" Transcript cache: {stats['hits']} hits, {stats['misses']} misses")
+
+def schedule_tasks(tasks, today: date = None):
+    """Dependency order and critical-path dates, or (None, None) when the dependencies loop"""
+    with stage('schedule'):
+        scheduler = Scheduler(today=today)
+        try:
+            schedule = scheduler.schedule(tasks)
+        except CycleError as e:
+            print(f"[WARN] {e}; writing tasks without a schedule")
+            return None, None
+        critical_path = scheduler.critical_path(tasks, schedule)
+    if critical_path:
+        print(f" Critical path: {' -> '.join(f'Task {task_id}' for task_id in critical_path)}")
+    return schedule, critical_path
+
+def run_stream(args, team_members, processor, roster=None):
+    """Streaming mode: write each task the moment it is extracted and assigned"""
+    from task_assigner import TaskAssigner
+
+    print("\n [2/5] Streaming input -> tasks -> outputs (stages 2-5 overlap)...")
+    extractor = TaskExtractor(recording_date(args.audio, args.meeting_date))
+    if roster is not None:
+        roster.prime(extractor, team_members)
+        assigner = roster.assigner(team_members)
+    else:
+        assigner = TaskAssigner(team_members)
+
+    writers = []
+    if args.format in ['json', 'all']:
+        writers.append(JsonLinesWriter(str(Path(args.output).with_suffix('.jsonl'))))
+    if args.format in ['csv', 'all']:
+        writers.append(CsvStreamWriter(args.output.replace('.json', '.csv')))
+    if args.format in ['table', 'all']:
+        writers.append(TableStreamWriter())
+
+    tasks = stream_tasks(args.audio, team_members, processor, extractor, assigner)
+    with stage('stream'):
+        summary = write_stream(tasks, writers)
+    count('tasks', summary['total_tasks'])
+    print(f" Streamed {summary['total_tasks']} tasks")
+    print(f" Priorities: {summary['priorities']}")
+    print_cache_stats(processor)
 
 def main():
     parser = argparse.ArgumentParser(description="🚀 Meeting Task Assignment System")
-    parser.add_argument('--audio', required=True, help='Audio file (.wav, .mp3, .m4a)')
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--audio', help='Audio file (.wav, .mp3, .m4a) or .txt transcript')
+    source.add_argument('--batch', help='Directory or glob of meetings to process in parallel')
+    parser.add_argument('--serve', metavar='[HOST:]PORT', help='Run as a service: POST /meetings with a transcript or audio body returns the tasks as JSON')
+    parser.add_argument('--watch', metavar='DIR', help='Run as a service: process meetings dropped into DIR (outputs go to --output-dir)')
+    parser.add_argument('--max-queue', type=int, default=8, help='Meetings allowed to wait for a worker in service mode; more get HTTP 503')
     parser.add_argument('--team', required=True, help='Team members JSON file')
     parser.add_argument('--output', default='output.json', help='Output JSON file')
     parser.add_argument('--format', choices=['json', 'csv', 'table', 'all'], default='all', help='Output format')
+    parser.add_argument('--chunked', action='store_true', help='Transcribe audio in parallel silence-bounded chunks')
+    parser.add_argument('--backend', choices=sorted(BACKENDS), default='google', help='Speech recognizer (local = offline model, implies --chunked)')
+    parser.add_argument('--model', default='base', help='Local model for --backend local (whisper size, or "stub")')
+    parser.add_argument('--threads', type=int, default=None, help='CPU threads for the local model (default: all)')
+    parser.add_argument('--workers', type=int, default=4, help='Parallel transcription workers for --chunked mode')
+    parser.add_argument('--executor', choices=['thread', 'process'], default='thread', help='Worker pool type for --chunked mode')
+    parser.add_argument('--max-chunk', type=float, default=30, help='Maximum chunk length in seconds for --chunked mode')
+    parser.add_argument('--no-vad', action='store_true', help='Send silence to the recognizer too: the whole recording, or with --chunked each chunk\'s full span between its first and last speech')
+    parser.add_argument('--diarize', action='store_true', help='Label chunks by speaker (CPU voice clustering) so "you"/"I\'ll take it" resolve to people (implies --chunked)')
+    parser.add_argument('--speakers', type=int, default=None, help='Number of speakers for --diarize (default: estimated)')
+    parser.add_argument('--stream', action='store_true', help='Stream tasks to JSON Lines/CSV while audio is still processing (implies --chunked)')
+    parser.add_argument('--assign', choices=['greedy', 'balanced'], default='greedy', help='greedy = best match per task; balanced = global solver using capacity/priority/deadlines')
+    parser.add_argument('--meeting-date', type=date.fromisoformat, default=None, metavar='YYYY-MM-DD', help='Day relative deadlines ("Friday", "next week") count from (default: when the audio was recorded, else today)')
+    parser.add_argument('--incremental', action='store_true', help='Re-parse only edited sentences, keep task ids stable and write a .diff.json of changes (state kept in a .state.json next to --output)')
+    parser.add_argument('--columnar', action='store_true', help='Keep extracted tasks in a columnar TaskBatch (least memory for very long meetings)')
+    parser.add_argument('--load-penalty', type=int, default=10, help='Cost per task already on a member for --assign balanced')
+    parser.add_argument('--cache-dir', default='.transcript_cache', help='Transcript cache folder (keyed on audio content + recognizer settings)')
+    parser.add_argument('--cache-size', type=float, default=512, help='Transcript cache size limit in MB (least recently used entries go first)')
+    parser.add_argument('--no-cache', action='store_true', help='Always re-transcribe audio')
+    parser.add_argument('--profile', metavar='REPORT_JSON', help='Write per-stage wall/CPU time, memory and counts to this JSON file')
+    parser.add_argument('--profile-cpu', action='store_true', help='With --profile: run hot extractor/assigner functions under cProfile')
+    parser.add_argument('--profile-memory', action='store_true', help='With --profile: trace Python allocations with tracemalloc (slower)')
+    parser.add_argument('--jobs', type=int, default=None, help='Worker processes for --batch, --serve and --watch (default: CPU count)')
+    parser.add_argument('--archive', metavar='DIR', help='Also add the tasks to this task archive for reports across meetings (see analytics.py)')
+    parser.add_argument('--output-dir', default='batch_output', help='Per-meeting output folder for --batch and --watch')
     
     args = parser.parse_args()
+    service = args.serve or args.watch
+    if not (args.audio or args.batch or service):
+        parser.error("one of the arguments --audio --batch --serve --watch is required")
+    if service and (args.audio or args.batch):
+        parser.error("--serve/--watch run as a service and cannot be combined with --audio or --batch")
+    if service and (args.stream or args.incremental):
+        parser.error("--stream and --incremental work on single runs and cannot be combined with --serve/--watch")
+    if args.stream and args.archive:
+        parser.error("--archive adds a meeting's finished task list and cannot be combined with --stream")
+    if args.stream and args.assign == 'balanced':
+        parser.error("--assign balanced solves all tasks together and cannot be combined with --stream")
+    if args.incremental and (args.stream or args.batch or args.columnar):
+        parser.error("--incremental works on single runs and cannot be combined with --stream, --batch or --columnar")
+    if args.incremental and args.diarize:
+        parser.error("--incremental caches sentences without speaker context and cannot be combined with --diarize")
+    if args.diarize:
+        args.chunked = True  # Speakers are labelled per chunk
+    if args.backend == 'local':
+        args.chunked = True  # Local models decode <=30 s windows
+        args.executor = 'thread'  # Threads share the one warm model worker
     
     print("MEETING TASK ASSIGNMENT SYSTEM")
     
     # Step 1: Validate inputs
-    if not Path(args.audio).exists():
+    if args.audio and not Path(args.audio).exists():
         print(f" Audio file not found: {args.audio}")
         sys.exit(1)
     
@@ -27,59 +163,144 @@ def main():
         print(f" Team file not found: {args.team}")
         sys.exit(1)
     
+    profiler = None
+    if args.profile:
+        profiler = Profiler(cprofile=args.profile_cpu, trace_memory=args.profile_memory).start()
+
+    if service:
+        import os
+        from service import run_service
+
+        host, port = parse_address(args.serve) if args.serve else (None, None)
+        run_service(args.team, host, port, watch=args.watch, output_dir=args.output_dir,
+                    workers=args.jobs or os.cpu_count() or 1, max_queue=args.max_queue,
+                    processor_options=processor_options(args), chunked=args.chunked, formats=args.format,
+                    strategy=args.assign, solver_options=solver_options(args), meeting_date=args.meeting_date,
+                    archive=args.archive)
+        if profiler is not None:
+            profiler.stop()
+            profiler.save(args.profile)
+        return
+
+    if args.batch:
+        from batch import run_batch
+
+        with stage('batch'):
+            results = run_batch(args.batch, args.team, args.output_dir, formats=args.format,
+                                jobs=args.jobs, chunked=args.chunked, processor_options=processor_options(args),
+                                strategy=args.assign, solver_options=solver_options(args),
+                                meeting_date=args.meeting_date, archive=args.archive)
+        failed = sum(1 for result in results if result['status'] != 'ok')
+        if profiler is not None:
+            count('meetings', len(results))
+            count('failed_meetings', failed)
+            count('tasks', sum(result.get('task_count', 0) for result in results))
+            profiler.stop()
+            profiler.save(args.profile)
+        print("BATCH COMPLETE! Check output folder.")
+        sys.exit(1 if results and failed == len(results) else 0)
+
     print(f" Audio: {args.audio}")
     print(f" Team: {args.team}")
     print(f" Output: {args.output}")
     
+    processor = None
     try:
         # Step 2: Load team
         print("\n [1/5] Loading team members...")
-        team_members = load_team_members(args.team)
+        with stage('load_team'):
+            team_members, roster = open_team(args.team)
+        count('team_members', len(team_members))
         print(f" Loaded {len(team_members)} team members")
         
+        # Text transcripts skip the recognizer entirely (no model worker, no audio imports)
+        if is_audio_file(args.audio):
+            cache = None
+            if not args.no_cache:
+                options = cache_options(args)
+                cache = TranscriptCache(options['cache_dir'], max_bytes=options['cache_bytes'])
+            processor = AudioProcessor(backend=make_backend(args), max_chunk_ms=int(args.max_chunk * 1000),
+                                       workers=args.workers, executor=args.executor, cache=cache,
+                                       diarize=args.diarize, speakers=args.speakers, vad=not args.no_vad)
+
+        if args.stream:
+            run_stream(args, team_members, processor, roster)
+            print("SYSTEM COMPLETE! Check output files.")
+            return
+
         # Step 3: Transcribe audio OR load text file
         print("\n [2/5] Processing input...")
-        processor = AudioProcessor()
 
-        try:
-            transcript = processor.get_transcript_text(args.audio)
-        except Exception as e:
-            # Fallback: treat as text file
-            print(f" Audio failed ({e}), treating as text file...")
-            try:
-                with open(args.audio, 'r', encoding='utf-8', errors='ignore') as f:
-                    transcript = f.read()
-            except:
-                transcript = "No transcript available"
+        # Text transcripts are read block by block during extraction instead (any size, bounded memory)
+        transcript = None
+        if processor is not None or args.incremental:
+            with stage('transcribe'):
+                transcript = load_transcript(processor, args.audio, chunked=args.chunked)
+            count('transcript_characters', len(transcript))
+            print_cache_stats(processor)
         
         # Step 4: Extract tasks
         print("\n [3/5] Extracting tasks...")
-        extractor = TaskExtractor()
-        tasks = extractor.extract_tasks(transcript, team_members)
+        meeting_day = recording_date(args.audio, args.meeting_date)
+        extractor = TaskExtractor(meeting_day)
+        if roster is not None:
+            with stage('load_indexes'):
+                roster.prime(extractor, team_members)
+        incremental = None
+        with stage('extract'):
+            if args.incremental:
+                incremental = IncrementalExtractor(extractor, str(Path(args.output).with_suffix('.state.json')))
+                tasks, diff = incremental.extract_tasks(transcript, team_members)
+            elif transcript is None:
+                tasks = extractor.extract_tasks_from_blocks(iter_text_blocks(args.audio), team_members,
+                                                            columnar=args.columnar)
+            else:
+                tasks = extractor.extract_tasks(transcript, team_members, columnar=args.columnar)
         print(f" Found {len(tasks)} tasks")
         
         # Step 5: Assign tasks
         print("\n [4/5] Smart assignment...")
-        assigner = TaskAssigner(team_members)
-        tasks = assigner.assign_tasks(tasks)
+        from task_assigner import TaskAssigner  # NumPy loads here, not at startup
+        with stage('assign'):
+            assigner = roster.assigner(team_members) if roster is not None else TaskAssigner(team_members)
+            tasks = assigner.assign_tasks(tasks, strategy=args.assign, **solver_options(args, meeting_day))
+        schedule, critical_path = schedule_tasks(tasks, meeting_day)
         
         # Step 6: Generate outputs
         print("\n [5/5] Generating outputs...")
         generator = OutputGenerator()
         
         if args.format in ['json', 'all']:
-            generator.generate_json(tasks, args.output)
+            with stage('output_json'):
+                generator.generate_json(tasks, args.output, schedule=schedule, critical_path=critical_path)
         if args.format in ['csv', 'all']:
             csv_file = args.output.replace('.json', '.csv')
-            generator.generate_csv(tasks, csv_file)
+            with stage('output_csv'):
+                generator.generate_csv(tasks, csv_file, schedule=schedule)
         if args.format in ['table', 'all']:
-            generator.print_table(tasks)
+            with stage('output_table'):
+                generator.print_table(tasks)
+        if args.archive:
+            from analytics import TaskArchive
+
+            with stage('archive'):
+                rows = TaskArchive(args.archive).add_meeting(Path(args.audio).name, meeting_day, tasks)
+            print(f" Task archive: {rows} tasks added to {args.archive}")
+        if incremental is not None:
+            generator.generate_diff(diff, str(Path(args.output).with_suffix('.diff.json')))
+            incremental.save()  # Only after a complete run, so a failure re-diffs against the last good one
         
         print("SYSTEM COMPLETE! Check output files.")
         
     except Exception as e:
         print(f"\n ERROR: {e}")
         sys.exit(1)
+    finally:
+        if processor is not None and hasattr(processor.backend, 'close'):
+            processor.backend.close()
+        if profiler is not None:
+            profiler.stop()
+            profiler.save(args.profile)
 
 if __name__ == "__main__":
     main()
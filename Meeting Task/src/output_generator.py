@@ -1,57 +1,258 @@
+import csv
 import json
-import pandas as pd
-from typing import List, Dict
+from collections.abc import Sized
+from json.encoder import encode_basestring
+from typing import List, Dict, Iterable
 from datetime import datetime
 
+from scheduler import SCHEDULE_COLUMNS
+from utils import Task
+
+COLUMNS = ['id', 'description', 'assigned_to', 'deadline', 'priority', 'dependencies', 'reason']
+
+
+# Compact JSON via the C-accelerated encoder (json.dumps with indent= falls back to pure Python)
+_encode = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def _json_scalar(value) -> str:
+    """Fast path for the flat values tasks hold; same text as json.dumps"""
+    if isinstance(value, str):
+        return encode_basestring(value)
+    if value is None:
+        return 'null'
+    if value is True or value is False:
+        return 'true' if value else 'false'
+    if type(value) is int:
+        return int.__repr__(value)
+    return _encode(value)
+
+
+def _as_dict(task) -> Dict:
+    """Output boundary: Task objects become the plain dicts the files are written from"""
+    return task.to_dict() if isinstance(task, Task) else task
+
+
+def _cell(value) -> str:
+    """Console/CSV text for one field: None -> empty, lists as their repr"""
+    return '' if value is None else str(value)
+
+
+class JsonStreamWriter:
+    """Write the {generated_at, task_count, tasks: [...]} document one task at a time.
+
+    With task_count known up front the output is the same as json.dump(indent=2);
+    otherwise task_count is written after the tasks, once it is known.
+    """
+
+    def __init__(self, output_file: str, task_count: int = None, schedule: Dict = None, critical_path=None):
+        self.output_file = output_file
+        self.task_count = task_count
+        self.schedule = schedule  # Optional task id -> Scheduler entry, written as each task's "schedule"
+        self.critical_path = critical_path
+        self.count = 0
+        self._file = open(output_file, 'w', encoding='utf-8')
+        self._file.write('{\n  "generated_at": ' + json.dumps(datetime.now().isoformat()))
+        if task_count is not None:
+            self._file.write(f',\n  "task_count": {task_count}')
+        self._file.write(',\n  "tasks": [')
+
+    def write(self, task: Task):
+        task = _as_dict(task)
+        if self.schedule is not None and task.get('id') in self.schedule:
+            task = {**task, 'schedule': self.schedule[task['id']]}
+        self._file.write(('\n    ' if self.count == 0 else ',\n    ') + self._indented(task))
+        self.count += 1
+
+    @staticmethod
+    def _indented(task: Dict) -> str:
+        """json.dumps(task, indent=2) nested one level deeper, via the C encoder for flat values"""
+        if not task:
+            return '{}'
+        lines = []
+        for key, value in task.items():
+            if isinstance(value, (list, dict)) and value:
+                text = json.dumps(value, indent=2, ensure_ascii=False).replace('\n', '\n      ')
+            else:
+                text = _json_scalar(value)
+            lines.append(f'      {encode_basestring(str(key))}: {text}')
+        return '{\n' + ',\n'.join(lines) + '\n    }'
+
+    def close(self):
+        self._file.write('\n  ]' if self.count else ']')
+        if self.task_count is None:
+            self._file.write(f',\n  "task_count": {self.count}')
+        if self.critical_path is not None:
+            self._file.write(f',\n  "critical_path": {_encode(list(self.critical_path))}')
+        self._file.write('\n}')
+        self._file.close()
+        print(f" JSON saved: {self.output_file} ({self.count} tasks)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class JsonLinesWriter:
+    """Append one task per line as it arrives (streaming mode)"""
+
+    def __init__(self, output_file: str, flush: bool = True):
+        self.output_file = output_file
+        self.flush = flush  # Make each line visible to readers right away
+        self.count = 0
+        self._file = open(output_file, 'w', encoding='utf-8')
+
+    def write(self, task: Task):
+        self._file.write(json.dumps(_as_dict(task), ensure_ascii=False) + "\n")
+        if self.flush:
+            self._file.flush()
+        self.count += 1
+
+    def close(self):
+        self._file.close()
+        print(f" JSON Lines saved: {self.output_file} ({self.count} tasks)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CsvStreamWriter:
+    """Write CSV rows one task at a time with the standard columns"""
+
+    def __init__(self, output_file: str, flush: bool = True, schedule: Dict = None):
+        self.output_file = output_file
+        self.flush = flush
+        self.schedule = schedule  # Optional task id -> Scheduler entry, added as extra columns
+        self.count = 0
+        self._file = open(output_file, 'w', encoding='utf-8', newline='')
+        self._writer = csv.writer(self._file, lineterminator='\n')
+        self._writer.writerow(COLUMNS + (SCHEDULE_COLUMNS if schedule is not None else []))
+
+    def write(self, task: Task):
+        # None -> empty cell, lists as their repr (same as the pandas writer did)
+        task = _as_dict(task)
+        row = [_cell(task.get(col)) for col in COLUMNS]
+        if self.schedule is not None:
+            entry = self.schedule.get(task.get('id'), {})
+            row.extend(_cell(entry.get(col)) for col in SCHEDULE_COLUMNS)
+        self._writer.writerow(row)
+        if self.flush:
+            self._file.flush()
+        self.count += 1
+
+    def close(self):
+        self._file.close()
+        print(f" CSV saved: {self.output_file} ({self.count} tasks)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class TableStreamWriter:
+    """Print one console row per task as it arrives"""
+
+    def __init__(self):
+        self.count = 0
+        print("\n" + "="*100)
+        print(" MEETING TASK ASSIGNMENTS (live)")
+        print("="*100)
+
+    def write(self, task: Task):
+        task = _as_dict(task)
+        description = task.get('description', '').replace('\n', ' ')
+        print(f" {task.get('id', ''):>3}  {str(task.get('assigned_to') or ''):<12} "
+              f"{task.get('priority', ''):<9} {str(task.get('deadline') or ''):<12} {description[:60]}")
+        self.count += 1
+
+    def close(self):
+        print("="*100)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
 class OutputGenerator:
     @staticmethod
-    def generate_json(tasks: List[Dict], output_file: str = "../output.json"):
-        """Generate JSON output matching project requirements"""
-        output_data = {
-            'generated_at': datetime.now().isoformat(),
-            'task_count': len(tasks),
-            'tasks': tasks
-        }
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
-        
-        print(f" JSON saved: {output_file}")
+    def generate_json(tasks: Iterable[Task], output_file: str = "../output.json",
+                      schedule: Dict = None, critical_path: List[int] = None):
+        """Generate JSON output matching project requirements (tasks may be any iterable).
+
+        With a schedule (see Scheduler) each task gets its "schedule" entry and
+        the document a top-level "critical_path".
+        """
+        task_count = len(tasks) if isinstance(tasks, Sized) else None
+        with JsonStreamWriter(output_file, task_count=task_count, schedule=schedule,
+                              critical_path=critical_path) as writer:
+            for task in tasks:
+                writer.write(task)
         return output_file
     
     @staticmethod
-    def generate_csv(tasks: List[Dict], output_file: str = "../output.csv"):
-        """Generate CSV output with proper columns"""
-        df = pd.DataFrame(tasks)
-        
-        # Standardize columns (match project spec)
-        columns = ['id', 'description', 'assigned_to', 'deadline', 'priority', 'dependencies', 'reason']
-        df = df.reindex(columns=[col for col in columns if col in df.columns], fill_value='')
-        
-        df.to_csv(output_file, index=False, encoding='utf-8')
-        print(f" CSV saved: {output_file}")
+    def generate_csv(tasks: Iterable[Task], output_file: str = "../output.csv", schedule: Dict = None):
+        """Generate CSV output with proper columns (plus the schedule columns when given)"""
+        with CsvStreamWriter(output_file, flush=False, schedule=schedule) as writer:
+            for task in tasks:
+                writer.write(task)
         return output_file
     
     @staticmethod
-    def print_table(tasks: List[Dict]):
-        """Print beautiful console table"""
-        df = pd.DataFrame(tasks)
-        columns = ['id', 'description', 'assigned_to', 'deadline', 'priority', 'dependencies', 'reason']
-        df = df.reindex(columns=[col for col in columns if col in df.columns], fill_value='')
-        
+    def print_table(tasks: Iterable[Task]):
+        """Print beautiful console table (columns sized to fit when tasks is a list)"""
+        if not isinstance(tasks, Sized):
+            # One pass only: fixed-width live rows
+            with TableStreamWriter() as writer:
+                for task in tasks:
+                    writer.write(task)
+            return
+
+        rows = ([_cell(task.get(col)).replace('\n', ' ') for col in COLUMNS] for task in map(_as_dict, tasks))
+        widths = [len(col) for col in COLUMNS]
+        for row in rows:
+            widths = [max(width, len(cell)) for width, cell in zip(widths, row)]
+
         print("\n" + "="*100)
         print(" MEETING TASK ASSIGNMENTS")
         print("="*100)
-        print(df.to_string(index=False))
+        if not tasks:
+            print(" (no tasks)")
+        else:
+            # Right-aligned columns, as pandas' to_string(index=False) laid them out
+            print(" " + " ".join(col.rjust(width) for col, width in zip(COLUMNS, widths)))
+            for task in map(_as_dict, tasks):
+                print(" " + " ".join(_cell(task.get(col)).replace('\n', ' ').rjust(width)
+                                     for col, width in zip(COLUMNS, widths)))
         print("="*100)
     
     @staticmethod
-    def generate_summary(tasks: List[Dict]) -> Dict:
+    def generate_diff(diff, output_file: str):
+        """Write the tasks added, removed and changed since the last incremental run"""
+        changes = diff.to_dict()
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump({'generated_at': datetime.now().isoformat(),
+                       'counts': {kind: len(tasks) for kind, tasks in changes.items()}, **changes},
+                      f, indent=2, ensure_ascii=False)
+        print(f" Diff saved: {output_file} (+{len(diff.added)} added, -{len(diff.removed)} removed, "
+              f"~{len(diff.changed)} changed)")
+        return output_file
+
+    @staticmethod
+    def generate_summary(tasks: List[Task]) -> Dict:
         """Generate task summary statistics"""
         priorities = {}
         assignees = {}
         
-        for task in tasks:
+        for task in map(_as_dict, tasks):
             prio = task.get('priority', 'Medium')
             priorities[prio] = priorities.get(prio, 0) + 1
             
@@ -0,0 +1,126 @@
+import codecs
+import mmap
+import os
+from datetime import date
+from pathlib import Path
+from typing import Dict, List
+
+from audio_processor import AUDIO_EXTENSIONS
+
+# Text transcripts are read this many bytes at a time
+BLOCK_SIZE = 1 << 20
+
+
+def is_audio_file(path) -> bool:
+    """Audio is detected by extension; everything else is read as a transcript"""
+    return Path(path).suffix.lower() in AUDIO_EXTENSIONS
+
+
+def recording_date(input_path, override: date = None) -> date:
+    """The day relative deadlines count from: the given date, else when the audio was recorded, else today.
+
+    The recording time is the audio file's modification time (recorders write as they go).
+    """
+    if override is not None:
+        return override
+    if is_audio_file(input_path):
+        try:
+            return date.fromtimestamp(os.path.getmtime(input_path))
+        except OSError:
+            pass
+    return date.today()
+
+
+def read_text_transcript(transcript_path) -> str:
+    """Read a plain-text transcript"""
+    with open(transcript_path, 'r', encoding='utf-8', errors='ignore') as f:
+        return f.read()
+
+
+def load_transcript(processor, input_path, chunked: bool = False, fallback_to_text: bool = True) -> str:
+    """Transcribe audio OR load a text transcript"""
+    if not is_audio_file(input_path):
+        return read_text_transcript(input_path)
+
+    try:
+        return processor.get_transcript_text(str(input_path), chunked=chunked)
+    except Exception as e:
+        if not fallback_to_text:
+            raise
+        # Fallback: treat as text file
+        print(f" Audio failed ({e}), treating as text file...")
+        try:
+            return read_text_transcript(input_path)
+        except OSError:
+            return "No transcript available"
+
+
+def iter_text_blocks(transcript_path, block_size: int = BLOCK_SIZE):
+    """Yield a text transcript as decoded blocks of about block_size bytes, without reading it all.
+
+    The file is memory-mapped, so pages come straight from the OS cache with
+    sequential read-ahead. Blocks are cut at whitespace, which starts the next
+    block (so a partial word moves along with it), and UTF-8 characters split
+    across blocks decode whole.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+    with open(transcript_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return  # Empty files cannot be mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if hasattr(data, 'madvise'):
+                data.madvise(mmap.MADV_SEQUENTIAL)
+            carry = ""
+            for start in range(0, len(data), block_size):
+                text = carry + decoder.decode(data[start:start + block_size])
+                cut = max(text.rfind(' '), text.rfind('\n'), text.rfind('\t'))
+                if cut <= 0:
+                    cut = len(text)  # No whitespace in a whole block: not worth holding on to
+                carry = text[cut:]
+                if cut:
+                    yield text[:cut]
+            carry += decoder.decode(b'', final=True)
+            if carry:
+                yield carry
+
+
+def stream_tasks(input_path, team_members, processor, extractor, assigner):
+    """Generator pipeline: segments -> sentences -> tasks -> assigned tasks.
+
+    Each stage pulls from the previous one, so the first task comes out as soon
+    as the first chunk is transcribed and nothing holds the whole meeting.
+    """
+    if not is_audio_file(input_path):
+        return assigner.iter_assign(extractor.iter_block_tasks(iter_text_blocks(input_path), team_members))
+
+    segments = processor.iter_transcript_segments(input_path)
+    if processor.diarize:
+        # Each chunk is one speaker's turn, so sentences keep their speaker label
+        turns = ((segment.get('speaker'), sentence) for segment in segments
+                 for sentence in extractor.iter_sentences([segment['text']], carry_incomplete=False))
+        return assigner.iter_assign(extractor.iter_speaker_tasks(turns, team_members))
+
+    # Chunks end at silence, and recognizers rarely punctuate, so never carry text over
+    texts = (segment['text'] for segment in segments)
+    sentences = extractor.iter_sentences(texts, carry_incomplete=False)
+    tasks = extractor.iter_tasks(sentences, team_members)
+    return assigner.iter_assign(tasks)
+
+
+def write_stream(tasks, writers: List) -> Dict:
+    """Push each task to every writer as it arrives, returning summary counts"""
+    summary = {'total_tasks': 0, 'priorities': {}, 'assignees': {}}
+    try:
+        for task in tasks:
+            for writer in writers:
+                writer.write(task)
+
+            summary['total_tasks'] += 1
+            prio = task.priority
+            summary['priorities'][prio] = summary['priorities'].get(prio, 0) + 1
+            assignee = task.assigned_to
+            summary['assignees'][assignee] = summary['assignees'].get(assignee, 0) + 1
+    finally:
+        for writer in writers:
+            writer.close()
+    return summary
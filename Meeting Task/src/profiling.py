@@ -0,0 +1,200 @@
+import functools
+import json
+import resource
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict
+
+# cProfile, pstats and tracemalloc are imported only when a run is profiled:
+# every pipeline module imports this one for its no-op hooks
+
+# Profiler collecting data for the current run (None = instrumentation is a no-op)
+_active = None
+
+
+def stage(name: str):
+    """Time a pipeline stage if a run is being profiled"""
+    return _active.stage(name) if _active is not None else nullcontext()
+
+
+def count(name: str, value: int = 1):
+    """Add to a run counter (sentences, tasks, chunks, ...) if profiling"""
+    if _active is not None:
+        _active.counts[name] = _active.counts.get(name, 0) + value
+
+
+def hot(name: str):
+    """Decorator for hot functions: timed (and cProfile'd) only while profiling"""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = _active
+            if profiler is None:
+                return func(*args, **kwargs)
+            with profiler.hook(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def _max_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux reports KiB
+
+
+class Profiler:
+    """Per-stage wall/CPU time, peak memory and counts for one run, as a JSON report.
+
+    Stages nest ("extract/sentence_split"). CPU time is for the whole process,
+    so it includes worker threads. Peak memory is the process's max RSS
+    after the stage. With trace_memory it is the peak traced Python
+    allocation inside the stage instead, plus the top allocation sites still
+    live after each top-level stage. With cprofile, the @hot functions also
+    run under cProfile and the report lists the costliest functions.
+    """
+
+    def __init__(self, cprofile: bool = False, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.counts = {}
+        self.stages = {}
+        self.hooks = {}
+        self.allocations = {}
+        self.totals = {}
+        self._stages = []  # Names of the open stages
+        self._stack = []   # Open measurements (stages and hooks): [key, peak traced bytes]
+        self._cprofile = None
+        if cprofile:
+            import cProfile
+            self._cprofile = cProfile.Profile()
+        self._hook_depth = 0
+        self._started = None
+
+    def start(self):
+        """Make this the active profiler for stage()/count()/@hot"""
+        global _active
+        if self.trace_memory:
+            import tracemalloc
+            tracemalloc.start()
+        self._started = (time.perf_counter(), time.process_time())
+        _active = self
+        return self
+
+    def stop(self):
+        global _active
+        _active = None
+        wall, cpu = time.perf_counter() - self._started[0], time.process_time() - self._started[1]
+        self.totals = {'wall_s': round(wall, 4), 'cpu_s': round(cpu, 4), 'max_rss_mb': round(_max_rss_mb(), 1)}
+        if self.trace_memory:
+            import tracemalloc
+            tracemalloc.stop()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @contextmanager
+    def stage(self, name: str):
+        self._stages.append(name)
+        path = "/".join(self._stages)
+        try:
+            with self._measure(self.stages, path):
+                yield
+        finally:
+            self._stages.pop()
+        if self.trace_memory and not self._stages:
+            self.allocations[path] = self._top_allocations()
+
+    @contextmanager
+    def hook(self, name: str):
+        self._hook_depth += 1
+        profile = self._cprofile if self._hook_depth == 1 else None  # Outermost hot call only
+        if profile:
+            profile.enable()
+        try:
+            with self._measure(self.hooks, name):
+                yield
+        finally:
+            if profile:
+                profile.disable()
+            self._hook_depth -= 1
+
+    @contextmanager
+    def _measure(self, records: Dict, key: str):
+        """Accumulate calls, wall/CPU time and peak memory into records[key]"""
+        if self.trace_memory:
+            self._fold_peak()
+        frame = [key, 0]
+        self._stack.append(frame)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            if self.trace_memory:
+                self._fold_peak()
+            self._stack.pop()
+
+            record = records.setdefault(key, {'calls': 0, 'wall_s': 0.0, 'cpu_s': 0.0})
+            record['calls'] += 1
+            record['wall_s'] += wall
+            record['cpu_s'] += cpu
+            if self.trace_memory:
+                record['peak_traced_mb'] = max(record.get('peak_traced_mb', 0), frame[1] / 2 ** 20)
+                if self._stack:
+                    self._stack[-1][1] = max(self._stack[-1][1], frame[1])  # Children count for parents
+            else:
+                record['max_rss_mb'] = _max_rss_mb()
+
+    def _fold_peak(self):
+        """Credit the traced peak since the last reset to every open measurement"""
+        import tracemalloc
+
+        peak = tracemalloc.get_traced_memory()[1]
+        for frame in self._stack:
+            frame[1] = max(frame[1], peak)
+        tracemalloc.reset_peak()
+
+    @staticmethod
+    def _top_allocations(limit: int = 10):
+        import tracemalloc
+
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ])
+        return [{'location': str(stat.traceback[0]), 'size_mb': round(stat.size / 2 ** 20, 3), 'count': stat.count}
+                for stat in snapshot.statistics('lineno')[:limit]]
+
+    def _top_functions(self, limit: int = 25):
+        import pstats
+
+        stats = pstats.Stats(self._cprofile).stats
+        rows = sorted(stats.items(), key=lambda item: -item[1][3])[:limit]
+        return [{'function': f"{file}:{line}({name})", 'calls': calls, 'total_s': round(total, 4),
+                 'cumulative_s': round(cumulative, 4)}
+                for (file, line, name), (_, calls, total, cumulative, _) in rows]
+
+    def report(self) -> Dict:
+        def rounded(records):
+            return {key: {field: round(value, 4) if isinstance(value, float) else value
+                          for field, value in record.items()}
+                    for key, record in records.items()}
+
+        report = {
+            'totals': self.totals,
+            'stages': rounded(self.stages),
+            'counts': dict(self.counts),
+            'hot_functions': rounded(self.hooks),
+        }
+        if self._cprofile is not None and self.hooks:
+            report['cprofile_top'] = self._top_functions()
+        if self.trace_memory:
+            report['allocations_after_stage'] = self.allocations
+        return report
+
+    def save(self, output_file: str):
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+        print(f" Profile saved: {output_file}")
+        return output_file
@@ -0,0 +1,217 @@
+"""Team roster kept in SQLite, with the lookup indexes built from it saved alongside.
+
+A JSON roster is parsed and indexed on every run (name matcher for the
+extractor, skill/role index for the assigner), which takes seconds for an
+HR export of tens of thousands of people. A roster store keeps the members
+in a table that takes incremental add/update/remove, and saves each built
+index tagged with the roster revision it was built from, so later runs load
+it instead of rebuilding it.
+
+    python src/roster.py roster.db import data/team_members.json
+    python src/roster.py roster.db add "Priya" "QA Engineer" --skills testing automation --capacity 3
+    python src/roster.py roster.db remove "Priya"
+    python src/main.py --audio meeting.wav --team roster.db
+"""
+import pickle
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from transcript_cache import content_key
+from utils import TeamMember, load_team_members
+
+ROSTER_EXTENSIONS = {'.db', '.sqlite', '.sqlite3'}
+
+# Bump when the shape of a saved index changes, so old ones are rebuilt
+INDEX_FORMAT = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS members (
+    position INTEGER PRIMARY KEY AUTOINCREMENT,  -- roster order: first match wins ties
+    name TEXT NOT NULL UNIQUE,
+    role TEXT NOT NULL,
+    skills TEXT NOT NULL,                        -- one per line
+    capacity INTEGER
+);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS indexes (kind TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, data BLOB NOT NULL);
+"""
+
+
+def is_roster_store(path) -> bool:
+    """Roster stores are detected by extension; anything else is a JSON roster"""
+    return Path(path).suffix.lower() in ROSTER_EXTENSIONS
+
+
+def open_team(team_file: str):
+    """(members, store) for a --team file; store is None for a JSON roster"""
+    if not is_roster_store(team_file):
+        return load_team_members(team_file), None
+    store = RosterStore(team_file)
+    return store.members(), store
+
+
+class RosterStore:
+    """Members in roster order plus saved extractor/assigner indexes.
+
+    Every change bumps the roster revision; a saved index is only used
+    while its fingerprint (revision + the vocabulary it was built with)
+    still matches, and is rebuilt and saved again otherwise. Indexes are
+    pickled, so only open stores you created yourself.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.db = sqlite3.connect(path, timeout=30)  # Batch workers may rebuild an index at the same time
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    @property
+    def revision(self) -> int:
+        row = self.db.execute("SELECT value FROM meta WHERE key = 'revision'").fetchone()
+        return row[0] if row else 0
+
+    def _bump(self):
+        self.db.execute("INSERT INTO meta (key, value) VALUES ('revision', 1) "
+                        "ON CONFLICT (key) DO UPDATE SET value = value + 1")
+
+    # Members
+
+    def members(self) -> List[TeamMember]:
+        """All members in roster order"""
+        rows = self.db.execute("SELECT name, role, skills, capacity FROM members ORDER BY position")
+        return [TeamMember(name, role, skills.split('\n') if skills else [], capacity)
+                for name, role, skills, capacity in rows]
+
+    def add(self, member: TeamMember):
+        """Add a member at the end of the roster, or update them if the name exists"""
+        self.upsert([member])
+
+    def upsert(self, members: Iterable[TeamMember]) -> int:
+        """Add or update members by name; returns how many rows changed"""
+        with self.db:
+            changed = self.db.executemany(
+                "INSERT INTO members (name, role, skills, capacity) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET role = excluded.role, skills = excluded.skills, "
+                "capacity = excluded.capacity "
+                "WHERE (role, skills, capacity) IS NOT (excluded.role, excluded.skills, excluded.capacity)",
+                [(m.name, m.role, '\n'.join(m.skills), m.capacity) for m in members]).rowcount
+            if changed:
+                self._bump()
+        return changed
+
+    def update(self, name: str, role: str = None, skills: List[str] = None, capacity: int = None) -> bool:
+        """Change some fields of one member; False when there is no such member"""
+        row = self.db.execute("SELECT role, skills, capacity FROM members WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return False
+        if skills is None:
+            skills = row[1].split('\n') if row[1] else []
+        member = TeamMember(name, role or row[0], skills, capacity if capacity is not None else row[2])
+        self.upsert([member])
+        return True
+
+    def remove(self, names: Iterable[str]) -> int:
+        """Remove members by name; returns how many were removed"""
+        with self.db:
+            removed = self.db.executemany("DELETE FROM members WHERE name = ?", [(name,) for name in names]).rowcount
+            if removed:
+                self._bump()
+        return removed
+
+    def import_json(self, json_file: str) -> Dict[str, int]:
+        """Make the store match a JSON roster (an HR export), touching only what differs"""
+        members = {member.name: member for member in load_team_members(json_file)}  # Later duplicates win
+        existing = {name for name, in self.db.execute("SELECT name FROM members")}
+        changed = self.upsert(members.values())
+        removed = self.remove(existing - set(members))
+        added = len(set(members) - existing)
+        return {'added': added, 'updated': changed - added, 'removed': removed, 'members': len(members)}
+
+    # Saved indexes
+
+    def _load_index(self, kind: str, fingerprint: str):
+        row = self.db.execute("SELECT fingerprint, data FROM indexes WHERE kind = ?", (kind,)).fetchone()
+        if row is None or row[0] != fingerprint:
+            return None
+        try:
+            return pickle.loads(row[1])
+        except Exception:
+            return None  # Written by an incompatible version: rebuild
+
+    def _save_index(self, kind: str, fingerprint: str, state):
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO indexes (kind, fingerprint, data) VALUES (?, ?, ?)",
+                            (kind, fingerprint, pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)))
+
+    def assigner(self, team_members: List[TeamMember]):
+        """TaskAssigner for members() with its skill/role index loaded (built and saved if stale)"""
+        from task_assigner import MAX_SCORE, ROLE_BONUS_POINTS, ROLE_POINTS, SKILL_POINTS, TaskAssigner
+
+        fingerprint = content_key(INDEX_FORMAT, self.revision, TaskAssigner.ROLE_BONUSES,
+                                  (SKILL_POINTS, ROLE_POINTS, ROLE_BONUS_POINTS, MAX_SCORE))
+        index = self._load_index('assigner', fingerprint)
+        if index is not None:
+            return TaskAssigner(team_members, index=index)
+        assigner = TaskAssigner(team_members)
+        self._save_index('assigner', fingerprint, assigner.index_state())
+        return assigner
+
+    def prime(self, extractor, team_members: List[TeamMember]):
+        """Give the extractor its name/keyword matcher for members() (built and saved if stale)"""
+        fingerprint = content_key(INDEX_FORMAT, self.revision, extractor.vocabulary())
+        state = self._load_index('extractor', fingerprint)
+        if state is not None:
+            extractor.use_matcher(team_members, state)
+        else:
+            self._save_index('extractor', fingerprint, extractor.matcher_state(team_members))
+        return extractor
+
+    def build_indexes(self):
+        """Rebuild any stale index now, so the next run starts fast"""
+        from task_extractor import TaskExtractor
+
+        team = self.members()
+        self.prime(TaskExtractor(), team)
+        self.assigner(team)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Manage a team roster store")
+    parser.add_argument('store', help='Roster database (.db)')
+    commands = parser.add_subparsers(dest='command', required=True)
+    load = commands.add_parser('import', help='Sync the store with a JSON roster (adds, updates and removes)')
+    load.add_argument('json_file')
+    for name in ('add', 'update'):
+        command = commands.add_parser(name, help=f'{name.capitalize()} one member')
+        command.add_argument('name')
+        command.add_argument('role', nargs=None if name == 'add' else '?')
+        command.add_argument('--skills', nargs='*')
+        command.add_argument('--capacity', type=int)
+    remove = commands.add_parser('remove', help='Remove members by name')
+    remove.add_argument('names', nargs='+')
+    commands.add_parser('list', help='Print the roster')
+    args = parser.parse_args()
+
+    store = RosterStore(args.store)
+    if args.command == 'import':
+        print(f"[INFO] Roster synced: {store.import_json(args.json_file)}")
+    elif args.command == 'add':
+        store.add(TeamMember(args.name, args.role, args.skills or [], args.capacity))
+    elif args.command == 'update':
+        if not store.update(args.name, args.role, args.skills, args.capacity):
+            parser.error(f"no member named {args.name!r}")
+    elif args.command == 'remove':
+        print(f"[INFO] Removed {store.remove(args.names)} members")
+    else:
+        for member in store.members():
+            print(f"{member.name:<24} {member.role:<24} {', '.join(member.skills)}"
+                  + (f" (capacity {member.capacity})" if member.capacity is not None else ""))
+    if args.command != 'list':
+        store.build_indexes()
+        print(f"[INFO] {args.store}: revision {store.revision}, indexes up to date")
+    store.close()
@@ -0,0 +1,143 @@
+from collections import deque
+from datetime import date, timedelta
+from typing import Dict, List
+
+from deadlines import deadline_offset
+from utils import Task
+
+# Days a task is assumed to take when nothing says otherwise
+DEFAULT_DURATION_DAYS = 1
+
+SCHEDULE_COLUMNS = ['order', 'earliest_start', 'earliest_finish', 'latest_finish', 'slack_days', 'critical']
+
+
+class CycleError(ValueError):
+    """Tasks depend on each other in a loop, so there is no order to do them in"""
+
+    def __init__(self, cycle: List[int]):
+        self.cycle = cycle
+        super().__init__("Dependency cycle: " + " -> ".join(str(task_id) for task_id in cycle + cycle[:1]))
+
+
+class Scheduler:
+    """Dependency order and critical-path dates for a task list.
+
+    Everything is linear in tasks + dependencies: one Kahn pass for the
+    order (and cycle detection), a forward pass for earliest start/finish and
+    a backward pass that pushes each deadline back onto the prerequisites.
+    A task's latest_finish is its critical-path deadline: the day it must be
+    done for everything that depends on it to still meet its own deadline.
+    Critical tasks have no slack left (negative slack: already late).
+    """
+
+    def __init__(self, duration=DEFAULT_DURATION_DAYS, today: date = None):
+        self.duration = duration  # Days per task, or a function task -> days
+        self.today = today or date.today()
+
+    def order(self, tasks: List[Task]) -> List[int]:
+        """Task indexes with every task after its prerequisites (meeting order among equals)"""
+        ids = [task.id for task in tasks]
+        return self._order(ids, [task.dependencies for task in tasks])
+
+    @staticmethod
+    def _prerequisites(ids: List[int], dependencies: List) -> List[List[int]]:
+        """Dependency ids -> indexes (ids that are not in the list are ignored)"""
+        index_of = {task_id: index for index, task_id in enumerate(ids)}
+        return [[index_of[d] for d in required if d in index_of] for required in dependencies]
+
+    def _order(self, ids: List[int], dependencies: List) -> List[int]:
+        prerequisites = self._prerequisites(ids, dependencies)
+        dependents = [[] for _ in ids]
+        waiting = [0] * len(ids)
+        for index, required in enumerate(prerequisites):
+            for prerequisite in required:
+                dependents[prerequisite].append(index)
+                waiting[index] += 1
+
+        ready = deque(index for index in range(len(ids)) if waiting[index] == 0)
+        order = []
+        while ready:
+            index = ready.popleft()
+            order.append(index)
+            for dependent in dependents[index]:
+                waiting[dependent] -= 1
+                if waiting[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) < len(ids):
+            raise CycleError([ids[index] for index in self._find_cycle(prerequisites, waiting)])
+        return order
+
+    @staticmethod
+    def _find_cycle(prerequisites, waiting) -> List[int]:
+        """Walk unfinished prerequisites from a stuck task until one repeats"""
+        index = next(index for index, count in enumerate(waiting) if count > 0)
+        seen = {}
+        path = []
+        while index not in seen:
+            seen[index] = len(path)
+            path.append(index)
+            index = next(p for p in prerequisites[index] if waiting[p] > 0)
+        return path[seen[index]:][::-1]  # Prerequisite first
+
+    def schedule(self, tasks: List[Task]) -> Dict[int, Dict]:
+        """Task id -> order, earliest start/finish, latest finish, slack and critical flag.
+
+        Raises CycleError when the dependencies loop.
+        """
+        ids, dependencies, durations, due = [], [], [], []
+        for task in tasks:  # One pass, so a TaskBatch only builds each row once
+            ids.append(task.id)
+            dependencies.append(task.dependencies)
+            durations.append(self.duration(task) if callable(self.duration) else self.duration)
+            due.append(deadline_offset(task.deadline, self.today))
+        order = self._order(ids, dependencies)
+        prerequisites = self._prerequisites(ids, dependencies)
+
+        earliest_finish = [0] * len(ids)
+        for index in order:
+            start = max((earliest_finish[p] for p in prerequisites[index]), default=0)
+            earliest_finish[index] = start + durations[index]
+        horizon = max(earliest_finish, default=0)
+
+        # Backward pass: each deadline (or, without one, the end of the longest chain)
+        # moves back through the prerequisites
+        latest_finish = [horizon if days is None else days for days in due]
+        for index in reversed(order):
+            latest_start = latest_finish[index] - durations[index]
+            for prerequisite in prerequisites[index]:
+                latest_finish[prerequisite] = min(latest_finish[prerequisite], latest_start)
+
+        schedule = {}
+        for position, index in enumerate(order):
+            earliest_start = earliest_finish[index] - durations[index]
+            slack = latest_finish[index] - earliest_finish[index]
+            schedule[ids[index]] = {
+                'order': position + 1,
+                'earliest_start': (self.today + timedelta(days=earliest_start)).isoformat(),
+                'earliest_finish': (self.today + timedelta(days=earliest_finish[index])).isoformat(),
+                'latest_finish': (self.today + timedelta(days=latest_finish[index])).isoformat(),
+                'slack_days': slack,
+                'critical': slack <= 0,
+            }
+        return schedule
+
+    @staticmethod
+    def critical_path(tasks: List[Task], schedule: Dict[int, Dict]) -> List[int]:
+        """Ids of the longest dependency chain (the one that decides when everything is done).
+
+        Empty when no task depends on another: a lone task is not a chain.
+        """
+        dependencies = {task.id: task.dependencies for task in tasks}
+        if not any(dependencies.values()):
+            return []
+        task_id = max(dependencies, key=lambda i: (schedule[i]['earliest_finish'], -schedule[i]['order']))
+        path = [task_id]
+        while True:
+            start = schedule[task_id]['earliest_start']
+            previous = [d for d in dependencies[task_id] if d in schedule and schedule[d]['earliest_finish'] == start]
+            if not previous:
+                break
+            task_id = previous[0]
+            path.append(task_id)
+        return path[::-1]
@@ -0,0 +1,304 @@
+"""Service mode: the pipeline kept warm behind a local HTTP endpoint and/or a watched folder.
+
+    POST /meetings?name=standup.txt   body = transcript text or audio bytes
+                 [&date=YYYY-MM-DD]   -> the output JSON document (tasks, schedule, critical path)
+    GET  /health                      -> worker, queue and job counts
+
+Meetings run in the same warm worker pool as --batch (team, extractor,
+assigner index, tokenizer and speech backend loaded once per worker).
+"""
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, datetime
+from http import HTTPStatus
+from pathlib import Path
+from typing import Dict
+from urllib.parse import parse_qs, urlsplit
+
+from analytics import TaskArchive
+from batch import _worker, analyze_transcript, init_worker, process_meeting
+from pipeline import is_audio_file, load_transcript
+
+# Slow or stalled clients must not hold a connection (and its memory) forever
+READ_TIMEOUT = 30
+MAX_HEADER_LINES = 100
+
+
+def run_upload(data: bytes, name: str, chunked: bool = False, strategy: str = 'greedy',
+               solver_options: Dict = None, meeting_date: date = None) -> Dict:
+    """Worker side of POST /meetings: transcript text or audio bytes in, the output document out"""
+    if is_audio_file(name):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, os.path.basename(name))
+            with open(path, 'wb') as f:
+                f.write(data)
+            transcript = load_transcript(_worker['processor'], path, chunked=chunked, fallback_to_text=False)
+    else:
+        transcript = data.decode('utf-8', errors='ignore')
+
+    tasks, schedule, critical_path = analyze_transcript(transcript, strategy, solver_options, meeting_date)
+    documents = []
+    for task in tasks:
+        document = task.to_dict()
+        if schedule is not None:
+            document['schedule'] = schedule[task.id]
+        documents.append(document)
+    return {'generated_at': datetime.now().isoformat(), 'task_count': len(documents), 'tasks': documents,
+            'critical_path': critical_path}
+
+
+class BadRequest(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class MeetingService:
+    """Warm worker pool fed by HTTP requests and/or a watched folder.
+
+    Admission is bounded: `workers` meetings run at once and at most
+    `max_queue` more wait. Past that, HTTP requests are turned away with
+    503 + Retry-After (backpressure to the client) and the folder watcher
+    waits for a free slot before claiming its next file.
+    """
+
+    def __init__(self, team_file: str, workers: int = 2, max_queue: int = 8, executor: str = 'process',
+                 processor_options: Dict = None, chunked: bool = False, formats: str = 'all',
+                 strategy: str = 'greedy', solver_options: Dict = None, meeting_date: date = None,
+                 max_body_mb: float = 200, archive: str = None):
+        self.team_file = team_file
+        self.workers = workers
+        self.max_queue = max_queue
+        self.executor = executor
+        self.processor_options = processor_options
+        self.chunked = chunked
+        self.formats = formats
+        self.strategy = strategy
+        self.solver_options = solver_options
+        self.meeting_date = meeting_date  # None: uploads count deadlines from today, files from their recording
+        self.max_body_bytes = int(max_body_mb * 1024 * 1024)
+        # Every processed meeting is added here; appends run on the event loop, so there is one writer
+        self.archive = TaskArchive(archive) if archive else None
+
+        self.pool = None
+        self.server = None
+        self.running = 0
+        self.waiting = 0
+        self.stats = {'processed': 0, 'failed': 0, 'rejected': 0}
+        self._capacity = None
+        self._slots = None
+        self._background = set()
+
+    async def start(self, host: str = '127.0.0.1', port: int = None) -> int:
+        """Start the workers (and the HTTP listener when a port is given); returns the bound port"""
+        if self.executor == 'process':
+            self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker,
+                                            initargs=(self.team_file, self.processor_options))
+        else:
+            init_worker(self.team_file, self.processor_options)  # Threads share this process's warm state
+            self.pool = ThreadPoolExecutor(max_workers=self.workers)
+        self._capacity = asyncio.Semaphore(self.workers + self.max_queue)
+        self._slots = asyncio.Semaphore(self.workers)
+
+        if port is None:
+            return None
+        self.server = await asyncio.start_server(self._handle, host, port)
+        port = self.server.sockets[0].getsockname()[1]
+        print(f"[INFO] Serving on http://{host}:{port} ({self.workers} {self.executor} workers, "
+              f"queue {self.max_queue})")
+        return port
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        for task in list(self._background):
+            task.cancel()
+        if self.pool is not None:
+            self.pool.shutdown(wait=True, cancel_futures=True)
+
+    def health(self) -> Dict:
+        return {'status': 'ok', 'workers': self.workers, 'running': self.running, 'waiting': self.waiting,
+                'max_queue': self.max_queue, **self.stats}
+
+    async def _run(self, function, *args):
+        """Run one admitted job on the pool (the caller holds a capacity slot)"""
+        self.waiting += 1
+        async with self._slots:
+            self.waiting -= 1
+            self.running += 1
+            try:
+                return await asyncio.get_running_loop().run_in_executor(self.pool, function, *args)
+            finally:
+                self.running -= 1
+
+    # HTTP
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            try:
+                method, target, headers = await asyncio.wait_for(self._read_head(reader), READ_TIMEOUT)
+                status, document, extra = await self._route(method, target, headers, reader)
+            except BadRequest as e:
+                status, document, extra = e.status, {'error': str(e)}, {}
+            except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                return
+            self._respond(writer, status, document, extra)
+            await writer.drain()
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_head(reader: asyncio.StreamReader):
+        request_line = (await reader.readline()).decode('latin-1').split()
+        if len(request_line) != 3:
+            raise BadRequest(HTTPStatus.BAD_REQUEST, "Malformed request line")
+        headers = {}
+        for _ in range(MAX_HEADER_LINES):
+            line = (await reader.readline()).decode('latin-1').strip()
+            if not line:
+                return request_line[0], request_line[1], headers
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        raise BadRequest(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Too many headers")
+
+    async def _route(self, method: str, target: str, headers: Dict, reader: asyncio.StreamReader):
+        url = urlsplit(target)
+        if url.path == '/health':
+            if method != 'GET':
+                raise BadRequest(HTTPStatus.METHOD_NOT_ALLOWED, "Use GET /health")
+            return HTTPStatus.OK, self.health(), {}
+        if url.path != '/meetings':
+            raise BadRequest(HTTPStatus.NOT_FOUND, "Try POST /meetings or GET /health")
+        if method != 'POST':
+            raise BadRequest(HTTPStatus.METHOD_NOT_ALLOWED, "Use POST /meetings")
+
+        if 'content-length' not in headers:
+            raise BadRequest(HTTPStatus.LENGTH_REQUIRED, "Content-Length is required")
+        length = int(headers['content-length']) if headers['content-length'].isdigit() else -1
+        if length < 0:
+            raise BadRequest(HTTPStatus.BAD_REQUEST, "Bad Content-Length")
+        if length > self.max_body_bytes:
+            raise BadRequest(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"Body over {self.max_body_bytes} bytes")
+        query = parse_qs(url.query)
+        try:
+            meeting_date = date.fromisoformat(query['date'][0]) if 'date' in query else self.meeting_date
+        except ValueError:
+            raise BadRequest(HTTPStatus.BAD_REQUEST, "date must be YYYY-MM-DD")
+
+        # Turn the request away before reading the body, so an overloaded server stays cheap to ask
+        if self._capacity.locked():
+            self.stats['rejected'] += 1
+            return HTTPStatus.SERVICE_UNAVAILABLE, {'error': "Busy, retry later", **self.health()}, \
+                {'Retry-After': '1'}
+
+        async with self._capacity:
+            data = await asyncio.wait_for(reader.readexactly(length), READ_TIMEOUT)
+            name = query.get('name', [headers.get('x-filename', 'meeting.txt')])[0]
+            start = time.perf_counter()
+            try:
+                document = await self._run(run_upload, data, name, self.chunked, self.strategy,
+                                           self.solver_options, meeting_date)
+            except Exception as e:
+                self.stats['failed'] += 1
+                return HTTPStatus.UNPROCESSABLE_ENTITY, {'error': f"{type(e).__name__}: {e}"}, {}
+            self.stats['processed'] += 1
+            if self.archive is not None:
+                self.archive.add_meeting(name, meeting_date or date.today(), document['tasks'])
+            print(f"[INFO] {name}: {document['task_count']} tasks in {time.perf_counter() - start:.2f}s")
+            return HTTPStatus.OK, document, {}
+
+    @staticmethod
+    def _respond(writer: asyncio.StreamWriter, status: HTTPStatus, document: Dict, extra: Dict):
+        body = json.dumps(document, ensure_ascii=False).encode('utf-8')
+        head = [f"HTTP/1.1 {status.value} {status.phrase}", "Content-Type: application/json; charset=utf-8",
+                f"Content-Length: {len(body)}", "Connection: close"]
+        head += [f"{name}: {value}" for name, value in extra.items()]
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode('latin-1') + body)
+
+    # Watched folder
+
+    async def watch(self, inbox: str, output_dir: str, interval: float = 1.0):
+        """Process meetings dropped into `inbox`, then move them to inbox/done or inbox/failed.
+
+        A file is claimed once its size and mtime hold still for one poll
+        (so half-copied files are left alone) and only when a slot is free.
+        """
+        inbox = Path(inbox)
+        for folder in ('.processing', 'done', 'failed'):
+            (inbox / folder).mkdir(parents=True, exist_ok=True)
+        os.makedirs(output_dir, exist_ok=True)
+        print(f"[INFO] Watching {inbox} -> {output_dir}")
+
+        last_seen = {}
+        while True:
+            seen = {}
+            for entry in os.scandir(inbox):
+                path = Path(entry.path)
+                if entry.is_file() and not entry.name.startswith('.') and \
+                        (is_audio_file(path) or path.suffix.lower() == '.txt'):
+                    stat = entry.stat()
+                    seen[path] = (stat.st_size, stat.st_mtime_ns)
+
+            for path in sorted(seen):
+                if last_seen.get(path) != seen[path]:
+                    continue  # New or still growing
+                await self._capacity.acquire()
+                claimed = inbox / '.processing' / path.name
+                os.replace(path, claimed)
+                task = asyncio.create_task(self._process_file(claimed, inbox, output_dir))
+                self._background.add(task)
+                task.add_done_callback(self._background.discard)
+                del seen[path]
+
+            last_seen = seen
+            await asyncio.sleep(interval)
+
+    async def _process_file(self, path: Path, inbox: Path, output_dir: str):
+        try:
+            output = Path(output_dir) / f"{path.stem}.json"
+            suffix = 1
+            while output.exists():
+                output = Path(output_dir) / f"{path.stem}_{suffix}.json"
+                suffix += 1
+            result = await self._run(process_meeting, str(path), str(output), self.formats, self.chunked,
+                                     self.strategy, self.solver_options, self.meeting_date)
+        except Exception as e:
+            result = {'status': 'failed', 'error': f"{type(e).__name__}: {e}"}
+        finally:
+            self._capacity.release()
+
+        if result['status'] == 'ok':
+            self.stats['processed'] += 1
+            if self.archive is not None:
+                self.archive.add_meeting(path.name, date.fromisoformat(result['meeting_date']), result['tasks'])
+            print(f"[INFO] {path.name}: {result['task_count']} tasks -> {result['output']}")
+        else:
+            self.stats['failed'] += 1
+            print(f"[WARN] {path.name}: FAILED ({result['error']})")
+        shutil.move(str(path), str(inbox / ('done' if result['status'] == 'ok' else 'failed') / path.name))
+
+
+def run_service(team_file: str, host: str = '127.0.0.1', port: int = None, watch: str = None,
+                output_dir: str = 'service_output', interval: float = 1.0, **options):
+    """Run until interrupted (Ctrl+C)"""
+    async def serve():
+        service = MeetingService(team_file, **options)
+        await service.start(host, port)
+        try:
+            if watch:
+                await service.watch(watch, output_dir, interval)
+            else:
+                await service.server.serve_forever()
+        finally:
+            await service.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        print("\n[INFO] Service stopped")
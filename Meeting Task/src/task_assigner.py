@@ -1,38 +1,168 @@
-from typing import List, Dict
-import re
+from typing import List
+import numpy as np
+from profiling import count, hot
+from utils import KeywordMatcher, Task, TaskBatch
+
+# Scoring weights (score is capped at MAX_SCORE)
+SKILL_POINTS = 25
+ROLE_POINTS = 10
+ROLE_BONUS_POINTS = 15
+MAX_SCORE = 100
+
+# Cells per scoring batch (tasks x members), keeps the score matrix small
+BATCH_CELLS = 2_000_000
 
 class TaskAssigner:
-    def __init__(self, team_members):
-        """Initialize with team members for smart matching"""
+    # Role-specific action words (role key found in role -> keywords that earn the bonus)
+    ROLE_BONUSES = {
+        'frontend': ['react', 'ui', 'javascript', 'frontend', 'bug'],
+        'backend': ['database', 'api', 'performance', 'backend', 'server'],
+        'designer': ['design', 'ui/ux', 'figma', 'mobile design'],
+        'qa': ['test', 'testing', 'quality', 'qa']
+    }
+
+    # Everything _build_index derives from the roster (what a RosterStore saves)
+    INDEX_FIELDS = ('_names', '_base_points', '_points', '_bonus', '_matcher')
+
+    def __init__(self, team_members, index=None):
+        """Initialize with team members for smart matching (index: a saved index_state() of this roster)"""
         self.team_members = team_members
+        if index is None:
+            self._build_index()
+        else:
+            for field in self.INDEX_FIELDS:
+                setattr(self, field, index[field])
+
+    def index_state(self):
+        """The prebuilt lookup structures, to save and pass back as TaskAssigner(team, index=...)"""
+        return {field: getattr(self, field) for field in self.INDEX_FIELDS}
+
+    def _build_index(self):
+        """Inverted index: phrase -> (members that have it, points each one earns)"""
+        self._names = np.array([member.name for member in self.team_members] + ["Unassigned"], dtype=object)
+        self._base_points = np.zeros(len(self.team_members), dtype=np.int64)
+
+        points = {}   # phrase -> {member index: skill/role points}
+        bonus = {}    # phrase -> member indexes that get the role bonus
+        for index, member in enumerate(self.team_members):
+            for skill in member.skills:
+                skill = skill.lower()
+                if not skill:
+                    self._base_points[index] += SKILL_POINTS  # '' is "in" every text
+                    continue
+                member_points = points.setdefault(skill, {})
+                member_points[index] = member_points.get(index, 0) + SKILL_POINTS
+
+            role = member.role.lower()
+            for keyword in role.split():
+                member_points = points.setdefault(keyword, {})
+                member_points[index] = member_points.get(index, 0) + ROLE_POINTS
+
+            for role_key, keywords in self.ROLE_BONUSES.items():
+                if role_key in role:
+                    for keyword in keywords:
+                        bonus.setdefault(keyword, set()).add(index)
+
+        self._points = {phrase: (np.fromiter(members, dtype=np.int64), np.fromiter(members.values(), dtype=np.int64))
+                        for phrase, members in points.items()}
+        self._bonus = {phrase: np.fromiter(sorted(members), dtype=np.int64) for phrase, members in bonus.items()}
+        self._matcher = KeywordMatcher({('phrase', phrase): [phrase] for phrase in set(points) | set(bonus)})
     
-    def assign_tasks(self, tasks: List[Dict]) -> List[Dict]:
-        """Assign unassigned tasks based on skills and keywords"""
+    @hot('TaskAssigner.assign_tasks')
+    def assign_tasks(self, tasks: List[Task], strategy: str = 'greedy', **solver_options) -> List[Task]:
+        """Assign unassigned tasks based on skills and keywords.
+
+        strategy='greedy' gives each task its best match independently;
+        strategy='balanced' solves all open tasks together, respecting member
+        capacity, load, priority, deadlines and dependencies (see AssignmentSolver).
+        """
         print("[INFO] Smart assignment starting...")
         
-        for task in tasks:
-            if not task.get('assigned_to'):
-                assigned = self._find_best_match(task)
-                task['assigned_to'] = assigned
-                print(f"  Assigned Task {task['id']}: {assigned}")
+        if strategy == 'balanced':
+            from assignment_solver import AssignmentSolver
+            assignments = AssignmentSolver(self, **solver_options).solve(tasks)
+            unassigned = sorted(assignments)
+            best = [assignments[i] for i in unassigned]
+        else:
+            unassigned = [i for i, task in enumerate(tasks) if not task.assigned_to]
+            best = self._best_matches([tasks[i].description for i in unassigned])
+
+        columnar = isinstance(tasks, TaskBatch)  # Its rows are built on access, so write the column
+        for index, assigned in zip(unassigned, best):
+            task = tasks[index]
+            task.assigned_to = assigned
+            if columnar:
+                tasks.set_assignee(index, assigned)
+            print(f"  Assigned Task {task.id}: {assigned}")
+        count('auto_assigned', len(unassigned))
         
         print(" All tasks assigned!")
         return tasks
+
+    def assign_task(self, task: Task) -> Task:
+        """Assign a single task if nobody was named for it"""
+        if not task.assigned_to:
+            assigned = self._find_best_match(task)
+            task.assigned_to = assigned
+            print(f"  Assigned Task {task.id}: {assigned}")
+        return task
+
+    def iter_assign(self, tasks):
+        """Assign tasks one at a time as they stream in"""
+        for task in tasks:
+            yield self.assign_task(task)
     
-    def _find_best_match(self, task: Dict) -> str:
+    def _find_best_match(self, task: Task) -> str:
         """Find best team member using skill matching"""
-        description = task['description'].lower()
-        best_member = None
-        best_score = 0
-        
-        for member in self.team_members:
-            score = self._calculate_match_score(description, member)
-            
-            if score > best_score:
-                best_score = score
-                best_member = member.name
-        
-        return best_member or "Unassigned"
+        return self._best_matches([task.description])[0]
+
+    @hot('TaskAssigner._best_matches')
+    def _best_matches(self, descriptions: List[str]) -> List[str]:
+        """Best member per description (first highest scorer, "Unassigned" if all score 0)"""
+        if not descriptions:
+            return []
+        if not self.team_members:
+            return ["Unassigned"] * len(descriptions)
+
+        matches = []
+        batch_size = max(1, BATCH_CELLS // len(self.team_members))
+        for start in range(0, len(descriptions), batch_size):
+            scores = self.score_matrix(descriptions[start:start + batch_size])
+            best = scores.argmax(axis=1)  # argmax keeps the first member on ties, like the old loop
+            best[scores[np.arange(len(best)), best] <= 0] = len(self.team_members)
+            matches.extend(self._names[best].tolist())
+        return matches
+
+    @hot('TaskAssigner.score_matrix')
+    def score_matrix(self, descriptions: List[str]) -> np.ndarray:
+        """Task x member match scores (0-100) for a batch of task descriptions"""
+        member_count = len(self.team_members)
+        rows, cols, weights = [], [], []
+        bonus_rows, bonus_cols = [], []
+
+        for row, description in enumerate(descriptions):
+            for phrase in self._matcher.found(description.lower()).get('phrase', ()):
+                if phrase in self._points:
+                    members, points = self._points[phrase]
+                    rows.append(np.full(len(members), row, dtype=np.int64))
+                    cols.append(members)
+                    weights.append(points)
+                if phrase in self._bonus:
+                    members = self._bonus[phrase]
+                    bonus_rows.append(np.full(len(members), row, dtype=np.int64))
+                    bonus_cols.append(members)
+
+        cells = len(descriptions) * member_count
+        scores = np.zeros(cells, dtype=np.int64)
+        if rows:
+            flat = np.concatenate(rows) * member_count + np.concatenate(cols)
+            scores += np.bincount(flat, weights=np.concatenate(weights), minlength=cells).astype(np.int64)
+        if bonus_rows:
+            flat = np.concatenate(bonus_rows) * member_count + np.concatenate(bonus_cols)
+            scores[np.unique(flat)] += ROLE_BONUS_POINTS  # Bonus counts once per member
+
+        scores = scores.reshape(len(descriptions), member_count) + self._base_points
+        return np.minimum(scores, MAX_SCORE)
     
     def _calculate_match_score(self, task_text: str, member) -> int:
         """Calculate skill/role match score (0-100)"""
@@ -41,34 +171,27 @@ class TaskAssigner:
         # Match skills (high weight)
         for skill in member.skills:
             if skill.lower() in task_text:
-                score += 25  # Each skill match = 25 points
+                score += SKILL_POINTS  # Each skill match = 25 points
         
         # Match role keywords
         role_keywords = member.role.lower().split()
         for keyword in role_keywords:
             if keyword in task_text:
-                score += 10
+                score += ROLE_POINTS
         
         # Bonus for action words matching role
         action_role_bonus = self._get_action_role_bonus(task_text, member.role.lower())
         score += action_role_bonus
         
-        return min(score, 100)  # Cap at 100
+        return min(score, MAX_SCORE)  # Cap at 100
     
     def _get_action_role_bonus(self, task_text: str, role: str) -> int:
         """Bonus points for role-specific actions"""
-        bonuses = {
-            'frontend': ['react', 'ui', 'javascript', 'frontend', 'bug'],
-            'backend': ['database', 'api', 'performance', 'backend', 'server'],
-            'designer': ['design', 'ui/ux', 'figma', 'mobile design'],
-            'qa': ['test', 'testing', 'quality', 'qa']
-        }
-        
-        for role_key, keywords in bonuses.items():
+        for role_key, keywords in self.ROLE_BONUSES.items():
             if role_key in role:
                 for keyword in keywords:
                     if keyword in task_text:
-                        return 15
+                        return ROLE_BONUS_POINTS
         return 0
 
 # Test the assigner
@@ -82,34 +205,10 @@ if __name__ == "__main__":
     # Sample tasks (some assigned, some not)
     # Sample tasks (FULL structure with all fields)
     sample_tasks = [
-        {
-            'id': 1,
-            'description': 'Sakshi, fix the critical login bug - React component issue',
-            'assigned_to': 'Sakshi',
-            'priority': 'Critical',    
-            'deadline': '2025-11-30'
-        },
-        {
-            'id': 2,
-            'description': 'Optimize database performance and API calls',
-            'assigned_to': None,
-            'priority': 'High',        
-            'deadline': '2025-12-03'
-        },
-        {
-            'id': 3,
-            'description': 'Design new onboarding screens in Figma',
-            'assigned_to': None,
-            'priority': 'Medium',      
-            'deadline': '2025-12-01'
-        },
-        {
-            'id': 4,
-            'description': 'Write unit tests for payment module',
-            'assigned_to': None,
-            'priority': 'Medium',       
-            'deadline': '2025-12-03'
-        }
+        Task(1, 'Sakshi, fix the critical login bug - React component issue', 'Sakshi', 'Critical', '2025-11-30'),
+        Task(2, 'Optimize database performance and API calls', None, 'High', '2025-12-03'),
+        Task(3, 'Design new onboarding screens in Figma', None, 'Medium', '2025-12-01'),
+        Task(4, 'Write unit tests for payment module', None, 'Medium', '2025-12-03'),
     ]
 
     
@@ -118,7 +217,6 @@ if __name__ == "__main__":
     
     print("\n FINAL ASSIGNMENTS:")
     for task in assigned_tasks:
-        print(f"Task {task['id']}: {task['description'][:50]}...")
-        priority = task.get('priority', 'Medium')
-        print(f"  👤 {task['assigned_to']} | {priority}")
+        print(f"Task {task.id}: {task.description[:50]}...")
+        print(f"  👤 {task.assigned_to} | {task.priority}")
         print()
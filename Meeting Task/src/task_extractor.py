@@ -1,17 +1,269 @@
+import copy
 import re
-import nltk
-from nltk.tokenize import sent_tokenize
-from typing import List, Dict
-from datetime import datetime, timedelta
+from collections import Counter, deque
+from itertools import chain, groupby
+from operator import itemgetter
+from typing import List, Dict, Tuple
+from datetime import date
+from deadlines import RELATIVE_DATES, DeadlineResolver
+from profiling import count, hot, stage
+from utils import KeywordMatcher, Task, TaskBatch
+
+# NLTK takes longer to import than the rest of the pipeline; it is loaded on the
+# first sentence split and never downloads anything by itself
+_sentence_splitter = None
+SIMPLE_SENTENCE_BREAK = re.compile(r'(?<=[.!?])\s+')
+
+# Text held back this long without a sentence end is let through as is, so
+# unpunctuated input (raw recognizer output) cannot grow the carry-over without bound
+MAX_SENTENCE_CHARS = 20_000
+
+
+def _simple_sent_tokenize(text: str) -> List[str]:
+    """Split after . ! ? followed by whitespace (used when punkt is not installed)"""
+    return [sentence for sentence in SIMPLE_SENTENCE_BREAK.split(text.strip()) if sentence]
+
+
+def _load_sentence_splitter():
+    try:
+        from nltk.tokenize import sent_tokenize as punkt_tokenize
+        punkt_tokenize("Load the punkt model.")  # Raises LookupError when the data is missing
+        return punkt_tokenize
+    except (ImportError, LookupError):
+        print("[WARN] NLTK punkt data not found, using a simple sentence splitter "
+              "(install it with: python -m nltk.downloader punkt)")
+        return _simple_sent_tokenize
+
+
+def sent_tokenize(text: str) -> List[str]:
+    """Split text into sentences with NLTK punkt, loaded on first use"""
+    global _sentence_splitter
+    if _sentence_splitter is None:
+        _sentence_splitter = _load_sentence_splitter()
+    return _sentence_splitter(text)
+
+
+REASON_PATTERNS = [re.compile(r'(blocking|because|since|as)\s+([^\.]+)'), re.compile(r'affecting\s+([^\.]+)')]
+
+# "Sakshi: ..." / "Speaker 2: ..." at the start of a line says who is talking
+SPEAKER_LINE = re.compile(r"^[ \t]*([A-Z][\w'.-]*(?: [A-Z0-9][\w'.-]*){0,2}):[ \t]+", re.M)
+NON_EMPTY_LINE = re.compile(r"^[ \t]*\S", re.M)
+SECOND_PERSON = re.compile(r"\b(?:you|your|you're|you'll)\b")
+FIRST_PERSON = re.compile(r"\b(?:i'll|i will|i can|i'm going to|i am going to|let me)\b")
+SELF_INTRO = re.compile(r"\b(?:i'm|i am|this is|it's)\s+([a-z][\w'-]*)")
+# Replies that take on the task just mentioned
+CLAIM = re.compile(r"\b(?:i'll (?:take|do|handle) (?:it|that|this)|i'll take care of (?:it|that|this)"
+                   r"|i can (?:do|take|handle) (?:it|that|this)|i'm on it|leave it (?:to|with) me|i've got (?:it|this))\b")
+
+# "Lata, write the payment tests after the login fix." / "This depends on the API work."
+DEPENDENCY_CUE = re.compile(r"\b(depends on|dependent on|blocked by|waiting (?:on|for)|relies on|requires|after|once)\s+")
+# "after" / "once" also start plain scheduling phrases ("after the meeting", "once a week"), so they only
+# link a task when the reference says it must be finished or closely matches an earlier task
+LOOSE_CUES = frozenset(['after', 'once'])
+COMPLETION = re.compile(r"\b(?:is|are|gets?|has been|have been|being)\s+"
+                        r"(?:done|fixed|finished|completed?|merged|ready|deployed|shipped|resolved|in)\b")
+# Dice similarity between a loose reference and the task's description words needed to link them
+LOOSE_SIMILARITY = 0.5
+ANAPHORA = re.compile(r"^\W*(?:this|that|it|these|those)\b")
+REFERENCE_END = re.compile(r"[,;:!?]|\.(?:\s|$)|\s(?:so|but|and then)\s")
+WORD = re.compile(r"[a-z][a-z0-9]+")
+# Words that say nothing about which task is meant
+REFERENCE_STOPWORDS = frozenset("""
+    the a an this that these those it its our your their his her my we you they someone everyone
+    be being been is are was were get gets got done finished completed complete ready merged first
+    to of on in for with by from at as before after once then so and or but
+    need needs should must can could will would let lets let's have has had new
+    work thing things stuff task tasks part piece item
+""".split())
+
+
+def _stem(word: str) -> str:
+    """Crude suffix stripping, so "fixes"/"fixing"/"fixed" all index as "fix" """
+    for suffix in ('ing', 'ed', 'es', 's'):
+        if word.endswith(suffix) and len(word) > len(suffix) + 2:
+            return word[:-len(suffix)]
+    return word
+
+
+_word_stems = {}  # word -> stem ('' for stopwords); a meeting's vocabulary is small
+
+
+def content_words(text_lower: str) -> List[str]:
+    stems = []
+    for word in WORD.findall(text_lower):
+        stem = _word_stems.get(word)
+        if stem is None:
+            stem = _word_stems[word] = '' if word in REFERENCE_STOPWORDS else _stem(word)
+        if stem:
+            stems.append(stem)
+    return stems
+
+
+class DependencyIndex:
+    """Inverted index (word -> recent task ids) over the tasks extracted so far.
+
+    A reference like "the login bug fix" is resolved by counting shared words
+    with earlier tasks through the index, so each lookup touches only the
+    postings of its own few words instead of comparing every pair of tasks.
+    Each posting list keeps the latest max_postings tasks, which bounds a lookup
+    even for words that appear in every task.
+    """
+
+    def __init__(self, max_postings: int = 64):
+        self.max_postings = max_postings
+        self.postings = {}
+        self.sizes = {}  # Task id -> distinct content words in its description
+        self._pending = []  # Tasks not indexed yet: meetings without references never pay for it
+
+    def add(self, task_id: int, description_lower: str):
+        self._pending.append((task_id, description_lower))
+
+    def _index_pending(self):
+        for task_id, description_lower in self._pending:
+            words = set(content_words(description_lower))
+            self.sizes[task_id] = len(words)
+            for word in words:
+                ids = self.postings.get(word)
+                if ids is None:
+                    ids = self.postings[word] = deque(maxlen=self.max_postings)
+                ids.append(task_id)
+        self._pending.clear()
+
+    def resolve(self, reference_lower: str, exclude: int = None, strict: bool = False) -> int:
+        """Earlier task the reference names (most shared words, most recent on ties), or None.
+
+        strict (loose cues): one shared word is only enough when the reference is
+        close to the task's whole description (Dice similarity >= LOOSE_SIMILARITY).
+        """
+        self._index_pending()
+        words = set(content_words(reference_lower))
+        scores = Counter()
+        for word in words:
+            scores.update(self.postings.get(word, ()))
+        scores.pop(exclude, None)
+        if not scores:
+            return None
+        task_id, score = max(scores.items(), key=lambda item: (item[1], item[0]))
+        if score < min(2, len(words)):
+            return None
+        if strict and score < 2 and 2 * score / (len(words) + self.sizes[task_id]) < LOOSE_SIMILARITY:
+            return None
+        return task_id
+
+
+def _consistently_labelled(transcript: str, matches) -> bool:
+    """Whether label matches make a conversation rather than a few "Agenda:" / "Note:" lines.
+
+    Most non-empty lines must be labelled, or at least two labels must each come back.
+    """
+    if len(matches) < 2:
+        return False
+    if 2 * len(matches) >= len(NON_EMPTY_LINE.findall(transcript)):
+        return True
+    return sum(uses > 1 for uses in Counter(match.group(1) for match in matches).values()) >= 2
+
+
+def speaker_lines(transcript: str) -> List[Tuple[str, str]]:
+    """(speaker, text) per labelled line, or [] when the transcript is not speaker-labelled"""
+    matches = list(SPEAKER_LINE.finditer(transcript))
+    if not _consistently_labelled(transcript, matches):
+        return []
+    turns = []
+    preamble = transcript[:matches[0].start()].strip()
+    if preamble:
+        turns.append((None, preamble))
+    for match, following in zip(matches, matches[1:] + [None]):
+        text = transcript[match.end():following.start() if following else len(transcript)].strip()
+        if text:
+            turns.append((match.group(1), text))
+    return turns
+
+
+def iter_speaker_turns(blocks):
+    """speaker_lines for text arriving in blocks: (speaker, text) pieces in order.
+
+    A long turn may come out in several pieces, each after the first starting
+    with its line break. Labels only count at the start of a line, so each
+    block's last partial line waits for the next block.
+    """
+    speaker, pending = None, ""
+    for block in chain(blocks, [None]):
+        text = pending + (block or "")
+        cut = len(text) if block is None else text.rfind('\n')
+        if cut <= 0:
+            if len(text) < MAX_SENTENCE_CHARS:
+                pending = text
+                continue
+            cut = len(text)
+        text, pending = text[:cut], text[cut:]
+        position = 0
+        for match in SPEAKER_LINE.finditer(text):
+            if text[position:match.start()].strip():
+                yield speaker, text[position:match.start()]
+            speaker, position = match.group(1), match.end()
+        if text[position:].strip():
+            yield speaker, text[position:]
+
+
+class SpeakerContext:
+    """Who is talking to whom over the last few sentences (a bounded window, never the whole meeting).
+
+    Speaker labels are tied to roster names when the label is a name ("Sakshi:"),
+    the speaker introduces themselves ("this is Mohit") or answers right after
+    being addressed by name ("Sakshi, can you ...?" followed by a new voice).
+    """
+
+    def __init__(self, names, window: int = 6):
+        self.roster = {name.lower(): name for name in names}
+        self.speaker_names = {}  # speaker label -> roster name
+        self.recent = deque(maxlen=window)  # (speaker, roster name addressed or None)
+
+    def observe(self, speaker, sentence_lower: str, mentioned: str = None):
+        """Record one sentence and the team member it names, if any"""
+        self._learn(speaker, sentence_lower)
+        addressed = None
+        if mentioned and (sentence_lower.startswith(mentioned.lower()) or SECOND_PERSON.search(sentence_lower)):
+            addressed = mentioned
+        self.recent.append((speaker, addressed))
+
+    def _learn(self, speaker, sentence_lower: str):
+        if speaker is None or speaker in self.speaker_names:
+            return
+        name = self.roster.get(speaker.lower())
+        if name is None:
+            intro = SELF_INTRO.search(sentence_lower)
+            name = self.roster.get(intro.group(1)) if intro else None
+        if name is None and self.recent:
+            last_speaker, last_addressed = self.recent[-1]
+            if last_speaker not in (None, speaker) and last_addressed not in self.speaker_names.values():
+                name = last_addressed
+        if name:
+            self.speaker_names[speaker] = name
+
+    def me(self, speaker) -> str:
+        return self.speaker_names.get(speaker)
+
+    def you(self, speaker) -> str:
+        """Whom the speaker is talking to: the last person they named, else the last other known voice"""
+        for other, addressed in reversed(self.recent):
+            if other == speaker and addressed:
+                return addressed
+        for other, _ in reversed(self.recent):
+            if other not in (None, speaker) and other in self.speaker_names:
+                return self.speaker_names[other]
+        return None
+
+    def resolve(self, speaker, sentence_lower: str) -> str:
+        """Team member meant by "I'll ..." / "can you ..." in a task sentence"""
+        if FIRST_PERSON.search(sentence_lower):
+            return self.me(speaker)
+        if SECOND_PERSON.search(sentence_lower):
+            return self.you(speaker)
+        return None
 
-# Download NLTK data if missing
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
 
 class TaskExtractor:
-    def __init__(self):
+    def __init__(self, meeting_date: date = None):
         # Action keywords to identify tasks
         self.action_keywords = [
             'fix', 'build', 'create', 'design', 'optimize', 'update', 
@@ -27,97 +279,296 @@ class TaskExtractor:
             'Low': ['low', 'later', 'backlog']
         }
         
-        # Deadline patterns
-        self.deadline_patterns = [
-            ('tomorrow', 1),
-            ('today', 0),
-            ('tonight', 0),
-            ('end of this week', 4),
-            ('end of week', 4),
-            ('friday', 'Friday'),
-            ('wednesday', 'Wednesday'),
-            ('monday', 'Monday'),
-            ('next monday', 'Next Monday')
-        ]
+        # Deadline phrases resolve to dates counted from the meeting day (see deadlines.py)
+        self.deadlines = DeadlineResolver(meeting_date)
+
+        # Compiled matchers per team roster object (names are part of the vocabulary)
+        self._matchers = {}
+
+        # Sentences of speaker context used to resolve "you" / "I'll take it"
+        self.context_window = 6
     
-    def extract_tasks(self, transcript: str, team_members) -> List[Dict]:
-        """Extract tasks from meeting transcript"""
-        sentences = sent_tokenize(transcript)
-        tasks = []
-        task_id = 1
-        
-        print(f"[INFO] Analyzing {len(sentences)} sentences...")
-        
-        for sentence in sentences:
-            if self._is_task_sentence(sentence):
-                task = self._parse_task(sentence, team_members, task_id)
-                if task:
-                    tasks.append(task)
-                    task_id += 1
-        
+    def for_meeting(self, meeting_date: date) -> 'TaskExtractor':
+        """This extractor with deadlines counted from another day (compiled matchers are shared)"""
+        extractor = copy.copy(self)
+        extractor.deadlines = DeadlineResolver(meeting_date)
+        return extractor
+
+    @hot('TaskExtractor.extract_tasks')
+    def extract_tasks(self, transcript: str, team_members, columnar: bool = False) -> List[Task]:
+        """Extract tasks from meeting transcript (as a TaskBatch with columnar)"""
+        with stage('sentence_split'):
+            turns = speaker_lines(transcript)
+            if turns:
+                sentences = [(speaker, sentence) for speaker, text in turns for sentence in sent_tokenize(text)]
+            else:
+                sentences = sent_tokenize(transcript)
+        count('sentences', len(sentences))
+
+        if turns:
+            speakers = {speaker for speaker, _ in turns if speaker}
+            count('speakers', len(speakers))
+            print(f"[INFO] Analyzing {len(sentences)} sentences from {len(speakers)} speakers...")
+        else:
+            print(f"[INFO] Analyzing {len(sentences)} sentences...")
+        with stage('classify'):
+            if turns:
+                tasks = self.iter_speaker_tasks(sentences, team_members)
+            else:
+                tasks = self.iter_tasks(sentences, team_members)
+            tasks = TaskBatch(tasks) if columnar else list(tasks)
+        count('tasks', len(tasks))
+
         print(f" Extracted {len(tasks)} tasks!")
         return tasks
-    
+
+    @hot('TaskExtractor.extract_tasks_from_blocks')
+    def extract_tasks_from_blocks(self, blocks, team_members, columnar: bool = False) -> List[Task]:
+        """extract_tasks for a transcript read block by block (see pipeline.iter_text_blocks).
+
+        Sentences are counted as they are split, but splitting runs interleaved
+        with classification, one block at a time, so its time is part of the
+        classify stage rather than a sentence_split stage of its own.
+        """
+        print("[INFO] Analyzing transcript block by block...")
+        with stage('classify'):
+            tasks = self.iter_block_tasks(blocks, team_members)
+            tasks = TaskBatch(tasks) if columnar else list(tasks)
+        count('tasks', len(tasks))
+
+        print(f" Extracted {len(tasks)} tasks!")
+        return tasks
+
+    def iter_block_tasks(self, blocks, team_members, start_id: int = 1):
+        """Yield tasks from transcript text blocks, splitting sentences as the blocks arrive.
+
+        Only about one block is held at a time, whatever the transcript size.
+        The transcript counts as speaker-labelled when its first block is.
+        """
+        blocks = iter(blocks)
+        first = next(blocks, "")
+        blocks = chain([first], blocks)
+        if not speaker_lines(first):
+            yield from self.iter_tasks(self.iter_sentences(blocks), team_members, start_id)
+            return
+        # Pieces of one speaker's turn (or consecutive turns) are split together
+        turns = ((speaker, sentence) for speaker, pieces in groupby(iter_speaker_turns(blocks), key=itemgetter(0))
+                 for sentence in self.iter_sentences(text for _, text in pieces))
+        yield from self.iter_speaker_tasks(turns, team_members, start_id)
+
+    def iter_tasks(self, sentences, team_members, start_id: int = 1):
+        """Yield tasks one sentence at a time (streaming mode).
+
+        The latest task is held until the next one is found (or context_window
+        sentences pass), since a follow-up like "This depends on ..." still adds to it.
+        """
+        index = DependencyIndex()
+        held = None  # (sentence number, task)
+        task_id = start_id
+        for number, sentence in enumerate(sentences):
+            found = self._scan(sentence, team_members)
+            task = self._parse_task(sentence, team_members, task_id, found) if 'action' in found else None
+            sentence_lower = sentence.lower()
+            self._link_dependencies(sentence_lower, task, held[1] if held else None, index)
+            if task:
+                index.add(task.id, sentence_lower)
+                if held:
+                    yield held[1]
+                held = (number, task)
+                task_id += 1
+            elif held and number - held[0] >= self.context_window:
+                yield held[1]
+                held = None
+        if held:
+            yield held[1]
+
+    @staticmethod
+    def _link_dependencies(sentence_lower: str, task, previous, index: DependencyIndex):
+        """Add the earlier task a "depends on / after / blocked by ..." clause names.
+
+        The clause belongs to the sentence's own task, or to the previous task
+        when the sentence is not one or starts with "This/It ...". The first
+        clause that resolves wins.
+        """
+        for cue in DEPENDENCY_CUE.finditer(sentence_lower):
+            dependent = previous if task is None or ANAPHORA.match(sentence_lower[:cue.start()]) else task
+            if dependent is None:
+                continue
+            reference = REFERENCE_END.split(sentence_lower[cue.end():], 1)[0]
+            strict = cue.group(1) in LOOSE_CUES and not COMPLETION.search(reference)
+            target = index.resolve(reference, exclude=dependent.id, strict=strict)
+            if target is not None:
+                if target not in dependent.dependencies:
+                    dependent.dependencies += (target,)
+                return
+
+    def iter_speaker_tasks(self, turns, team_members, start_id: int = 1):
+        """Yield tasks from (speaker, sentence) pairs, resolving "you" / "I" to team members.
+
+        Only the last context_window sentences are consulted, and each task is
+        held back for that many sentences so a reply like "I'll take it" can
+        still claim it.
+        """
+        context = SpeakerContext([member.name for member in team_members or ()], self.context_window)
+        index = DependencyIndex()
+        held = deque()  # [sentence number, task, speaker who took it on]; the name may only be learned later
+        task_id = start_id
+        for number, (speaker, sentence) in enumerate(turns):
+            found = self._scan(sentence, team_members)
+            sentence_lower = sentence.lower()
+            context.observe(speaker, sentence_lower, self._extract_person(sentence, team_members, found))
+
+            task = self._parse_task(sentence, team_members, task_id, found) if 'action' in found else None
+            self._link_dependencies(sentence_lower, task, held[-1][1] if held else None, index)
+            if task:
+                owner = None
+                if task.assigned_to is None:
+                    task.assigned_to = context.resolve(speaker, sentence_lower)
+                    owner = speaker if FIRST_PERSON.search(sentence_lower) else None
+                index.add(task.id, sentence_lower)
+                held.append([number, task, owner])
+                task_id += 1
+            elif CLAIM.search(sentence_lower):
+                for entry in reversed(held):
+                    if entry[1].assigned_to is None:
+                        entry[1].assigned_to, entry[2] = context.me(speaker), speaker
+                        break
+
+            while held and held[0][0] <= number - self.context_window:
+                yield self._release(held.popleft(), context)
+        while held:
+            yield self._release(held.popleft(), context)
+
+    @staticmethod
+    def _release(entry, context: SpeakerContext) -> Task:
+        """A held task leaves the window: name its owner if their name is known by now"""
+        _, task, owner = entry
+        if task.assigned_to is None and owner is not None:
+            task.assigned_to = context.me(owner)
+        return task
+
+    def iter_sentences(self, texts, carry_incomplete: bool = True):
+        """Split a stream of transcript pieces into sentences.
+
+        With carry_incomplete, the last sentence of each piece is held back and
+        split again together with the next piece, so sentences split across
+        pieces (lines, paragraphs, file blocks) come out whole, and a block that
+        happens to end on "Dr." or "v2." does not cut a sentence short.
+        """
+        pending = ""
+        for text in texts:
+            if pending and text[:1].isspace():
+                pending += text.rstrip()  # The piece brings its own separator (file blocks)
+            else:
+                pending = f"{pending} {text.strip()}" if pending else text.strip()
+            if not pending:
+                continue
+
+            sentences = sent_tokenize(pending)
+            pending = ""
+            if carry_incomplete and sentences and len(sentences[-1]) < MAX_SENTENCE_CHARS:
+                pending = sentences.pop()
+            count('sentences', len(sentences))
+            yield from sentences
+
+        if pending:
+            sentences = sent_tokenize(pending)
+            count('sentences', len(sentences))
+            yield from sentences
+
+    def _matcher(self, team_members) -> KeywordMatcher:
+        """Action, priority, deadline and team-name vocabularies as one compiled matcher"""
+        if team_members is None:
+            team_members = ()  # Shared empty roster, so it caches like any other
+        cached = self._matchers.get(id(team_members))
+        if cached and cached[0] is team_members and len(cached[1]) == len(team_members):
+            return cached[2]
+
+        names = {}  # name -> roster position (first mention wins ties, as before)
+        for member in team_members:
+            names.setdefault(member.name, len(names))
+
+        vocabularies = {('action', keyword): [keyword] for keyword in self.action_keywords}
+        for priority, keywords in self.priority_keywords.items():
+            vocabularies[('priority', priority)] = keywords
+        for phrase in RELATIVE_DATES:
+            vocabularies[('deadline', phrase)] = [phrase]
+        for name in names:
+            vocabularies[('person', name)] = [name]
+
+        matcher = KeywordMatcher(vocabularies)
+        self._matchers[id(team_members)] = (team_members, names, matcher)
+        return matcher
+
+    def matcher_state(self, team_members):
+        """The compiled matcher for a roster, to save and pass back to use_matcher"""
+        self._matcher(team_members)
+        return self._matchers[id(team_members)][1:]
+
+    def use_matcher(self, team_members, state):
+        """Adopt a saved matcher_state for this roster instead of compiling it"""
+        names, matcher = state
+        self._matchers[id(team_members)] = (team_members, names, matcher)
+
+    def vocabulary(self) -> Tuple:
+        """Everything besides the roster that the compiled matcher depends on"""
+        return (self.action_keywords, self.priority_keywords, list(RELATIVE_DATES))
+
+    def _scan(self, sentence: str, team_members=None) -> Dict[str, set]:
+        """Classify a sentence in one pass: matched values per vocabulary"""
+        return self._matcher(team_members).found(sentence.lower())
+
     def _is_task_sentence(self, sentence: str) -> bool:
         """Check if sentence contains task action keywords"""
-        sentence_lower = sentence.lower()
-        return any(keyword in sentence_lower for keyword in self.action_keywords)
+        return 'action' in self._scan(sentence)
     
-    def _parse_task(self, sentence: str, team_members, task_id: int) -> Dict:
+    @hot('TaskExtractor._parse_task')
+    def _parse_task(self, sentence: str, team_members, task_id: int, found: Dict[str, set] = None) -> Task:
         """Parse task details from sentence"""
-        task = {
-            'id': task_id,
-            'description': sentence.strip(),
-            'assigned_to': None,
-            'priority': 'Medium',
-            'deadline': None,
-            'dependencies': [],
-            'reason': ''
-        }
-        
-        # Extract priority
-        for priority, keywords in self.priority_keywords.items():
-            if any(keyword in sentence.lower() for keyword in keywords):
-                task['priority'] = priority
+        if found is None:
+            found = self._scan(sentence, team_members)
+
+        # Extract priority (first level in priority order wins)
+        priority = 'Medium'
+        priorities = found.get('priority', ())
+        for level in self.priority_keywords:
+            if level in priorities:
+                priority = level
                 break
         
-        # Extract deadline
-        task['deadline'] = self._extract_deadline(sentence)
-        
-        # Extract assigned person
-        task['assigned_to'] = self._extract_person(sentence, team_members)
-        
-        # Extract reason
-        task['reason'] = self._extract_reason(sentence)
-        
-        return task
+        return Task(
+            id=task_id,
+            description=sentence.strip(),
+            assigned_to=self._extract_person(sentence, team_members, found),
+            priority=priority,
+            deadline=self._extract_deadline(sentence, found),
+            reason=self._extract_reason(sentence)
+        )
     
-    def _extract_deadline(self, sentence: str) -> str:
-        """Extract deadline from sentence"""
-        sentence_lower = sentence.lower()
-        for pattern, deadline in self.deadline_patterns:
-            if pattern in sentence_lower:
-                if isinstance(deadline, int):
-                    future_date = datetime.now() + timedelta(days=deadline)
-                    return future_date.strftime("%Y-%m-%d")
-                return deadline
-        return None
+    def _extract_deadline(self, sentence: str, found: Dict[str, set] = None) -> str:
+        """Deadline as an ISO date (the most specific phrase in the sentence wins)"""
+        if found is None:
+            found = self._scan(sentence)
+        return self.deadlines.resolve(found.get('deadline'))
     
-    def _extract_person(self, sentence: str, team_members) -> str:
-        """Find mentioned team member"""
-        sentence_lower = sentence.lower()
-        for member in team_members:
-            if member.name.lower() in sentence_lower:
-                return member.name
-        return None
+    def _extract_person(self, sentence: str, team_members, found: Dict[str, set] = None) -> str:
+        """Find mentioned team member (first in roster order)"""
+        if found is None:
+            found = self._scan(sentence, team_members)
+        mentioned = found.get('person')
+        if not mentioned:
+            return None
+        self._matcher(team_members)
+        roster_order = self._matchers[id(team_members)][1]
+        return min(mentioned, key=roster_order.__getitem__)
     
     def _extract_reason(self, sentence: str) -> str:
         """Extract reason/context"""
-        patterns = [r'(blocking|because|since|as)\s+([^\.]+)', r'affecting\s+([^\.]+)']
-        for pattern in patterns:
-            match = re.search(pattern, sentence.lower())
+        sentence_lower = sentence.lower()
+        for pattern in REASON_PATTERNS:
+            match = pattern.search(sentence_lower)
             if match:
-                return match.group(2).strip()
+                return match.group(match.lastindex).strip()
         return sentence[:50] + "..."
 
 # Test the extractor
@@ -150,6 +601,6 @@ if __name__ == "__main__":
     tasks = extractor.extract_tasks(sample_transcript, team)
     
     for task in tasks:
-        print(f"Task {task['id']}: {task['description']}")
-        print(f"  Assigned: {task['assigned_to']} | Priority: {task['priority']} | Deadline: {task['deadline']}")
+        print(f"Task {task.id}: {task.description}")
+        print(f"  Assigned: {task.assigned_to} | Priority: {task.priority} | Deadline: {task.deadline}")
         print()
@@ -0,0 +1,100 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def content_key(*parts) -> str:
+    """SHA-256 over raw bytes and config values, usable as a cache key"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode('utf-8'))
+        digest.update(b'\0')  # Separator: ("ab", "c") and ("a", "bc") must differ
+    return digest.hexdigest()
+
+
+def file_digest(path, block_size: int = 1 << 20) -> str:
+    """Hash a file's bytes without reading it into memory at once"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class TranscriptCache:
+    """Persistent, size-bounded LRU of transcripts keyed by content hash.
+
+    One JSON file per entry; a file's mtime is its last use, so eviction drops
+    the least recently used entries first. Writes go through a temp file and
+    os.replace, so several batch workers can share one directory.
+    """
+
+    def __init__(self, directory: str = '.transcript_cache', max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._size = sum(size for _, size, _ in self._entries())
+
+    def get(self, key: str):
+        """Cached value, or None on a miss"""
+        path = self.directory / f"{key}.json"
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+            os.utime(path)  # Mark as recently used
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value):
+        """Store a JSON-serializable value, evicting old entries past max_bytes"""
+        self.directory.mkdir(parents=True, exist_ok=True)  # Created on first write only
+        path = self.directory / f"{key}.json"
+        temp_path = path.with_name(f"{key}.{os.getpid()}.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(value, f, ensure_ascii=False)
+        try:
+            self._size -= path.stat().st_size  # Overwriting: the old entry's bytes go away
+        except FileNotFoundError:
+            pass
+        self._size += temp_path.stat().st_size
+        os.replace(temp_path, path)
+
+        if self._size > self.max_bytes:
+            self._evict()
+
+    @property
+    def stats(self) -> Dict:
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def _entries(self):
+        """(mtime, size, path) for every stored entry"""
+        if not self.directory.is_dir():
+            return
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.json'):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue  # Evicted by another process meanwhile
+                yield stat.st_mtime, stat.st_size, entry.path
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits again"""
+        entries = sorted(self._entries())
+        self._size = sum(size for _, size, _ in entries)  # Re-sync with other writers
+        for _, size, path in entries:
+            if self._size <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self._size -= size
@@ -1,15 +1,258 @@
 import json
-from typing import List, Dict
+import re
+import sys
+from array import array
+from typing import List, Dict, Iterable, NamedTuple, Tuple
+
+
+def _intern(value):
+    """One shared copy of repeated strings (names, priorities, deadlines)"""
+    return sys.intern(value) if type(value) is str else value
+
 
 class TeamMember:
-    def __init__(self, name, role, skills):
-        self.name = name
-        self.role = role
-        self.skills = [s.lower() for s in skills]  # Normalize to lowercase
+    __slots__ = ('name', 'role', 'skills', 'capacity')
+
+    def __init__(self, name, role, skills, capacity=None):
+        self.name = _intern(name)
+        self.role = _intern(role)
+        self.skills = [_intern(s.lower()) for s in skills]  # Normalize to lowercase
+        self.capacity = capacity  # Max open tasks (None = unlimited)
     
     def __repr__(self):
         return f"TeamMember({self.name}, {self.role})"
 
+
+class Task:
+    """One extracted task. Slotted (no per-task __dict__), with assignee,
+    priority and deadline strings interned, since they repeat across tasks.
+    Pipeline stages use attributes; to_dict() gives the output shape.
+    """
+    __slots__ = ('id', 'description', 'assigned_to', 'priority', 'deadline', 'dependencies', 'reason')
+
+    def __init__(self, id, description, assigned_to=None, priority='Medium', deadline=None,
+                 dependencies=(), reason=''):
+        self.id = id
+        self.description = description
+        self.assigned_to = _intern(assigned_to)
+        self.priority = _intern(priority)
+        self.deadline = _intern(deadline)
+        self.dependencies = tuple(dependencies)  # The empty tuple is shared by every task
+        self.reason = reason
+
+    def to_dict(self) -> Dict:
+        """The task as written to JSON/CSV (same keys and order as always)"""
+        return {'id': self.id, 'description': self.description, 'assigned_to': self.assigned_to,
+                'priority': self.priority, 'deadline': self.deadline,
+                'dependencies': list(self.dependencies), 'reason': self.reason}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Task':
+        return cls(data.get('id'), data.get('description', ''), data.get('assigned_to'),
+                   data.get('priority', 'Medium'), data.get('deadline'),
+                   data.get('dependencies') or (), data.get('reason', ''))
+
+    def __eq__(self, other):
+        if not isinstance(other, Task):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+
+    __hash__ = None  # Mutable (assigned_to is filled in later)
+
+    def __repr__(self):
+        return f"Task({self.id}, {self.description!r}, assigned_to={self.assigned_to!r}, priority={self.priority!r})"
+
+
+class _ValueTable:
+    """Distinct values of one column, addressed by small integer codes (0 = None)"""
+    __slots__ = ('values', '_codes')
+
+    def __init__(self):
+        self.values = [None]
+        self._codes = {None: 0}
+
+    def code(self, value) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(_intern(value))
+        return code
+
+
+class TaskBatch:
+    """Column-oriented task list for very long meetings.
+
+    Ids and dependencies live in typed arrays (dependencies as one flat array
+    plus offsets); assignee, priority and deadline are integer codes into
+    small value tables. A task costs a few dozen bytes plus its description and
+    reason text. Indexing and iteration build Task objects on the fly, so
+    the batch can be passed anywhere a list of tasks is read.
+    """
+
+    def __init__(self, tasks: Iterable[Task] = ()):
+        self.ids = array('q')
+        self.descriptions = []
+        self.reasons = []
+        self._assigned_to = array('i')
+        self._priority = array('B')
+        self._deadline = array('i')
+        self._dependency_ends = array('q')
+        self._dependencies = array('q')
+        self._tables = {'assigned_to': _ValueTable(), 'priority': _ValueTable(), 'deadline': _ValueTable()}
+        self.extend(tasks)
+
+    def append(self, task: Task):
+        self.ids.append(task.id)
+        self.descriptions.append(task.description)
+        self.reasons.append(task.reason)
+        self._assigned_to.append(self._tables['assigned_to'].code(task.assigned_to))
+        self._priority.append(self._tables['priority'].code(task.priority))
+        self._deadline.append(self._tables['deadline'].code(task.deadline))
+        self._dependencies.extend(task.dependencies)
+        self._dependency_ends.append(len(self._dependencies))
+
+    def extend(self, tasks: Iterable[Task]):
+        for task in tasks:
+            self.append(task)
+
+    def set_assignee(self, index: int, name: str):
+        self._assigned_to[index] = self._tables['assigned_to'].code(name)
+
+    def column(self, name: str) -> List:
+        """All values of one field, e.g. column('priority')"""
+        if name in self._tables:
+            values = self._tables[name].values
+            return [values[code] for code in getattr(self, f"_{name}")]
+        if name == 'dependencies':
+            return [task.dependencies for task in self]
+        return list({'id': self.ids, 'description': self.descriptions, 'reason': self.reasons}[name])
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> Task:
+        if index < 0:
+            index += len(self)
+        start = self._dependency_ends[index - 1] if index > 0 else 0
+        tables = self._tables
+        return Task(self.ids[index], self.descriptions[index],
+                    tables['assigned_to'].values[self._assigned_to[index]],
+                    tables['priority'].values[self._priority[index]],
+                    tables['deadline'].values[self._deadline[index]],
+                    self._dependencies[start:self._dependency_ends[index]], self.reasons[index])
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+class KeywordHit(NamedTuple):
+    start: int
+    end: int
+    keyword: str
+    label: Tuple[str, str]  # (vocabulary, value), e.g. ('priority', 'Critical')
+
+
+class KeywordMatcher:
+    """All keyword vocabularies compiled into one regex, scanned in a single pass.
+
+    The pattern is a lookahead over a trie-shaped alternation (shared prefixes are
+    factored out, longer endings are preferred), so it finds the longest keyword
+    starting at every position without trying each keyword in turn. Shorter keywords inside each hit
+    come from a precomputed table, so the hits equal `keyword in text` checked for
+    every keyword, overlaps included.
+    """
+
+    def __init__(self, vocabularies: Dict[Tuple[str, str], Iterable[str]]):
+        self.labels = {}  # keyword -> labels it belongs to
+        for label, keywords in vocabularies.items():
+            for keyword in keywords:
+                keyword = keyword.lower()
+                if keyword and label not in self.labels.setdefault(keyword, []):
+                    self.labels[keyword].append(label)
+
+        keywords = sorted(self.labels)
+        self._pattern = re.compile('(?=(' + _trie_regex(keywords) + '))') if keywords else None
+
+        # keyword -> [(offset, keyword)] for every keyword occurring inside it (itself included)
+        self._contained = {outer: _contained_keywords(outer, self.labels) for outer in keywords}
+        self._implied = self._implications()
+
+    def _implications(self) -> Dict[str, List[Tuple[str, str]]]:
+        """keyword -> every label implied by a hit on it, for position-free classification"""
+        labels = self.labels
+        return {outer: list(dict.fromkeys(label for _, inner in contained for label in labels[inner]))
+                for outer, contained in self._contained.items()}
+
+    def __getstate__(self):
+        """Compact saved form: the regex source, and containment only where a keyword holds others"""
+        return {'labels': self.labels, 'pattern': self._pattern.pattern if self._pattern is not None else None,
+                'contained': {outer: inner for outer, inner in self._contained.items() if len(inner) > 1}}
+
+    def __setstate__(self, state):
+        self.labels = state['labels']
+        self._pattern = re.compile(state['pattern']) if state['pattern'] is not None else None
+        contained = state['contained']
+        self._contained = {outer: contained.get(outer) or [(0, outer)] for outer in sorted(self.labels)}
+        self._implied = self._implications()
+
+    def scan(self, text_lower: str) -> List[KeywordHit]:
+        """Every keyword occurrence in already-lowercased text, ordered by position"""
+        if self._pattern is None:
+            return []
+
+        seen = set()
+        for match in self._pattern.finditer(text_lower):
+            start = match.start()
+            for offset, keyword in self._contained[match.group(1)]:
+                seen.add((start + offset, keyword))
+
+        return [KeywordHit(start, start + len(keyword), keyword, label)
+                for start, keyword in sorted(seen)
+                for label in self.labels[keyword]]
+
+    def found(self, text_lower: str) -> Dict[str, set]:
+        """Matched values grouped by vocabulary, e.g. {'priority': {'High'}}"""
+        found = {}
+        if self._pattern is None:
+            return found
+        implied = self._implied
+        for keyword in self._pattern.findall(text_lower):
+            for vocabulary, value in implied[keyword]:
+                if vocabulary in found:
+                    found[vocabulary].add(value)
+                else:
+                    found[vocabulary] = {value}
+        return found
+
+
+def _trie_regex(keywords: List[str]) -> str:
+    """Regex matching any keyword, factored by common prefix, longest match first"""
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}  # end-of-keyword marker
+
+    def build(node) -> str:
+        branches = [re.escape(char) + build(child) for char, child in node.items() if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # A keyword ends here: the longer continuation is optional (greedy, so tried first)
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+
+def _contained_keywords(outer: str, keywords) -> List[Tuple[int, str]]:
+    """(offset, keyword) for every keyword that is a substring of outer"""
+    return [(start, outer[start:end])
+            for start in range(len(outer))
+            for end in range(start + 1, len(outer) + 1)
+            if outer[start:end] in keywords]
+
+
 def load_team_members(json_file_path) -> List[TeamMember]:
     """Load team members from JSON file"""
     with open(json_file_path, 'r') as f:
@@ -17,7 +260,7 @@ def load_team_members(json_file_path) -> List[TeamMember]:
     
     team = []
     for member in data.get('team_members', []):
-        tm = TeamMember(member['name'], member['role'], member['skills'])
+        tm = TeamMember(member['name'], member['role'], member['skills'], member.get('capacity'))
         team.append(tm)
     
     return team
@@ -0,0 +1,157 @@
+"""Voice-activity detection on decoded PCM, so the recognizer never hears dead air.
+
+Speech is found the way pydub's detect_nonsilent finds it (a window of
+min_silence_len ms whose RMS is at or below the threshold is silence, tried
+at every millisecond), but in one vectorized pass: per-millisecond sums of
+squares, a cumulative sum, and every window's energy as a difference of
+two prefix sums. pydub re-slices the audio and calls audioop.rms once per
+millisecond, which takes longer than some recognizers do.
+
+Dropping the silence leaves shorter audio; a TimestampMap takes positions
+in it back to the original recording.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import TYPE_CHECKING, List, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from pydub import AudioSegment
+
+# Defaults match split_on_silence_bounded: speech is louder than 16 dB below the recording's
+# average, a pause shorter than half a second is part of the speech, and 200 ms either side is kept
+MIN_SILENCE_MS = 500
+KEEP_SILENCE_MS = 200
+SILENCE_BELOW_AVERAGE_DB = 16
+
+# Samples squared at a time while summing energy per millisecond (bounds the temporary arrays)
+BLOCK_SAMPLES = 1 << 22
+
+_SAMPLE_TYPES = {1: np.int8, 2: np.dtype('<i2'), 4: np.dtype('<i4')}
+
+
+def default_threshold(audio: AudioSegment) -> float:
+    """Silence threshold in dBFS for a recording"""
+    return audio.dBFS - SILENCE_BELOW_AVERAGE_DB if audio.dBFS != float('-inf') else -60
+
+
+def millisecond_energy(audio: AudioSegment) -> Tuple[np.ndarray, np.ndarray]:
+    """(sum of squared samples per millisecond, frame index where each millisecond starts).
+
+    Millisecond m covers the frames pydub's audio[m:m + 1] would, so window sums
+    built from these match what audio[i:j].rms sees.
+    """
+    samples = np.frombuffer(audio.raw_data, dtype=_SAMPLE_TYPES[audio.sample_width])
+    frames = len(samples) // audio.channels
+    # pydub: int(ms * (frame_rate / 1000.0)), clipped to the data that exists
+    starts = (np.arange(len(audio) + 1) * (audio.frame_rate / 1000.0)).astype(np.int64)
+    edges = np.minimum(starts, frames) * audio.channels
+
+    accumulator = np.float64 if audio.sample_width == 4 else np.int64  # int32 squares overflow int64 sums
+    energy = np.zeros(len(audio), dtype=accumulator)
+    for block_start in range(0, edges[-1], BLOCK_SAMPLES):
+        block_end = min(block_start + BLOCK_SAMPLES, edges[-1])
+        block = samples[block_start:block_end].astype(accumulator)
+        squares = np.concatenate([[0], np.cumsum(block * block)])
+        # Each millisecond's share of this block, as a difference of the block's prefix sums
+        low = np.clip(edges[:-1], block_start, block_end) - block_start
+        high = np.clip(edges[1:], block_start, block_end) - block_start
+        energy += squares[high] - squares[low]
+    return energy, starts
+
+
+def detect_speech(audio: AudioSegment, min_silence_len: int = MIN_SILENCE_MS,
+                  silence_thresh: float = None) -> List[List[int]]:
+    """[start_ms, end_ms] runs of speech: same result as pydub.silence.detect_nonsilent"""
+    length = len(audio)
+    if audio.sample_width not in _SAMPLE_TYPES:  # 24-bit audio: take pydub's per-window loop
+        from pydub.silence import detect_nonsilent
+        return detect_nonsilent(audio, min_silence_len=min_silence_len, silence_thresh=silence_thresh)
+    if silence_thresh is None:
+        silence_thresh = default_threshold(audio)
+    if length < min_silence_len:
+        return [[0, length]]
+
+    energy, starts = millisecond_energy(audio)
+    prefix = np.concatenate([[0], np.cumsum(energy)])
+    windows = np.arange(length - min_silence_len + 1)
+    # audioop.rms: integer part of sqrt(mean square) over every sample in the window (all channels)
+    samples = (starts[windows + min_silence_len] - starts[windows]) * audio.channels
+    mean_square = (prefix[windows + min_silence_len] - prefix[windows]) / np.maximum(samples, 1)
+    threshold = 10 ** (silence_thresh / 20) * audio.max_possible_amplitude
+    silent = np.flatnonzero(np.floor(np.sqrt(mean_square)) <= threshold)
+    if len(silent) == 0:
+        return [[0, length]]
+
+    # Silent windows that touch or overlap form one silent range
+    breaks = np.flatnonzero(np.diff(silent) > min_silence_len)
+    range_starts = np.concatenate([[silent[0]], silent[breaks + 1]])
+    range_ends = np.concatenate([silent[breaks], [silent[-1]]]) + min_silence_len
+
+    edges = [0] + [int(i) for pair in zip(range_starts, range_ends) for i in pair] + [length]
+    return [[start, end] for start, end in zip(edges[::2], edges[1::2]) if end > start]
+
+
+class TimestampMap:
+    """Positions in speech-only audio -> positions in the original recording (milliseconds).
+
+    Built from the kept (start, end) ranges of the original, which the
+    speech-only audio plays back to back.
+    """
+
+    def __init__(self, ranges: List[Tuple[int, int]], original_ms: int):
+        self.ranges = ranges
+        self.original_ms = original_ms
+        self._offsets = []  # Where each kept range starts in the speech-only audio
+        position = 0
+        for start, end in ranges:
+            self._offsets.append(position)
+            position += end - start
+        self.kept_ms = position
+
+    @property
+    def skipped_ms(self) -> int:
+        return self.original_ms - self.kept_ms
+
+    def to_original(self, ms: float) -> float:
+        """Original recording time of a position in the speech-only audio"""
+        if not self.ranges:
+            return ms
+        index = max(bisect_right(self._offsets, ms) - 1, 0)
+        return self.ranges[index][0] + ms - self._offsets[index]
+
+    def to_dict(self):
+        return {'original_ms': self.original_ms, 'kept_ms': self.kept_ms, 'ranges': [list(r) for r in self.ranges]}
+
+
+def speech_ranges(audio: AudioSegment, min_silence_len: int = MIN_SILENCE_MS, silence_thresh: float = None,
+                  keep_silence: int = KEEP_SILENCE_MS) -> List[Tuple[int, int]]:
+    """Speech runs padded by keep_silence on both sides, overlapping runs merged"""
+    ranges = []
+    for start, end in detect_speech(audio, min_silence_len, silence_thresh):
+        start, end = max(0, start - keep_silence), min(len(audio), end + keep_silence)
+        if ranges and start <= ranges[-1][1]:
+            ranges[-1] = (ranges[-1][0], end)
+        else:
+            ranges.append((start, end))
+    return ranges
+
+
+def drop_silence(audio: AudioSegment, min_silence_len: int = MIN_SILENCE_MS, silence_thresh: float = None,
+                 keep_silence: int = KEEP_SILENCE_MS) -> Tuple[AudioSegment, TimestampMap]:
+    """(speech-only audio, map back to the original): the kept ranges played back to back"""
+    ranges = speech_ranges(audio, min_silence_len, silence_thresh, keep_silence)
+    timeline = TimestampMap(ranges, len(audio))
+    if ranges == [(0, len(audio))]:
+        return audio, timeline  # Nothing to drop: no copy
+    return join_ranges(audio, ranges), timeline
+
+
+def join_ranges(audio: AudioSegment, ranges: List[Tuple[int, int]]) -> AudioSegment:
+    """The (start, end) ranges of audio played back to back"""
+    if len(ranges) == 1:
+        return audio[ranges[0][0]:ranges[0][1]]
+    # pydub slices are byte ranges of one buffer; joining them is a single copy
+    return audio._spawn(b''.join(audio[start:end].raw_data for start, end in ranges))
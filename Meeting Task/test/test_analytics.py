@@ -0,0 +1,57 @@
+from datetime import date
+
+from analytics import TaskArchive
+from output_generator import OutputGenerator
+from utils import Task
+
+MONDAY = date(2026, 10, 12)
+NEXT_MONDAY = date(2026, 10, 19)
+
+
+def make_tasks(*rows):
+    return [Task(index + 1, f"Task {index + 1}", assigned_to=assigned_to, priority=priority, deadline=deadline)
+            for index, (assigned_to, priority, deadline) in enumerate(rows)]
+
+
+STANDUP = make_tasks(("Mohit", "High", "2026-10-13"), ("Lata", "Medium", None), (None, "Low", "Friday"))
+REVIEW = make_tasks(("Mohit", "Critical", "tomorrow"), ("Mohit", "Medium", "2026-11-02"))
+
+
+def test_summary_matches_generate_summary_across_meetings(tmp_path):
+    archive = TaskArchive(str(tmp_path / "archive"))
+    assert archive.add_meetings([("standup.txt", MONDAY, STANDUP), ("review.txt", NEXT_MONDAY, REVIEW)]) == 5
+
+    reopened = TaskArchive(str(tmp_path / "archive"))
+    assert reopened.summary() == OutputGenerator.generate_summary(STANDUP + REVIEW)
+    assert reopened.summary(start=NEXT_MONDAY) == OutputGenerator.generate_summary(REVIEW)
+
+    assert reopened.workload() == {'Mohit': {'2026-10-12': 1, '2026-10-19': 2}, 'Lata': {'2026-10-12': 1},
+                                   None: {'2026-10-12': 1}}
+    assert reopened.priority_mix(period='month') == {'2026-10': {'High': 1, 'Medium': 2, 'Low': 1, 'Critical': 1}}
+    # Relative deadlines count from each meeting's own date: Friday 16th and Tuesday 20th
+    assert reopened.overdue(as_of=date(2026, 10, 17)) == {'Mohit': 1, None: 1}
+    assert reopened.overdue(as_of=date(2026, 10, 21)) == {'Mohit': 2, None: 1}
+
+
+def test_meetings_added_again_replace_their_earlier_version(tmp_path):
+    archive = TaskArchive(str(tmp_path / "archive"))
+    archive.add_meeting("standup.txt", MONDAY, STANDUP)
+    assert archive.add_meeting("standup.txt", MONDAY, [task.to_dict() for task in STANDUP]) == 0  # Unchanged
+    assert archive.add_meeting("standup.txt", NEXT_MONDAY, STANDUP) == 3  # Next week's standup is another meeting
+
+    archive.add_meeting("standup.txt", MONDAY, STANDUP[:1])
+    assert archive.rows == 7
+    assert archive.summary()['total_tasks'] == 4
+    assert archive.report()['meeting_count'] == 2
+
+
+def test_interrupted_append_is_ignored_and_overwritten(tmp_path):
+    archive = TaskArchive(str(tmp_path / "archive"))
+    archive.add_meeting("standup.txt", MONDAY, STANDUP)
+    with open(archive._column_file('assignee'), 'ab') as f:
+        f.write(b"\x07" * 10)  # Rows of an append that never reached meta.json
+
+    archive = TaskArchive(str(tmp_path / "archive"))
+    assert archive.summary() == OutputGenerator.generate_summary(STANDUP)
+    archive.add_meeting("review.txt", NEXT_MONDAY, REVIEW)
+    assert archive.summary() == OutputGenerator.generate_summary(STANDUP + REVIEW)
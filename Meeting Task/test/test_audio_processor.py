@@ -0,0 +1,196 @@
+from pydub import AudioSegment
+from pydub.generators import Sine
+
+from audio_processor import AudioProcessor, StubBackend, split_on_silence_bounded
+from transcript_cache import TranscriptCache
+
+
+def _speech(ms):
+    return Sine(440).to_audio_segment(duration=ms).apply_gain(-6)
+
+
+def _meeting():
+    """Three 'utterances' separated by one second of silence"""
+    silence = AudioSegment.silent(duration=1000)
+    return _speech(2000) + silence + _speech(2000) + silence + _speech(2000)
+
+
+def test_chunks_split_at_silence_and_respect_bound():
+    chunks = split_on_silence_bounded(_meeting(), max_chunk_ms=2500)
+
+    assert len(chunks) == 3
+    assert all(end - start <= 2500 for start, end in chunks)
+    assert chunks == sorted(chunks)
+
+
+def test_long_speech_is_hard_split():
+    chunks = split_on_silence_bounded(_speech(7000), max_chunk_ms=3000)
+
+    assert [end - start for start, end in chunks] == [3000, 3000, 1000]
+
+
+def test_segments_keep_meeting_order_with_timestamps():
+    processor = AudioProcessor(backend=StubBackend(), max_chunk_ms=2500, workers=3)
+    segments = processor.transcribe_segments(_meeting())
+
+    assert [seg['index'] for seg in segments] == [0, 1, 2]
+    assert segments[0]['start'] == 0
+    assert segments[1]['start'] > segments[0]['end']
+    assert all(seg['text'].startswith('[speech') for seg in segments)
+
+
+def test_chunks_send_only_speech_with_original_timestamps():
+    from profiling import Profiler
+    from vad import drop_silence
+
+    audio = _speech(2000)
+    for _ in range(7):
+        audio += AudioSegment.silent(duration=3000) + _speech(2000)
+
+    with Profiler() as profiler:
+        segments = AudioProcessor(backend=StubBackend(), max_chunk_ms=10000).transcribe_segments(audio)
+
+    kept = len(drop_silence(audio)[0])
+    assert profiler.counts['speech_seconds'] == round(kept / 1000, 1)  # Silence between runs is not sent
+    # Four padded runs fit a chunk; the second chunk starts at the fifth run, 19.8s into the recording
+    assert len(segments) == 2 and segments[0]['start'] == 0 and abs(segments[1]['start'] - 19.8) < 0.05
+    assert segments[-1]['end'] * 1000 == len(audio)
+
+    full = AudioProcessor(backend=StubBackend(), max_chunk_ms=10000, vad=False).transcribe_segments(audio)
+    assert all(seg['text'] == f"[speech {seg['end'] - seg['start']:.1f}s]" for seg in full)
+
+
+class _FlakyBackend(StubBackend):
+    name = 'flaky'
+
+    def transcribe(self, audio):
+        if len(audio) > 2200:
+            raise RuntimeError("recognizer timeout")
+        return "ok"
+
+
+def test_failed_chunk_does_not_sink_recording():
+    processor = AudioProcessor(backend=_FlakyBackend(), max_chunk_ms=2500, workers=2)
+    audio = _speech(2000) + AudioSegment.silent(duration=1000) + _speech(2400)
+
+    segments = processor.transcribe_segments(audio)
+
+    assert segments[0]['text'] == 'ok'
+    assert segments[1]['text'] == ''
+    assert 'timeout' in segments[1]['error']
+
+
+class _CountingBackend(StubBackend):
+    name = 'counting'
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def transcribe(self, audio):
+        self.calls += 1
+        return super().transcribe(audio)
+
+
+def test_cached_rerun_skips_recognition(tmp_path):
+    meeting = tmp_path / "meeting.wav"
+    _meeting().export(str(meeting), format="wav")
+    backend = _CountingBackend()
+    processor = AudioProcessor(backend=backend, max_chunk_ms=2500,
+                               cache=TranscriptCache(str(tmp_path / "cache")))
+
+    first = processor.get_transcript_segments(str(meeting))
+    second = processor.get_transcript_segments(str(meeting))
+
+    assert second == first
+    assert backend.calls == 3
+    assert processor.cache.stats == {'hits': 1, 'misses': 4}  # 1 file + 3 chunks missed, then 1 file hit
+
+
+def test_recut_recording_only_transcribes_changed_chunks(tmp_path):
+    backend = _CountingBackend()
+    processor = AudioProcessor(backend=backend, max_chunk_ms=2500,
+                               cache=TranscriptCache(str(tmp_path / "cache")))
+    processor.transcribe_segments(_meeting())
+
+    # Same first two utterances, new third one
+    silence = AudioSegment.silent(duration=1000)
+    recut = _speech(2000) + silence + _speech(2000) + silence + _speech(1500)
+    processor.transcribe_segments(recut)
+
+    assert backend.calls == 4
+
+
+def test_single_shot_hands_pcm_to_recognizer_in_memory(tmp_path, monkeypatch):
+    meeting = tmp_path / "meeting.wav"
+    _meeting().export(str(meeting), format="wav")
+    monkeypatch.chdir(tmp_path)
+    received = []
+    processor = AudioProcessor()
+    processor.backend.recognizer.recognize_google = \
+        lambda audio_data, language: received.append(audio_data) or "hello team"
+
+    assert processor.get_transcript_text(str(meeting)) == "hello team"
+
+    audio_data = received[0]
+    seconds = len(audio_data.frame_data) / (audio_data.sample_rate * audio_data.sample_width)
+    assert round(seconds, 1) == 6.8  # 8 s recording minus 600 ms of each 1 s pause (200 ms kept either side)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["meeting.wav"]  # No temp WAV left behind
+
+
+def test_single_shot_uses_the_configured_backend(tmp_path):
+    meeting = tmp_path / "meeting.wav"
+    _meeting().export(str(meeting), format="wav")
+    cache = TranscriptCache(str(tmp_path / "cache"))
+
+    processor = AudioProcessor(backend=StubBackend("Mohit, fix the login bug."), cache=cache)
+    assert processor.get_transcript_text(str(meeting), chunked=False) == "Mohit, fix the login bug."
+    # Another backend's transcript is not served from the first one's cache entry
+    processor = AudioProcessor(backend=StubBackend("Lata, test payments."), cache=cache)
+    assert processor.get_transcript_text(str(meeting), chunked=False) == "Lata, test payments."
+
+
+def test_stereo_is_downmixed_without_copying_mono():
+    from audio_processor import to_audio_data
+
+    mono = _speech(500)
+    assert to_audio_data(mono).frame_data is mono.raw_data
+    assert len(to_audio_data(mono.set_channels(2)).frame_data) == len(mono.raw_data)
+
+
+def test_local_backend_batches_chunks():
+    from audio_processor import LocalBackend
+
+    backend = LocalBackend(model='stub', batch_size=2)
+    processor = AudioProcessor(backend=backend, max_chunk_ms=2500, workers=2)
+    segments = processor.transcribe_segments(_meeting())
+
+    # Each 2 s utterance plus 200 ms padding on the sides that border silence
+    assert [seg['text'] for seg in segments] == ["[speech 2.2s]", "[speech 2.4s]", "[speech 2.2s]"]
+    assert sorted(backend.model.batches) == [1, 2]  # Two batched calls, not three
+
+
+def test_model_worker_stays_warm_across_files():
+    from audio_processor import ModelWorker
+
+    with ModelWorker('local', model='stub', batch_size=4) as worker:
+        processor = AudioProcessor(backend=worker, max_chunk_ms=2500)
+        first = processor.transcribe_segments(_meeting())
+        pid = worker._process.pid
+        second = processor.transcribe_segments(_speech(1500))
+
+        assert worker.cache_key == "local:stub:en"
+        assert len(first) == 3 and second[0]['text'] == "[speech 1.5s]"
+        assert worker._process.pid == pid and worker._process.is_alive()
+
+
+def test_diarized_segments_follow_the_voice():
+    low, high = Sine(180).to_audio_segment(duration=1500), Sine(1400).to_audio_segment(duration=1500)
+    silence = AudioSegment.silent(duration=800)
+    audio = low + silence + high + silence + low + silence + high
+    processor = AudioProcessor(backend=StubBackend(), max_chunk_ms=10000, workers=2, diarize=True)
+
+    segments = processor.transcribe_segments(audio.apply_gain(-6))
+
+    # Long max_chunk_ms would merge all four runs; speaker changes keep them apart
+    assert [seg['speaker'] for seg in segments] == ['Speaker 1', 'Speaker 2', 'Speaker 1', 'Speaker 2']
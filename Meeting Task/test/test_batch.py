@@ -0,0 +1,29 @@
+import json
+import os
+
+from analytics import TaskArchive
+from batch import find_meetings, run_batch
+
+TEAM_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'team_members.json')
+
+
+def test_bad_meeting_does_not_sink_batch(tmp_path):
+    inbox = tmp_path / "meetings"
+    inbox.mkdir()
+    (inbox / "standup.txt").write_text("Mohit, fix the API timeout.\nLata, test the payment flow.\n")
+    (inbox / "broken.wav").write_bytes(b"not really audio")
+    (inbox / "notes.md").write_text("ignored")
+    output_dir = tmp_path / "out"
+
+    results = run_batch(str(inbox), TEAM_FILE, str(output_dir), formats='json', jobs=2,
+                        processor_options={'backend': 'stub'}, archive=str(tmp_path / "archive"))
+
+    assert [p.name for p in find_meetings(str(inbox))] == ["broken.wav", "standup.txt"]
+    status = {os.path.basename(r['file']): r['status'] for r in results}
+    assert status == {'broken.wav': 'failed', 'standup.txt': 'ok'}
+    assert (output_dir / "standup.json").exists()
+
+    summary = json.loads((output_dir / "batch_summary.json").read_text())
+    assert summary['failed_count'] == 1
+    assert summary['summary']['assignees'] == {'Mohit': 1, 'Lata': 1}
+    assert TaskArchive(str(tmp_path / "archive")).summary() == summary['summary']
@@ -0,0 +1,37 @@
+from datetime import date
+
+from deadlines import DeadlineResolver
+from task_extractor import TaskExtractor
+from utils import TeamMember
+
+THURSDAY = date(2026, 10, 15)
+TEAM = [TeamMember("Mohit", "Backend Engineer", ["Database"])]
+
+
+def test_phrases_resolve_to_dates_from_the_anchor():
+    resolver = DeadlineResolver(THURSDAY)
+
+    assert resolver.resolve({'tomorrow'}) == "2026-10-16"
+    assert resolver.resolve({'friday'}) == "2026-10-16"
+    assert resolver.resolve({'monday', 'next monday'}) == "2026-10-19"
+    assert resolver.resolve({'end of next week', 'next week'}) == "2026-10-23"
+    assert resolver.resolve({'end of the month'}) == "2026-10-31"
+    assert resolver.resolve(()) is None
+
+
+def test_offset_reads_dates_and_older_day_names():
+    resolver = DeadlineResolver(THURSDAY)
+
+    assert resolver.offset("2026-10-20") == 5
+    assert resolver.offset("Next Monday") == 4
+    assert resolver.offset("someday") is None
+
+
+def test_extraction_is_deterministic_for_a_meeting_date():
+    transcript = "Mohit, deploy the fix by next Monday. Mohit, review the API tomorrow."
+
+    tasks = TaskExtractor(THURSDAY).extract_tasks(transcript, TEAM)
+    later = TaskExtractor().for_meeting(THURSDAY).extract_tasks(transcript, TEAM)
+
+    assert [task.deadline for task in tasks] == ["2026-10-19", "2026-10-16"]
+    assert [task.to_dict() for task in later] == [task.to_dict() for task in tasks]
@@ -0,0 +1,84 @@
+from incremental import IncrementalExtractor
+from task_extractor import TaskExtractor
+from utils import TeamMember
+
+TEAM = [
+    TeamMember("Sakshi", "Frontend Developer", ["React"]),
+    TeamMember("Mohit", "Backend Engineer", ["Database"]),
+]
+
+TRANSCRIPT = ("Thanks for joining. Sakshi, fix the login bug. Mohit, optimize the database. "
+              "Someone should write payment tests. See you Friday.")
+
+
+def test_first_run_matches_full_extraction(tmp_path):
+    tasks, diff = IncrementalExtractor(state_file=str(tmp_path / "state.json")).extract_tasks(TRANSCRIPT, TEAM)
+
+    assert tasks == TaskExtractor().extract_tasks(TRANSCRIPT, TEAM)
+    assert [task.id for task in diff.added] == [1, 2, 3]
+
+
+def test_edit_reparses_only_changed_sentences_and_keeps_ids(tmp_path):
+    state = str(tmp_path / "state.json")
+    first = IncrementalExtractor(state_file=state)
+    first.extract_tasks(TRANSCRIPT, TEAM)
+    first.save()
+
+    edited = TRANSCRIPT.replace("optimize the database", "optimize the database before release")
+    edited = "Arjun, deploy the hotfix. " + edited.replace("Someone should write payment tests. ", "")
+    second = IncrementalExtractor(state_file=state)
+    tasks, diff = second.extract_tasks(edited, TEAM)
+
+    assert second.stats['reparsed'] == 2  # The new and the edited sentence
+    assert [(task.id, task.description) for task in tasks] == [
+        (4, "Arjun, deploy the hotfix."),
+        (1, "Sakshi, fix the login bug."),
+        (2, "Mohit, optimize the database before release."),
+    ]
+    assert [task.id for task in diff.added] == [4]
+    assert [task.id for task in diff.removed] == [3]
+    assert [(after.id, fields) for _, after, fields in diff.changed] == [(2, ['description', 'priority', 'reason'])]
+
+
+def test_unchanged_rerun_has_empty_diff_and_parses_nothing(tmp_path):
+    state = str(tmp_path / "state.json")
+    first = IncrementalExtractor(state_file=state)
+    first.extract_tasks(TRANSCRIPT, TEAM)
+    first.save()
+
+    second = IncrementalExtractor(state_file=state)
+    tasks, diff = second.extract_tasks(TRANSCRIPT, TEAM)
+
+    assert not diff
+    assert second.stats['reparsed'] == 0
+    assert [task.id for task in tasks] == [1, 2, 3]
+
+
+def test_dependencies_survive_reruns_with_stable_ids(tmp_path):
+    state = str(tmp_path / "state.json")
+    transcript = ("Sakshi, fix the critical login bug. Mohit, optimize the database. "
+                  "One more thing, we need to write payment tests. "
+                  "This depends on the login bug fix being completed first.")
+    first = IncrementalExtractor(state_file=state)
+    tasks, _ = first.extract_tasks(transcript, TEAM)
+    first.save()
+
+    assert tasks == TaskExtractor().extract_tasks(transcript, TEAM)
+    assert tasks[2].dependencies == (1,)
+
+    edited = "Arjun, deploy the hotfix. " + transcript.replace("Mohit, optimize the database. ", "")
+    second = IncrementalExtractor(state_file=state)
+    tasks, diff = second.extract_tasks(edited, TEAM)
+    second.save()
+
+    assert second.stats['reparsed'] == 1
+    assert [(task.id, task.dependencies) for task in tasks] == [(5, ()), (1, ()), (3, (1,)), (4, ())]
+    assert not diff.changed
+
+    # Editing only the follow-up re-links the unchanged task before it, to the new task's id
+    edited = edited.replace("This depends on the login bug fix", "This depends on the hotfix deploy")
+    third = IncrementalExtractor(state_file=state)
+    tasks, diff = third.extract_tasks(edited, TEAM)
+
+    assert [(task.id, task.dependencies) for task in tasks] == [(5, ()), (1, ()), (3, (5,)), (4, ())]
+    assert (3, ['dependencies']) in [(after.id, fields) for _, after, fields in diff.changed]
@@ -0,0 +1,75 @@
+import json
+
+import pytest
+
+from output_generator import COLUMNS, OutputGenerator
+from utils import Task, TaskBatch
+
+TASKS = [
+    {'id': 1, 'description': 'Sakshi, fix the "login" bug', 'assigned_to': 'Sakshi', 'deadline': None,
+     'priority': 'Critical', 'dependencies': [], 'reason': 'blocking users'},
+    {'id': 2, 'description': 'Write payment tests', 'assigned_to': 'Lata', 'deadline': '2025-12-02',
+     'priority': 'High', 'dependencies': [1], 'reason': None},
+]
+
+
+def test_streamed_json_matches_json_dump(tmp_path):
+    output = tmp_path / "out.json"
+    OutputGenerator.generate_json(TASKS, str(output))
+
+    text = output.read_text(encoding='utf-8')
+    data = json.loads(text)
+    assert text == json.dumps({'generated_at': data['generated_at'], 'task_count': 2, 'tasks': TASKS},
+                              indent=2, ensure_ascii=False)
+
+    # A plain iterator works too; the count is written once known
+    OutputGenerator.generate_json(iter(TASKS), str(output))
+    assert json.loads(output.read_text(encoding='utf-8'))['task_count'] == 2
+
+
+def test_native_csv_matches_pandas(tmp_path):
+    pd = pytest.importorskip("pandas")
+    expected = tmp_path / "pandas.csv"
+    pd.DataFrame(TASKS).reindex(columns=COLUMNS).to_csv(expected, index=False, encoding='utf-8')
+
+    output = tmp_path / "out.csv"
+    OutputGenerator.generate_csv(TASKS, str(output))
+
+    assert output.read_text(encoding='utf-8') == expected.read_text(encoding='utf-8')
+
+
+def test_table_columns_are_aligned(capsys):
+    OutputGenerator.print_table(TASKS)
+
+    lines = [line for line in capsys.readouterr().out.splitlines() if line and not line.startswith(('=', ' MEETING'))]
+    assert lines[0].split() == COLUMNS
+    assert len({len(line.rstrip()) for line in lines[:2]}) == 1  # Header and full row line up
+
+
+@pytest.mark.parametrize('layout', [list, TaskBatch])
+def test_task_objects_write_the_same_files_as_dicts(tmp_path, layout):
+    tasks = layout(Task.from_dict(task) for task in TASKS)
+
+    OutputGenerator.generate_json(tasks, str(tmp_path / "tasks.json"))
+    assert json.loads((tmp_path / "tasks.json").read_text(encoding='utf-8'))['tasks'] == TASKS
+
+    OutputGenerator.generate_csv(TASKS, str(tmp_path / "dicts.csv"))
+    OutputGenerator.generate_csv(tasks, str(tmp_path / "tasks.csv"))
+    assert (tmp_path / "tasks.csv").read_text(encoding='utf-8') == (tmp_path / "dicts.csv").read_text(encoding='utf-8')
+
+
+def test_schedule_is_added_to_json_and_csv(tmp_path):
+    schedule = {1: {'order': 1, 'earliest_start': '2026-10-19', 'earliest_finish': '2026-10-20',
+                    'latest_finish': '2026-10-20', 'slack_days': 0, 'critical': True}}
+
+    OutputGenerator.generate_json(TASKS, str(tmp_path / "out.json"), schedule=schedule, critical_path=[1])
+    data = json.loads((tmp_path / "out.json").read_text(encoding='utf-8'))
+    assert data['critical_path'] == [1]
+    assert data['tasks'][0]['schedule'] == schedule[1]
+    assert 'schedule' not in data['tasks'][1]
+
+    OutputGenerator.generate_csv(TASKS, str(tmp_path / "out.csv"), schedule=schedule)
+    header, first, second = (tmp_path / "out.csv").read_text(encoding='utf-8').splitlines()
+    assert header.endswith("order,earliest_start,earliest_finish,latest_finish,slack_days,critical")
+    assert first.endswith(",1,2026-10-19,2026-10-20,2026-10-20,0,True")
+    assert second.endswith(",,,,,,")
@@ -0,0 +1,122 @@
+import json
+import os
+import subprocess
+import sys
+
+from pydub import AudioSegment
+from pydub.generators import Sine
+
+from audio_processor import AudioProcessor, StubBackend
+from output_generator import JsonLinesWriter, CsvStreamWriter
+from pipeline import iter_text_blocks, stream_tasks, write_stream
+from task_assigner import TaskAssigner
+from task_extractor import TaskExtractor
+from utils import TeamMember
+
+TEAM = [
+    TeamMember("Sakshi", "Frontend Developer", ["React", "frontend"]),
+    TeamMember("Mohit", "Backend Engineer", ["Database", "APIs"]),
+]
+
+
+def test_sentences_split_across_lines_are_carried():
+    extractor = TaskExtractor()
+    pieces = ["Mohit, please optimize the", "database by Friday.", "Thanks all."]
+
+    sentences = list(extractor.iter_sentences(pieces))
+
+    assert sentences == ["Mohit, please optimize the database by Friday.", "Thanks all."]
+
+
+def test_text_blocks_keep_words_and_characters_whole(tmp_path):
+    transcript = tmp_path / "meeting.txt"
+    text = "Zoë, réviser le café menu. Mohit, fix the API timeout by Friday.\n"
+    transcript.write_text(text, encoding="utf-8")
+
+    blocks = list(iter_text_blocks(transcript, block_size=12))
+
+    assert "".join(blocks) == text
+    assert all(block[0].isspace() for block in blocks[1:])
+
+
+def test_block_extraction_matches_whole_transcript(tmp_path):
+    transcript = tmp_path / "meeting.txt"
+    text = ("Sakshi: Thanks all. Mohit, can you optimize the\ndatabase by Friday?\n"
+            "Mohit: Sure. Sakshi, fix the login bug after the database work.\n"
+            "Sakshi: I'll take it. Someone should write payment tests.\n")
+    transcript.write_text(text)
+    extractor = TaskExtractor()
+
+    expected = [task.to_dict() for task in extractor.extract_tasks(text, TEAM)]
+    for block_size in (16, 64, 1 << 20):
+        tasks = extractor.extract_tasks_from_blocks(iter_text_blocks(transcript, block_size), TEAM)
+        assert [task.to_dict() for task in tasks] == expected
+
+
+def test_block_extraction_counts_sentences_like_whole_transcript():
+    from profiling import Profiler
+
+    text = ("Sakshi: Thanks all. Mohit, can you optimize the\ndatabase by Friday?\n"
+            "Mohit: Sure. Sakshi, fix the login bug after the database work.\n")
+    extractor = TaskExtractor()
+    reports = []
+    for extract in (lambda: extractor.extract_tasks(text, TEAM),
+                    lambda: extractor.extract_tasks_from_blocks([text[:35], text[35:]], TEAM)):
+        with Profiler() as profiler:
+            extract()
+        reports.append(profiler)
+
+    whole, blocks = reports
+    assert blocks.counts['sentences'] == whole.counts['sentences'] == 4
+    assert blocks.counts['tasks'] == whole.counts['tasks']
+    assert 'classify' in blocks.stages  # Splitting is timed as part of it
+
+
+def test_text_transcript_streams_to_jsonl_and_csv(tmp_path):
+    transcript = tmp_path / "meeting.txt"
+    transcript.write_text("Sakshi, fix the login bug.\n\nWe should optimize the\ndatabase soon.\n")
+    jsonl, csv_file = tmp_path / "out.jsonl", tmp_path / "out.csv"
+
+    tasks = stream_tasks(transcript, TEAM, AudioProcessor(backend=StubBackend()),
+                         TaskExtractor(), TaskAssigner(TEAM))
+    summary = write_stream(tasks, [JsonLinesWriter(jsonl), CsvStreamWriter(csv_file)])
+
+    rows = [json.loads(line) for line in jsonl.read_text().splitlines()]
+    assert summary['total_tasks'] == 2
+    assert [row['assigned_to'] for row in rows] == ["Sakshi", "Mohit"]
+    assert rows[1]['description'].split() == "We should optimize the database soon.".split()
+    assert csv_file.read_text().splitlines()[0].startswith("id,description,assigned_to")
+
+
+def test_audio_streams_one_task_per_chunk(tmp_path):
+    speech = Sine(440).to_audio_segment(duration=1500).apply_gain(-6)
+    silence = AudioSegment.silent(duration=1000)
+    wav = tmp_path / "meeting.wav"
+    (speech + silence + speech).export(wav, format="wav")
+
+    processor = AudioProcessor(backend=StubBackend("Mohit, fix the API"), max_chunk_ms=2000, workers=2)
+    tasks = list(stream_tasks(wav, TEAM, processor, TaskExtractor(), TaskAssigner(TEAM)))
+
+    assert [task.id for task in tasks] == [1, 2]
+    assert all(task.assigned_to == "Mohit" for task in tasks)
+
+
+def test_text_run_never_imports_audio_libraries(tmp_path):
+    src = os.path.join(os.path.dirname(__file__), '..', 'src')
+    data = os.path.join(os.path.dirname(__file__), '..', 'data')
+    script = (
+        "import sys\n"
+        "sys.path.insert(0, sys.argv[4])\n"
+        "sys.argv = ['main.py', '--audio', sys.argv[1], '--team', sys.argv[2], '--format', 'json',"
+        " '--output', sys.argv[3]]\n"
+        "import main\n"
+        "main.main()\n"
+        "print(sorted(m for m in ('speech_recognition', 'pydub', 'multiprocessing') if m in sys.modules))\n"
+    )
+    completed = subprocess.run([sys.executable, '-c', script, os.path.join(data, 'sample_transcript.txt'),
+                                os.path.join(data, 'team_members.json'), str(tmp_path / "out.json"), src],
+                               capture_output=True, text=True, cwd=tmp_path)
+
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.strip().splitlines()[-1] == "[]"
+    assert not (tmp_path / ".transcript_cache").exists()
@@ -0,0 +1,31 @@
+import json
+
+from profiling import Profiler, count, hot, stage
+from task_extractor import TaskExtractor
+from utils import TeamMember
+
+
+def test_report_has_nested_stages_counts_and_hot_functions(tmp_path):
+    team = [TeamMember("Mohit", "Backend Engineer", ["API"])]
+
+    with Profiler(cprofile=True, trace_memory=True) as profiler:
+        with stage('extract'):
+            TaskExtractor().extract_tasks("Mohit, fix the API timeout. Lunch was great.", team)
+    report = json.loads(open(profiler.save(str(tmp_path / "profile.json"))).read())
+
+    assert {'extract', 'extract/sentence_split', 'extract/classify'} <= set(report['stages'])
+    assert report['counts'] == {'sentences': 2, 'tasks': 1}
+    assert report['hot_functions']['TaskExtractor._parse_task']['calls'] == 1
+    assert report['stages']['extract']['peak_traced_mb'] > 0
+    assert any('extract_tasks' in row['function'] for row in report['cprofile_top'])
+    assert 'extract' in report['allocations_after_stage']
+
+
+def test_instrumentation_is_a_no_op_without_a_profiler():
+    @hot('double')
+    def double(x):
+        return 2 * x
+
+    with stage('anything'):
+        count('things')
+        assert double(4) == 8
@@ -0,0 +1,52 @@
+import json
+import os
+
+from roster import RosterStore
+from task_assigner import TaskAssigner
+from task_extractor import TaskExtractor
+from utils import TeamMember, load_team_members
+
+TEAM_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'team_members.json')
+TASKS = ["Fix the React login bug", "Optimize the database queries", "Write payment tests",
+         "Design the onboarding screens in Figma"]
+
+
+def test_import_then_sync_touches_only_changes(tmp_path):
+    store = RosterStore(str(tmp_path / "roster.db"))
+    assert store.import_json(TEAM_FILE)['added'] == 4
+    assert [m.name for m in store.members()] == [m.name for m in load_team_members(TEAM_FILE)]
+
+    data = json.load(open(TEAM_FILE))
+    data['team_members'][0]['capacity'] = 5
+    data['team_members'].pop()
+    data['team_members'].append({'name': "Priya", 'role': "QA Engineer", 'skills': ["Testing"]})
+    export = tmp_path / "export.json"
+    export.write_text(json.dumps(data))
+
+    revision = store.revision
+    assert store.import_json(str(export)) == {'added': 1, 'updated': 1, 'removed': 1, 'members': 4}
+    assert store.revision > revision
+    assert store.import_json(str(export))['updated'] == 0  # Unchanged rows are not rewritten
+    assert store.members()[0].capacity == 5
+
+
+def test_saved_indexes_match_fresh_ones_and_follow_edits(tmp_path):
+    path = str(tmp_path / "roster.db")
+    store = RosterStore(path)
+    store.import_json(TEAM_FILE)
+    store.build_indexes()
+    store.close()
+
+    store = RosterStore(path)
+    team = store.members()
+    extractor = store.prime(TaskExtractor(), team)
+    assigner = store.assigner(team)
+    fresh = TaskAssigner(team)
+    assert assigner._best_matches(TASKS) == fresh._best_matches(TASKS)
+    assert extractor._scan("Mohit, fix the API by friday", team) == \
+        TaskExtractor()._scan("Mohit, fix the API by friday", team)
+
+    store.add(TeamMember("Priya", "QA Engineer", ["payment tests"]))
+    team = store.members()
+    assert store.assigner(team)._best_matches(TASKS)[2] == "Priya"
+    assert store.prime(TaskExtractor(), team)._extract_person("Priya, check it", team) == "Priya"
@@ -0,0 +1,49 @@
+from datetime import date
+
+import pytest
+
+from scheduler import CycleError, Scheduler, deadline_offset
+from utils import Task
+
+MONDAY = date(2026, 10, 19)
+
+
+def test_deadlines_become_day_offsets():
+    assert deadline_offset("Friday", MONDAY) == 4
+    assert deadline_offset("Next Monday", MONDAY) == 7
+    assert deadline_offset("2026-10-21", MONDAY) == 2
+    assert deadline_offset("someday", MONDAY) is None
+
+
+def test_schedule_orders_dependencies_and_pushes_deadlines_back():
+    tasks = [Task(1, "Deploy", dependencies=[3], deadline="Friday"), Task(2, "Docs"),
+             Task(3, "Test", dependencies=[4]), Task(4, "Fix login")]
+    scheduler = Scheduler(today=MONDAY)
+
+    schedule = scheduler.schedule(tasks)
+
+    assert sorted(schedule, key=lambda task_id: schedule[task_id]['order']) == [2, 4, 3, 1]
+    assert schedule[4]['latest_finish'] == "2026-10-21"  # Two days of work still to follow by Friday
+    assert schedule[4]['slack_days'] == 1
+    assert not schedule[2]['critical']
+    assert scheduler.critical_path(tasks, schedule) == [4, 3, 1]
+
+
+def test_meeting_without_dependencies_has_no_critical_path():
+    tasks = [Task(1, "Fix login", deadline="Friday"), Task(2, "Docs", deadline="Next Monday"), Task(3, "Review")]
+    scheduler = Scheduler(today=MONDAY)
+
+    schedule = scheduler.schedule(tasks)
+
+    assert scheduler.critical_path(tasks, schedule) == []
+    assert scheduler.critical_path([], {}) == []
+
+
+def test_cycle_is_reported_with_its_tasks():
+    tasks = [Task(1, "a", dependencies=[3]), Task(2, "b", dependencies=[1]), Task(3, "c", dependencies=[2]),
+             Task(4, "d")]
+
+    with pytest.raises(CycleError) as error:
+        Scheduler(today=MONDAY).schedule(tasks)
+
+    assert sorted(error.value.cycle) == [1, 2, 3]
@@ -0,0 +1,88 @@
+import asyncio
+import json
+import os
+import threading
+
+import service
+from service import MeetingService
+
+TEAM_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'team_members.json')
+
+
+async def request(port, method, path, body=b''):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+                 + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), head.decode(), json.loads(body)
+
+
+def run(coroutine_function, **options):
+    async def main():
+        meetings = MeetingService(TEAM_FILE, executor='thread', processor_options={'backend': 'stub'}, **options)
+        port = await meetings.start(port=0)
+        try:
+            return await coroutine_function(meetings, port)
+        finally:
+            await meetings.close()
+    return asyncio.run(main())
+
+
+def test_post_transcript_returns_tasks_and_health_counts_it():
+    async def scenario(meetings, port):
+        transcript = b"Mohit, fix the API timeout.\nLata, test the payment flow.\n"
+        status, _, document = await request(port, 'POST', '/meetings?name=standup.txt', transcript)
+        assert status == 200
+        assert [task['assigned_to'] for task in document['tasks']] == ['Mohit', 'Lata']
+        assert 'schedule' in document['tasks'][0]
+
+        status, _, health = await request(port, 'GET', '/health')
+        assert (status, health['processed'], health['running']) == (200, 1, 0)
+        assert (await request(port, 'GET', '/nowhere'))[0] == 404
+
+    run(scenario)
+
+
+def test_full_queue_answers_503(monkeypatch):
+    release = threading.Event()
+
+    def slow_upload(*args):
+        release.wait(10)
+        return {'task_count': 0}
+
+    monkeypatch.setattr(service, 'run_upload', slow_upload)
+
+    async def scenario(meetings, port):
+        first = asyncio.create_task(request(port, 'POST', '/meetings', b"Mohit, fix it."))
+        while meetings.running == 0:
+            await asyncio.sleep(0.01)
+        status, head, _ = await request(port, 'POST', '/meetings', b"Lata, test it.")
+        release.set()
+        assert status == 503 and "Retry-After: 1" in head
+        assert (await first)[0] == 200
+
+    run(scenario, workers=1, max_queue=0)
+
+
+def test_watched_folder_is_processed_and_filed(tmp_path):
+    inbox = tmp_path / "inbox"
+    inbox.mkdir()
+    (inbox / "standup.txt").write_text("Mohit, fix the API timeout.\n")
+    output_dir = tmp_path / "out"
+
+    async def scenario(meetings, port):
+        watcher = asyncio.create_task(meetings.watch(str(inbox), str(output_dir), interval=0.05))
+        for _ in range(200):
+            if (inbox / "done" / "standup.txt").exists():
+                break
+            await asyncio.sleep(0.05)
+        watcher.cancel()
+        assert meetings.stats['processed'] == 1
+
+    run(scenario)
+    document = json.loads((output_dir / "standup.json").read_text())
+    assert [task['assigned_to'] for task in document['tasks']] == ['Mohit']
+    assert not (inbox / "standup.txt").exists()
@@ -0,0 +1,95 @@
+import os
+
+from task_assigner import TaskAssigner
+from utils import load_team_members, Task, TaskBatch, TeamMember
+
+TEAM_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'team_members.json')
+
+DESCRIPTIONS = [
+    "Optimize database performance and API calls",
+    "Design new onboarding screens in Figma",
+    "Write unit tests for payment module",
+    "Fix the React UI bug on the frontend",
+    "Schedule the team offsite",
+]
+
+
+def test_score_matrix_matches_per_member_scores():
+    team = load_team_members(TEAM_FILE)
+    assigner = TaskAssigner(team)
+
+    scores = assigner.score_matrix(DESCRIPTIONS)
+
+    expected = [[assigner._calculate_match_score(d.lower(), member) for member in team] for d in DESCRIPTIONS]
+    assert scores.tolist() == expected
+
+
+def test_ties_go_to_first_member_and_zero_scores_stay_unassigned():
+    team = [TeamMember("Ana", "Backend Engineer", ["database"]),
+            TeamMember("Ben", "Backend Engineer", ["database"])]
+    tasks = [Task(1, "Tune the database"), Task(2, "Book a room"), Task(3, "Tune the database", "Ben")]
+
+    TaskAssigner(team).assign_tasks(tasks)
+
+    assert [task.assigned_to for task in tasks] == ["Ana", "Unassigned", "Ben"]
+
+
+def test_balanced_assignment_respects_capacity_and_priority():
+    team = [TeamMember("Ana", "Backend Engineer", ["database"], capacity=1),
+            TeamMember("Ben", "Backend Engineer", ["api"], capacity=2)]
+    tasks = [Task(1, "Tune the database", priority='Low'),
+             Task(2, "Migrate the database", priority='Critical'),
+             Task(3, "Database api cleanup", priority='Medium')]
+
+    TaskAssigner(team).assign_tasks(tasks, strategy='balanced')
+
+    # Ana has room for one: the critical task gets her, the rest spill over to Ben
+    assert [task.assigned_to for task in tasks] == ["Ben", "Ana", "Ben"]
+
+
+def test_balanced_assignment_is_min_cost():
+    from itertools import product
+    from assignment_solver import AssignmentSolver, task_weight, UNASSIGNED_PENALTY
+
+    team = [TeamMember("Ana", "Backend Engineer", ["database", "api"], capacity=2),
+            TeamMember("Ben", "QA Engineer", ["testing", "api"], capacity=2),
+            TeamMember("Cy", "Frontend Developer", ["react", "testing"])]
+    tasks = [Task(i + 1, d, priority=p) for i, (d, p) in enumerate([
+        ("database api", 'High'), ("api testing", 'Low'), ("react testing", 'Medium'),
+        ("database", 'Critical'), ("api", 'Medium')])]
+    assigner = TaskAssigner(team)
+    scores = assigner.score_matrix([task.description for task in tasks])
+
+    def cost(choice):
+        total, load = 0, [0, 0, 0]
+        for t, m in enumerate(choice):
+            weight = task_weight(tasks[t])
+            if m is None:
+                total += weight * UNASSIGNED_PENALTY
+            elif scores[t, m] <= 0:
+                return None
+            else:
+                total += weight * (100 - scores[t, m]) + 10 * load[m]
+                load[m] += 1
+        if load[0] > 2 or load[1] > 2:
+            return None
+        return total
+
+    best = min(c for c in map(cost, product([None, 0, 1, 2], repeat=len(tasks))) if c is not None)
+    names = [member.name for member in team]
+    solved = AssignmentSolver(assigner).solve(tasks)
+    choice = [names.index(solved[t]) if solved[t] in names else None for t in range(len(tasks))]
+
+    assert cost(choice) == best
+
+
+def test_columnar_batch_is_assigned_in_place():
+    team = [TeamMember("Ana", "Backend Engineer", ["database"]),
+            TeamMember("Ben", "QA Engineer", ["testing"])]
+    tasks = TaskBatch([Task(1, "Tune the database"), Task(2, "Add testing", dependencies=[1]),
+                       Task(3, "Book a room", "Ben")])
+
+    TaskAssigner(team).assign_tasks(tasks)
+
+    assert tasks.column('assigned_to') == ["Ana", "Ben", "Ben"]
+    assert tasks[1] == Task(2, "Add testing", "Ben", dependencies=[1])
@@ -0,0 +1,106 @@
+from task_extractor import TaskExtractor
+from utils import KeywordMatcher, TeamMember
+
+TEAM = [
+    TeamMember("Sakshi", "Frontend Developer", ["React"]),
+    TeamMember("Mohit", "Backend Engineer", ["Database"]),
+]
+
+
+def test_matcher_reports_overlapping_hits_with_positions():
+    matcher = KeywordMatcher({('action', 'test'): ['test', 'testing'], ('deadline', 'monday'): ['monday', 'next monday']})
+
+    hits = [(hit.start, hit.keyword) for hit in matcher.scan("next monday we start testing")]
+
+    assert hits == [(0, 'next monday'), (5, 'monday'), (21, 'test'), (21, 'testing')]
+
+
+def test_matcher_agrees_with_substring_checks():
+    keywords = ['ui', 'build', 'fix', 'prefix', 'release', 'lease', 'as', 'ask']
+    matcher = KeywordMatcher({('kw', keyword): [keyword] for keyword in keywords})
+    text = "please rebuild the prefix ui and ask about the release"
+
+    assert matcher.found(text)['kw'] == {keyword for keyword in keywords if keyword in text}
+
+
+def test_parse_task_uses_single_scan_results():
+    extractor = TaskExtractor()
+    sentence = "Mohit, this is urgent: fix the database by tomorrow, Sakshi can review."
+
+    task = extractor._parse_task(sentence, TEAM, 1)
+
+    assert task.priority == 'Critical'
+    assert task.assigned_to == 'Sakshi'  # Roster order wins, as before
+    assert task.deadline is not None
+
+
+def test_simple_splitter_is_used_without_punkt_data(monkeypatch):
+    import task_extractor
+
+    def missing_punkt():
+        raise LookupError("punkt")
+
+    monkeypatch.setattr(task_extractor, '_sentence_splitter', None)
+    monkeypatch.setattr('nltk.tokenize.sent_tokenize', lambda text: missing_punkt())
+
+    sentences = task_extractor.sent_tokenize("Sakshi, fix the login bug! Is it done? Thanks.")
+
+    assert sentences == ["Sakshi, fix the login bug!", "Is it done?", "Thanks."]
+
+
+def test_speaker_labels_resolve_you_and_claims():
+    team = TEAM + [TeamMember("Arjun", "UI/UX Designer", ["Figma"])]
+    transcript = ("Speaker 1: Hi, this is Arjun. Sakshi, are you around?\n"
+                  "Speaker 2: Yes, I'm here.\n"
+                  "Speaker 1: Can you fix the login bug by tomorrow?\n"
+                  "Speaker 3: We also need to optimize the database queries.\n"
+                  "Speaker 3: I'll take it. This is Mohit by the way.\n"
+                  "Speaker 1: I'll design the onboarding screens.\n")
+
+    tasks = TaskExtractor().extract_tasks(transcript, team)
+
+    assert [(task.description, task.assigned_to) for task in tasks] == [
+        ("Can you fix the login bug by tomorrow?", "Sakshi"),  # Addressed by name just before
+        ("We also need to optimize the database queries.", "Mohit"),  # Claimed; name learned afterwards
+        ("I'll design the onboarding screens.", "Arjun"),
+    ]
+
+
+def test_agenda_and_note_lines_do_not_make_a_speaker_transcript():
+    from task_extractor import speaker_lines
+
+    transcript = ("Agenda: sprint review\n"
+                  "Note: Arjun is out on Friday\n"
+                  "Sakshi, can you fix the login bug by tomorrow?\n"
+                  "Mohit, optimize the database queries.\n"
+                  "We also need to update the API docs.\n")
+    extractor = TaskExtractor()
+
+    assert speaker_lines(transcript) == []
+    plain = extractor.extract_tasks(transcript, TEAM)
+    blocks = extractor.extract_tasks_from_blocks([transcript], TEAM)
+    assert [task.to_dict() for task in blocks] == [task.to_dict() for task in plain]
+    assert plain[0].assigned_to == "Sakshi"
+
+
+def test_dependency_references_resolve_to_earlier_tasks():
+    transcript = ("Sakshi, fix the critical login bug. Mohit, optimize the database. "
+                  "One more thing, we need to write payment tests. "
+                  "This depends on the login bug fix being completed first. "
+                  "Mohit, update the API docs after the database work.")
+
+    tasks = TaskExtractor().extract_tasks(transcript, TEAM)
+
+    dependencies = {task.description.split('.')[0]: task.dependencies for task in tasks}
+    assert dependencies["One more thing, we need to write payment tests"] == (1,)  # "This ..." is the previous task
+    assert dependencies["Mohit, update the API docs after the database work"] == (2,)
+
+
+def test_scheduling_phrases_are_not_dependencies():
+    transcript = ("Sakshi, fix the projector for the client meeting. Lata, test the checkout flow every week. "
+                  "Mohit, update the docs after the meeting. Lata, check the load dashboards once a week. "
+                  "Arjun, design the new projector slides once the projector fix is done.")
+
+    tasks = TaskExtractor().extract_tasks(transcript, TEAM)
+
+    assert [task.dependencies for task in tasks] == [(), (), (), (), (1,)]
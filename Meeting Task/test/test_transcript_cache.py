@@ -0,0 +1,34 @@
+import os
+
+from transcript_cache import TranscriptCache, content_key
+
+
+def test_keys_depend_on_every_part():
+    assert content_key(b"pcm", "stub") == content_key(b"pcm", "stub")
+    assert content_key(b"pcm", "stub") != content_key(b"pcm", "google")
+    assert content_key("ab", "c") != content_key("a", "bc")
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = TranscriptCache(str(tmp_path), max_bytes=250)
+    for i, key in enumerate(["old", "used", "new"]):
+        cache.put(key, "x" * 100)
+        os.utime(tmp_path / f"{key}.json", (i, i))  # Deterministic ages
+    assert cache.get("old") is None  # Over the limit: the oldest went first
+
+    assert cache.get("used") is not None  # Touch: now the most recent
+    cache.put("newest", "x" * 100)
+
+    assert cache.get("new") is None
+    assert cache.get("used") is not None
+    assert cache.stats == {'hits': 2, 'misses': 2}
+
+
+def test_overwriting_an_entry_counts_its_size_once(tmp_path):
+    cache = TranscriptCache(str(tmp_path), max_bytes=1000)
+    for _ in range(5):
+        cache.put("same", "x" * 100)
+    cache.put("other", "x" * 100)
+
+    # Below max_bytes no eviction pass re-syncs the total, so it must stay exact on its own
+    assert cache._size == sum(size for _, size, _ in cache._entries()) == 204
@@ -0,0 +1,41 @@
+from pydub import AudioSegment
+from pydub.generators import Sine, WhiteNoise
+from pydub.silence import detect_nonsilent
+
+from vad import default_threshold, detect_speech, drop_silence
+
+
+def _recording():
+    """Speech at different loudness with quiet noise and silence of different lengths in between"""
+    parts = []
+    for index, (speech_ms, pause_ms) in enumerate([(1200, 700), (300, 150), (2500, 1800), (800, 40), (600, 0)]):
+        parts.append(Sine(220 * (index + 1)).to_audio_segment(duration=speech_ms).apply_gain(-3 * index))
+        parts.append(WhiteNoise().to_audio_segment(duration=pause_ms).apply_gain(-55))
+    return sum(parts[1:], parts[0])
+
+
+def test_speech_runs_match_pydub():
+    audio = _recording()
+    for channels, min_silence_len in [(1, 500), (1, 100), (2, 1000)]:
+        audio = audio.set_channels(channels)
+        threshold = default_threshold(audio)
+        assert detect_speech(audio, min_silence_len, threshold) == \
+            detect_nonsilent(audio, min_silence_len=min_silence_len, silence_thresh=threshold)
+
+    assert detect_speech(AudioSegment.silent(duration=2000)) == []
+
+
+def test_dropped_silence_maps_back_to_the_recording():
+    speech = Sine(440).to_audio_segment(duration=1000).apply_gain(-6)
+    silence = AudioSegment.silent(duration=3000, frame_rate=speech.frame_rate)
+    audio = silence + speech + silence + speech
+
+    kept, timeline = drop_silence(audio)
+
+    (first_start, first_end), (second_start, second_end) = timeline.ranges
+    assert abs(first_start - 2800) <= 5 and abs(second_start - 6800) <= 5 and second_end == 8000
+    assert len(kept) == timeline.kept_ms == (first_end - first_start) + (second_end - second_start)
+    assert timeline.skipped_ms == 8000 - timeline.kept_ms
+    assert timeline.to_original(0) == first_start
+    assert timeline.to_original(first_end - first_start + 100) == second_start + 100
+    assert kept[:first_end - first_start].raw_data == audio[first_start:first_end].raw_data